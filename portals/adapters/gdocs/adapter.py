@@ -12,12 +12,32 @@ from google.auth.transport.requests import Request
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.model import JsonModel
 
 from portals.adapters.base import DocumentAdapter, PlatformURI, RemoteMetadata
 from portals.adapters.gdocs.converter import GoogleDocsConverter
 from portals.core.exceptions import AdapterError
 from portals.core.models import Document, DocumentMetadata
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+
+class _OrjsonModel(JsonModel):  # type: ignore[misc]  # googleapiclient is untyped
+    """JsonModel that encodes request bodies with orjson.
+
+    batchUpdate bodies for long documents hold tens of thousands of small
+    request dicts; orjson encodes them several times faster than json.dumps.
+    The body is returned as UTF-8 bytes so its length is the Content-Length.
+    """
+
+    def serialize(self, body_value: Any) -> bytes:
+        if isinstance(body_value, dict) and "data" not in body_value and self._data_wrapper:
+            body_value = {"data": body_value}
+        return orjson.dumps(body_value)
+
 
 SCOPES = [
     'https://www.googleapis.com/auth/documents',
@@ -79,7 +99,9 @@ class GoogleDocsAdapter(DocumentAdapter):
         """Lazy-load Google Docs service."""
         if self._service is None:
             creds = self._get_credentials()
-            self._service = build('docs', 'v1', credentials=creds)
+            # Docs requests carry no media uploads, so bodies can be bytes
+            model = _OrjsonModel() if orjson is not None else None
+            self._service = build('docs', 'v1', credentials=creds, model=model)
         return self._service
 
     @property
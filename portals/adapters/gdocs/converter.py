@@ -2,14 +2,23 @@
 
 from __future__ import annotations
 
+import os
 import re
-from dataclasses import dataclass, field
+import threading
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from typing import Any
+from typing import Any, ClassVar
 
 from markdown_it import MarkdownIt
 from markdown_it.token import Token
 
+from portals.adapters.gdocs.md4c_parser import Md4cParser
+
 
 def _utf16_len(s: str) -> int:
     """Count UTF-16 code units in a Python string.
@@ -17,7 +26,7 @@ def _utf16_len(s: str) -> int:
     Google Docs API uses UTF-16 indices. Supplementary plane characters
     (emojis like 📊, U+1F4CA) are 1 Python char but 2 UTF-16 code units.
     """
-    return sum(2 if ord(c) > 0xFFFF else 1 for c in s)
+    return len(s.encode('utf-16-le')) // 2
 
 
 def _build_utf16_offsets(text: str) -> list[int]:
@@ -29,18 +38,120 @@ def _build_utf16_offsets(text: str) -> list[int]:
     """
     n = len(text)
     offsets = [0] * (n + 2)
-    for i in range(n):
-        offsets[i + 1] = offsets[i] + (1 if ord(text[i]) > 0xFFFF else 0)
-    offsets[n + 1] = offsets[n]
+    # Supplementary chars are rare: fill the runs between them with slice
+    # assignment instead of visiting every character in Python
+    count = 0
+    filled = 0  # offsets[:filled] are final
+    for match in _SUPPLEMENTARY_RE.finditer(text):
+        end = match.start() + 1  # offsets from here on include this char
+        if count:
+            offsets[filled:end] = [count] * (end - filled)
+        count += 1
+        filled = end
+    if count:
+        offsets[filled:] = [count] * (n + 2 - filled)
     return offsets
 
 
+def _build_tab_positions(text: str) -> array[int]:
+    """Collect the sorted positions of every tab character in text.
+
+    Tabs mark list nesting and are removed by createParagraphBullets, so
+    request indices must subtract the tabs that precede them. With the
+    positions sorted, "tabs before i" is bisect_left(positions, i) instead of
+    re-counting the whole prefix for every range.
+    """
+    positions: array[int] = array('i')
+    pos = text.find('\t')
+    while pos >= 0:
+        positions.append(pos)
+        pos = text.find('\t', pos + 1)
+    return positions
+
+
+def _consume_span_text(children: Iterator[Token]) -> str:
+    """Consume inline tokens up to the close matching an already-consumed open.
+
+    Nested spans are consumed too; only their text tokens contribute. An
+    unclosed open consumes the rest of the run.
+
+    Args:
+        children: Iterator positioned just after a span's open token
+
+    Returns:
+        Text of the span's text tokens
+    """
+    parts: list[str] = []
+    depth = 1
+    for child in children:
+        nesting = child.nesting
+        if nesting == 1:
+            depth += 1
+        elif nesting == -1:
+            depth -= 1
+            if not depth:
+                break
+        elif child.type == "text":
+            parts.append(child.content)
+    return "".join(parts)
+
+
+def _link_href(token: Token) -> str:
+    """Get a link_open token's href (markdown-it-py >= 2 stores attrs as a dict)."""
+    href = token.attrs.get("href", "")
+    return href if isinstance(href, str) else str(href)
+
+
+def _coalesce_format_ranges(format_ranges: list[FormatRange]) -> list[FormatRange]:
+    """Merge each format range into an earlier one of the same type it continues.
+
+    A range that starts exactly where the last range with the same type (and
+    link URL) ended extends that range instead of producing its own requests.
+    Headings and subtitles carry per-range payloads and are never merged.
+
+    Args:
+        format_ranges: Ranges in conversion order (not modified)
+
+    Returns:
+        Ranges in order of first occurrence; merged ranges are copies
+    """
+    merged: list[FormatRange] = []
+    # (format type, url) -> position in merged of the latest range of that kind
+    last: dict[tuple[str, str | None], int] = {}
+    for fmt in format_ranges:
+        if fmt.format_type in _UNMERGED_FORMAT_TYPES:
+            merged.append(fmt)
+            continue
+        key = (fmt.format_type, fmt.url)
+        pos = last.get(key)
+        if pos is not None and merged[pos].end_index == fmt.start_index:
+            run = merged[pos]
+            merged[pos] = replace(
+                run,
+                end_index=fmt.end_index,
+                text=run.text + fmt.text if run.text is not None and fmt.text is not None else None,
+            )
+            continue
+        last[key] = len(merged)
+        merged.append(fmt)
+    return merged
+
+
+def _has_empty_range(request: dict[str, Any]) -> bool:
+    """Check if a style request covers an empty range (startIndex >= endIndex)."""
+    for key in ("updateTextStyle", "updateParagraphStyle"):
+        rng = request.get(key, {}).get("range")
+        if rng and rng.get("startIndex", 0) >= rng.get("endIndex", 0):
+            return True
+    return False
+
+
 def _utf16_pos(text: str, char_pos: int) -> int:
     """Convert a Python char position within text to UTF-16 offset."""
     return char_pos + sum(1 for c in text[:char_pos] if ord(c) > 0xFFFF)
 
 
-@dataclass
+@dataclass(slots=True)
 class FormatRange:
     """A range of text with formatting information."""
 
@@ -54,6 +165,15 @@ class FormatRange:
     followed_by_box: bool = False  # Heading immediately followed by info box
 
 
+@dataclass(slots=True)
+class ListGroup:
+    """Consecutive list items covered by one createParagraphBullets request."""
+
+    ordered: bool
+    start_index: int
+    end_index: int
+
+
 class SectionType(Enum):
     """Classification of document sections by structural role."""
 
@@ -91,9 +211,14 @@ class DocumentModel:
     sections: list[SectionInfo] = field(default_factory=list)
     footnote_indices: set[int] = field(default_factory=set)
     _section_map: list[SectionInfo | None] = field(default_factory=list, repr=False)
+    # heading_token_index -> position in sections
+    _section_positions: dict[int, int] = field(default_factory=dict, repr=False)
 
     def build_lookup(self, num_tokens: int) -> None:
-        """Build O(1) token-to-section map."""
+        """Build O(1) token-to-section and section-to-position maps."""
+        self._section_positions = {
+            s.heading_token_index: pos for pos, s in enumerate(self.sections)
+        }
         self._section_map = [None] * num_tokens
         section_starts = {s.heading_token_index: s for s in self.sections}
         current_section = None
@@ -108,6 +233,14 @@ class DocumentModel:
             return self._section_map[index]
         return None
 
+    def section_position(self, section: SectionInfo) -> int:
+        """Look up a section's position in sections.
+
+        Replaces sections.index(), which compares SectionInfo dataclasses
+        field by field and made per-heading lookups quadratic.
+        """
+        return self._section_positions[section.heading_token_index]
+
     def is_footnote(self, index: int) -> bool:
         """Check if a paragraph_open token index is a footnote."""
         return index in self.footnote_indices
@@ -229,8 +362,57 @@ _METADATA_TITLES = (
     "note on sequencing",
 )
 
+# YAML frontmatter at the very start of a document. Delimiter lines allow
+# trailing spaces/tabs (and \r for CRLF files) but never span lines.
+_FRONTMATTER_RE = re.compile(r'\A---[ \t\r]*\n.*?\n---[ \t\r]*\n', re.DOTALL)
+
+# Characters outside the BMP (2 UTF-16 code units each)
+_SUPPLEMENTARY_RE = re.compile('[\U00010000-\U0010FFFF]')
+
+# ATX heading at column 0: a block boundary when preceded by a blank line
+_ATX_HEADING_RE = re.compile(r'#{1,6}(?:[ \t]|$)')
+# Code fence opener/closer: captures the fence run ("```", "~~~~", ...)
+_FENCE_RE = re.compile(r' {0,3}(`{3,}|~{3,})')
+# Constructs whose meaning crosses blank lines or blocks: reference link
+# definitions (resolved document-wide, and legal inside quotes and list items,
+# so any "]:" counts) and HTML blocks that only end at a closing marker
+# (CommonMark types 1-5). Sources containing them are parsed as one block.
+_NON_LOCAL_RE = re.compile(
+    r'\]:|^ {0,3}<(?:!--|\?|![A-Za-z]|!\[CDATA\[|pre|script|style|textarea)',
+    re.MULTILINE | re.IGNORECASE,
+)
 
-@dataclass
+# Number of recent conversions kept per converter for repeated inputs
+_RESULT_CACHE_SIZE = 128
+
+# One request emitted for a FormatRange: (request kind, style key, payload, fields)
+_RequestTemplate = tuple[str, str, dict[str, Any], str]
+
+# Format types whose requests are built per range, so contiguous ranges stay separate
+_UNMERGED_FORMAT_TYPES = frozenset({"heading", "subtitle"})
+
+# Markdown heading level -> Google Docs named style: H1 -> Title, H2 -> Heading 1,
+# H3 -> Heading 2, etc. This allows H1 to use the document Title style
+_HEADING_STYLE_TYPES = ("TITLE", "HEADING_1", "HEADING_2", "HEADING_3", "HEADING_4", "HEADING_5")
+
+# Inline span open token -> FormatRange type
+_INLINE_SPANS = {
+    "strong_open": "bold",
+    "em_open": "italic",
+    "link_open": "link",
+}
+
+# Table cell open token -> matching close token
+_TABLE_CELL_OPEN = {
+    "td_open": "td_close",
+    "th_open": "th_close",
+}
+
+# GFM task-list checkbox at the start of a list item: "[ ] ", "[x] ", "[X] "
+_CHECKBOX_RE = re.compile(r'^\s*\[\s*[xX ]?\s*\]\s*')
+
+
+@dataclass(slots=True)
 class TableCell:
     """A cell in a table."""
 
@@ -239,7 +421,7 @@ class TableCell:
     format_ranges: list[FormatRange] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class TableData:
     """Data for a table to be inserted."""
 
@@ -254,17 +436,118 @@ class TableData:
     def __post_init__(self):
         if self.rows:
             self.num_rows = len(self.rows)
-            self.num_cols = max(len(row) for row in self.rows) if self.rows else 0
+            # GFM rows all have the header's width; max() still guards ragged rows
+            self.num_cols = max(map(len, self.rows))
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversionResult:
     """Result of markdown to Google Docs conversion."""
 
     plain_text: str  # Text without markdown symbols
     format_ranges: list[FormatRange] = field(default_factory=list)
     list_ranges: list[dict[str, Any]] = field(default_factory=list)
+    # Consecutive list items merged into one createParagraphBullets range each
+    list_groups: list[ListGroup] = field(default_factory=list)
     tables: list[TableData] = field(default_factory=list)
+    _chunks: list[str] = field(default_factory=list, repr=False)  # plain_text pieces while converting
+    _tab_positions: array[int] | None = field(default=None, repr=False)
+    # Structural model from the pre-scan, read when generating requests
+    _document_model: DocumentModel | None = field(default=None, repr=False)
+
+
+def _strip_frontmatter(markdown: str) -> str:
+    """Strip a YAML frontmatter block (--- delimited) from the start of markdown."""
+    return _FRONTMATTER_RE.sub('', markdown, count=1)
+
+
+def _split_stable_blocks(markdown: str) -> list[str]:
+    """Split markdown into blocks that markdown-it parses independently.
+
+    A boundary is an ATX heading at column 0 that follows a blank line and is
+    outside a code fence: nothing before it can continue past that point.
+    The blocks concatenate back to the original text.
+    """
+    if _NON_LOCAL_RE.search(markdown):
+        return [markdown]
+
+    blocks: list[str] = []
+    block_start = 0
+    pos = 0
+    fence: str | None = None
+    prev_blank = True
+    # Split on "\n" only: str.splitlines() also breaks on characters that
+    # markdown-it treats as ordinary text (e.g. U+2028)
+    for line in markdown.split("\n"):
+        line += "\n"
+        fence_match = _FENCE_RE.match(line)
+        if fence is not None:
+            # Inside a fence: only a bare run of the same char, at least as long, closes it
+            closer = line.strip()
+            if (
+                fence_match
+                and closer == fence[0] * len(closer)
+                and len(closer) >= len(fence)
+            ):
+                fence = None
+        elif fence_match:
+            fence = fence_match.group(1)
+        elif prev_blank and pos > block_start and _ATX_HEADING_RE.match(line):
+            blocks.append(markdown[block_start:pos])
+            block_start = pos
+        prev_blank = not line.strip(" \t\r\n")
+        pos += len(line)
+    blocks.append(markdown[block_start:])
+    return blocks
+
+
+def _copy_table(table: TableData) -> TableData:
+    """Copy a TableData down to its cells' format ranges (strings are shared)."""
+    return replace(table, rows=[
+        [replace(cell, format_ranges=[replace(fmt) for fmt in cell.format_ranges]) for cell in row]
+        for row in table.rows
+    ])
+
+
+def _copy_result(result: ConversionResult) -> ConversionResult:
+    """Copy a ConversionResult so callers can't mutate a cached instance."""
+    return ConversionResult(
+        plain_text=result.plain_text,
+        format_ranges=[replace(fmt) for fmt in result.format_ranges],
+        list_ranges=[dict(item) for item in result.list_ranges],
+        list_groups=[replace(group) for group in result.list_groups],
+        tables=[_copy_table(table) for table in result.tables],
+        _tab_positions=result._tab_positions,
+        _document_model=result._document_model,
+    )
+
+
+_MARKDOWN_IT: MarkdownIt | None = None
+_MARKDOWN_IT_LOCK = threading.Lock()
+
+
+def _get_markdown_it() -> MarkdownIt:
+    """Return the shared MarkdownIt instance, building it on first use.
+
+    Building the rule chains is the expensive part of MarkdownIt(); parse()
+    on a built instance keeps no per-call state, so one is shared by every
+    converter.
+    """
+    global _MARKDOWN_IT
+    if _MARKDOWN_IT is None:
+        with _MARKDOWN_IT_LOCK:
+            if _MARKDOWN_IT is None:
+                _MARKDOWN_IT = MarkdownIt().enable('table')  # GFM-style tables
+    return _MARKDOWN_IT
+
+
+# Signature of GoogleDocsConverter._BLOCK_HANDLERS entries
+_BlockHandler = Callable[["GoogleDocsConverter", list[Token], int, ConversionResult], int]
+
+
+def _convert_in_worker(markdown: str, style_map: StyleMap, parser: str) -> ConversionResult:
+    """Convert one document in a worker process (module-level so it pickles)."""
+    return GoogleDocsConverter(style_map, parser=parser).markdown_to_gdocs(markdown)
 
 
 class GoogleDocsConverter:
@@ -273,18 +556,33 @@ class GoogleDocsConverter:
     Uses markdown-it-py for parsing and generates Google Docs API batch requests.
     """
 
-    def __init__(self, style_map: StyleMap | None = None):
+    def __init__(self, style_map: StyleMap | None = None, parser: str = "markdown-it"):
         """Initialize converter.
 
         Args:
             style_map: Optional visual treatment parameters. Uses defaults if None.
+            parser: Parse backend, "markdown-it" or "md4c" (requires pymd4c)
+
+        Raises:
+            ValueError: If parser is not a known backend
+            ImportError: If parser is "md4c" and pymd4c is not installed
         """
-        self.md = MarkdownIt()
-        self.md.enable('table')  # Enable GFM-style table parsing
+        self.parser = parser
+        self.md: MarkdownIt | Md4cParser
+        if parser == "markdown-it":
+            self.md = _get_markdown_it()
+        elif parser == "md4c":
+            self.md = Md4cParser()
+        else:
+            raise ValueError(f"Unknown parser: {parser}")
         self.current_index = 1  # Google Docs starts at index 1
         self._last_heading_level = 0  # Track heading levels for subtitle detection
         self.style_map = style_map or StyleMap()
         self._document_model: DocumentModel | None = None
+        # Token types of the stream being converted, for C-level list.index/count scans
+        self._token_types: list[str] = []
+        # markdown -> result for recent conversions, oldest first
+        self._result_cache: OrderedDict[str, ConversionResult] = OrderedDict()
 
     def markdown_to_gdocs(self, markdown: str) -> ConversionResult:
         """Convert markdown to Google Docs format.
@@ -295,11 +593,82 @@ class GoogleDocsConverter:
         Returns:
             ConversionResult with plain text and formatting information
         """
-        # Strip YAML frontmatter (--- delimited block at start of file)
-        markdown = re.sub(r'^---\s*\n.*?\n---\s*\n', '', markdown, count=1, flags=re.DOTALL)
+        # Re-saves and bulk syncs often convert the same text again; reuse the
+        # earlier result on a hit
+        cached = self._result_cache.get(markdown)
+        if cached is not None:
+            self._result_cache.move_to_end(markdown)
+            self._document_model = cached._document_model
+            return _copy_result(cached)
+
+        tokens = self.md.parse(_strip_frontmatter(markdown))
+        result = self._convert_tokens(tokens)
+        self._cache_result(markdown, result)
+        return result
+
+    def convert_batch(
+        self,
+        markdowns: list[str],
+        max_workers: int | None = None,
+    ) -> list[ConversionResult]:
+        """Convert many independent documents in parallel worker processes.
+
+        Conversion is pure Python, so threads don't help; each document is
+        converted in its own process instead. Documents already in this
+        converter's cache (and duplicates within the batch) are not sent
+        to a worker. Results carry their own document model, so
+        generate_batch_requests works on any of them.
 
-        # Parse markdown
-        tokens = self.md.parse(markdown)
+        Args:
+            markdowns: Markdown texts
+            max_workers: Worker process count (defaults to the CPU count)
+
+        Returns:
+            ConversionResults in the same order as markdowns
+        """
+        results: list[ConversionResult | None] = [None] * len(markdowns)
+        pending: dict[str, list[int]] = {}
+        for position, markdown in enumerate(markdowns):
+            if markdown in self._result_cache:
+                results[position] = self.markdown_to_gdocs(markdown)
+            else:
+                pending.setdefault(markdown, []).append(position)
+
+        if pending:
+            unique = list(pending)
+            workers = min(max_workers or os.cpu_count() or 1, len(unique))
+            chunksize = max(1, len(unique) // (4 * workers))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                converted = list(executor.map(
+                    _convert_in_worker,
+                    unique,
+                    [self.style_map] * len(unique),
+                    [self.parser] * len(unique),
+                    chunksize=chunksize,
+                ))
+            for markdown, result in zip(unique, converted, strict=True):
+                self._cache_result(markdown, result)
+                for position in pending[markdown]:
+                    results[position] = _copy_result(result)
+
+        return [result for result in results if result is not None]
+
+    def _cache_result(self, markdown: str, result: ConversionResult) -> None:
+        """Keep a private copy of a conversion, evicting the oldest past the limit."""
+        self._result_cache[markdown] = _copy_result(result)
+        if len(self._result_cache) > _RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+
+    def _convert_tokens(self, tokens: list[Token]) -> ConversionResult:
+        """Convert an already-parsed token stream.
+
+        Args:
+            tokens: markdown-it tokens for the whole document
+
+        Returns:
+            ConversionResult with plain text and formatting information
+        """
+        self._token_types = [token.type for token in tokens]
 
         # Pre-scan: build structural model for judgment-based formatting
         self._document_model = self._pre_scan(tokens)
@@ -311,6 +680,15 @@ class GoogleDocsConverter:
 
         self._process_tokens(tokens, result)
 
+        # Join the accumulated pieces once (repeated += on a growing str is quadratic)
+        result.plain_text = "".join(result._chunks)
+        result._chunks.clear()
+
+        # Index tab positions once so request generation can count
+        # "tabs before index" with a bisect instead of prefix scans
+        result._tab_positions = _build_tab_positions(result.plain_text)
+        result._document_model = self._document_model
+
         return result
 
     def _process_tokens(
@@ -326,60 +704,80 @@ class GoogleDocsConverter:
             result: ConversionResult to populate
             parent_type: Parent token type for context
         """
+        n_tokens = len(tokens)
+        handlers = self._BLOCK_HANDLERS
+        # Dispatch on the precomputed type list instead of reading tokens[i].type
+        types = self._token_types
         i = 0
-        while i < len(tokens):
-            token = tokens[i]
+        while i < n_tokens:
+            handler = handlers.get(types[i])
+            i = handler(self, tokens, i, result) if handler else i + 1
 
-            if token.type == "heading_open":
-                heading_token_index = i
-                heading_level = int(token.tag[1])
-                i = self._process_heading(tokens, i, result)
-                # After an h3, check for phase metadata info box
-                if heading_level == 3 and self._is_metadata_heading(tokens, i):
-                    # Mark the heading as followed by a box (zero spaceBelow)
-                    for fmt in reversed(result.format_ranges):
-                        if fmt.format_type == "heading" and fmt.level == 3:
-                            fmt.followed_by_box = True
-                            break
-                    i = self._process_phase_metadata_block(tokens, i, result)
-                # After an h2 legend or guidance section, box all sub-content
-                if heading_level == 2 and self._document_model:
-                    section = self._document_model.section_for_token(heading_token_index)
-                    if section and section.section_type == SectionType.LEGEND:
-                        # Mark heading as followed by box for tight spacing
-                        for fmt in reversed(result.format_ranges):
-                            if fmt.format_type == "heading" and fmt.level == 2:
-                                fmt.followed_by_box = True
-                                break
-                        i = self._process_section_box(tokens, i, result, section, "legend")
-                    elif section and section.section_type == SectionType.GUIDANCE:
-                        for fmt in reversed(result.format_ranges):
-                            if fmt.format_type == "heading" and fmt.level == 2:
-                                fmt.followed_by_box = True
-                                break
-                        i = self._process_section_box(tokens, i, result, section, "guidance")
-                continue
-            elif token.type == "paragraph_open":
-                self._last_heading_level = 0  # Reset subtitle detection
-                i = self._process_paragraph(tokens, i, result)
-            elif token.type == "bullet_list_open":
-                i = self._process_list(tokens, i, result, ordered=False)
-            elif token.type == "ordered_list_open":
-                i = self._process_list(tokens, i, result, ordered=True)
-            elif token.type == "blockquote_open":
-                i = self._process_blockquote(tokens, i, result)
-            elif token.type == "code_block":
-                i = self._process_code_block(token, i, result)
-            elif token.type == "fence":
-                i = self._process_code_block(token, i, result)
-            elif token.type == "hr":
-                i = self._process_hr(token, i, result)
-            elif token.type == "table_open":
-                i = self._process_table(tokens, i, result)
-            else:
-                i += 1
+    def _process_top_level_paragraph(
+        self,
+        tokens: list[Token],
+        index: int,
+        result: ConversionResult,
+    ) -> int:
+        """Process a document-level paragraph, ending any heading run.
 
-        return
+        Args:
+            tokens: Token list
+            index: Current index (at paragraph_open)
+            result: Result to update
+
+        Returns:
+            New index after processing
+        """
+        self._last_heading_level = 0  # Reset subtitle detection
+        return self._process_paragraph(tokens, index, result)
+
+    def _process_heading_section(
+        self,
+        tokens: list[Token],
+        index: int,
+        result: ConversionResult,
+    ) -> int:
+        """Process a heading plus any info box that belongs to it.
+
+        Phase h3 headings may be followed by metadata h4s that are collected
+        into an info box; legend and guidance h2 sections are boxed whole.
+
+        Args:
+            tokens: Token list
+            index: Current index (at heading_open)
+            result: Result to update
+
+        Returns:
+            New index after processing
+        """
+        heading_level = int(tokens[index].tag[1])
+        i = self._process_heading(tokens, index, result)
+        # After an h3, check for phase metadata info box
+        if heading_level == 3 and self._is_metadata_heading(tokens, i):
+            # Mark the heading as followed by a box (zero spaceBelow)
+            for fmt in reversed(result.format_ranges):
+                if fmt.format_type == "heading" and fmt.level == 3:
+                    fmt.followed_by_box = True
+                    break
+            i = self._process_phase_metadata_block(tokens, i, result)
+        # After an h2 legend or guidance section, box all sub-content
+        if heading_level == 2 and self._document_model:
+            section = self._document_model.section_for_token(index)
+            if section and section.section_type == SectionType.LEGEND:
+                # Mark heading as followed by box for tight spacing
+                for fmt in reversed(result.format_ranges):
+                    if fmt.format_type == "heading" and fmt.level == 2:
+                        fmt.followed_by_box = True
+                        break
+                i = self._process_section_box(tokens, i, result, section, "legend")
+            elif section and section.section_type == SectionType.GUIDANCE:
+                for fmt in reversed(result.format_ranges):
+                    if fmt.format_type == "heading" and fmt.level == 2:
+                        fmt.followed_by_box = True
+                        break
+                i = self._process_section_box(tokens, i, result, section, "guidance")
+        return i
 
     def _process_heading(
         self,
@@ -412,26 +810,30 @@ class GoogleDocsConverter:
                     break
 
         start_index = self.current_index
-        text = emoji_prefix
+        parts = [emoji_prefix]
         if emoji_prefix:
             self.current_index += len(emoji_prefix)
 
-        # Process inline content
-        i = index + 1
-        while i < len(tokens) and tokens[i].type != "heading_close":
-            if tokens[i].type == "inline":
-                text_content = self._process_inline(tokens[i], result)
-                text += text_content
-                self.current_index += len(text_content)
-            i += 1
+        # Process inline content ([open, inline, close] is the usual shape)
+        if self._is_inline_triple(index, "heading_close"):
+            i = index + 2
+            inline_tokens = [tokens[index + 1]]
+        else:
+            i = self._close_index("heading_close", index + 1)
+            inline_tokens = [t for t in tokens[index + 1:i] if t.type == "inline"]
+        for token in inline_tokens:
+            text_content, text_length = self._process_inline(token, result)
+            parts.append(text_content)
+            self.current_index += text_length
 
         end_index = self.current_index
 
         # Add newline after heading
-        text += "\n"
-        self.current_index += 1
+        parts.append("\n")
+        self.current_index = end_index + 1
 
-        result.plain_text += text
+        text = "".join(parts)
+        result._chunks.append(text)
 
         # Detect subtitle: pre-scan model (handles blank lines) or strict check
         is_subtitle = False
@@ -491,26 +893,28 @@ class GoogleDocsConverter:
             New index after processing
         """
         start_index = self.current_index
-        text = ""
         is_footnote = bool(
             self._document_model and self._document_model.is_footnote(index)
         )
 
-        # Process inline content
-        i = index + 1
-        while i < len(tokens) and tokens[i].type != "paragraph_close":
-            if tokens[i].type == "inline":
-                text_content = self._process_inline(tokens[i], result)
-                text += text_content
-                self.current_index += len(text_content)
-            i += 1
+        # Process inline content ([open, inline, close] is the usual shape)
+        if self._is_inline_triple(index, "paragraph_close"):
+            i = index + 2
+            text_content, text_length = self._process_inline(tokens[index + 1], result)
+            result._chunks.append(text_content)
+            self.current_index += text_length
+        else:
+            i = self._close_index("paragraph_close", index + 1)
+            for token in tokens[index + 1:i]:
+                if token.type == "inline":
+                    text_content, text_length = self._process_inline(token, result)
+                    result._chunks.append(text_content)
+                    self.current_index += text_length
 
         # Add newline after paragraph
-        text += "\n"
-        self.current_index += 1
-        end_index = self.current_index
-
-        result.plain_text += text
+        result._chunks.append("\n")
+        end_index = self.current_index + 1
+        self.current_index = end_index
 
         # Determine paragraph format type
         if is_footnote:
@@ -531,7 +935,44 @@ class GoogleDocsConverter:
 
         return i + 1  # Skip closing token
 
-    def _process_inline(self, token: Token, result: ConversionResult) -> str:
+    def _is_inline_triple(self, index: int, close_type: str) -> bool:
+        """Check whether the block opened at index is [open, inline, close_type]."""
+        types = self._token_types
+        return (
+            index + 2 < len(types)
+            and types[index + 1] == "inline"
+            and types[index + 2] == close_type
+        )
+
+    def _close_index(self, close_type: str, start: int) -> int:
+        """Find the first close_type token at or after start.
+
+        Uses list.index over the token types, which scans in C.
+
+        Args:
+            close_type: Token type to find (e.g. "paragraph_close")
+            start: Index to start searching from
+
+        Returns:
+            Index of the token, or the token count if there is none
+        """
+        try:
+            return self._token_types.index(close_type, start)
+        except ValueError:
+            return len(self._token_types)
+
+    def _type_indices(self, token_type: str, start: int, end: int) -> Iterator[int]:
+        """Yield the indices of every token_type token in [start, end)."""
+        types = self._token_types
+        try:
+            idx = types.index(token_type, start, end)
+            while True:
+                yield idx
+                idx = types.index(token_type, idx + 1, end)
+        except ValueError:
+            return
+
+    def _process_inline(self, token: Token, result: ConversionResult) -> tuple[str, int]:
         """Process inline tokens (bold, italic, links, etc.).
 
         Args:
@@ -539,120 +980,68 @@ class GoogleDocsConverter:
             result: Result to update
 
         Returns:
-            Plain text content
+            Tuple of (plain text content, its length)
         """
         if not token.children:
-            return ""
-
-        text = ""
-        i = 0
-        while i < len(token.children):
-            child = token.children[i]
-
-            if child.type == "text":
-                text += child.content
-                i += 1
-            elif child.type == "strong_open":
-                # Track start of bold
-                start_index = self.current_index + len(text)
-                bold_text, skip_count = self._get_text_and_skip_count(token.children, i, "strong_close")
-                result.format_ranges.append(
-                    FormatRange(
-                        start_index=start_index,
-                        end_index=start_index + len(bold_text),
-                        format_type="bold",
-                        text=bold_text,
-                    )
-                )
-                text += bold_text
-                i += skip_count
-            elif child.type == "em_open":
-                # Track start of italic
-                start_index = self.current_index + len(text)
-                italic_text, skip_count = self._get_text_and_skip_count(token.children, i, "em_close")
-                result.format_ranges.append(
+            return "", 0
+
+        # Locals: this loop runs for every inline child in the document.
+        # Span handlers consume their children from the same iterator
+        children = iter(token.children)
+        # Absolute document index of the next character. Callers advance
+        # self.current_index themselves (list items drop checkbox markers first)
+        cursor = self.current_index
+        format_ranges = result.format_ranges
+        parts: list[str] = []
+        append = parts.append
+        for child in children:
+            child_type = child.type
+
+            if child_type == "text":
+                append(child.content)
+                cursor += len(child.content)
+            elif child_type in _INLINE_SPANS:
+                # Bold, italic or link: collect text up to the matching close token
+                format_type = _INLINE_SPANS[child_type]
+                start_index = cursor
+                link_url = _link_href(child) if format_type == "link" else None
+                span_text = _consume_span_text(children)
+                cursor += len(span_text)
+                format_ranges.append(
                     FormatRange(
                         start_index=start_index,
-                        end_index=start_index + len(italic_text),
-                        format_type="italic",
-                        text=italic_text,
+                        end_index=cursor,
+                        format_type=format_type,
+                        url=link_url,
+                        text=span_text,
                     )
                 )
-                text += italic_text
-                i += skip_count
-            elif child.type == "code_inline":
+                append(span_text)
+            elif child_type == "code_inline":
                 # Inline code
-                start_index = self.current_index + len(text)
+                start_index = cursor
                 code_text = child.content
-                result.format_ranges.append(
+                cursor += len(code_text)
+                format_ranges.append(
                     FormatRange(
                         start_index=start_index,
-                        end_index=start_index + len(code_text),
+                        end_index=cursor,
                         format_type="code_inline",
                         text=code_text,
                     )
                 )
-                text += code_text
-                i += 1
-            elif child.type == "softbreak":
+                append(code_text)
+            elif child_type == "softbreak":
                 # Soft line break (single newline in markdown) - preserve as newline
-                text += "\n"
-                i += 1
-            elif child.type == "hardbreak":
+                append("\n")
+                cursor += 1
+            elif child_type == "hardbreak":
                 # Hard line break (two spaces + newline or <br>) - preserve as newline
-                text += "\n"
-                i += 1
-            elif child.type == "link_open":
-                # Track link
-                start_index = self.current_index + len(text)
-                link_url = child.attrs.get("href", "") if child.attrs else ""
-                link_text, skip_count = self._get_text_and_skip_count(token.children, i, "link_close")
-                result.format_ranges.append(
-                    FormatRange(
-                        start_index=start_index,
-                        end_index=start_index + len(link_text),
-                        format_type="link",
-                        url=link_url,
-                        text=link_text,
-                    )
-                )
-                text += link_text
-                i += skip_count
-            elif child.type in ["strong_close", "em_close", "link_close"]:
-                # Skip closing tokens (already handled)
-                i += 1
-            else:
-                i += 1
-
-        return text
-
-    def _get_text_and_skip_count(
-        self,
-        siblings: list[Token],
-        start_index: int,
-        close_type: str,
-    ) -> tuple[str, int]:
-        """Get text content until matching close token and count tokens to skip.
-
-        Args:
-            siblings: Sibling tokens
-            start_index: Index of open token
-            close_type: Close token type to find
-
-        Returns:
-            Tuple of (text content, number of tokens to skip including close token)
-        """
-        text = ""
-        i = start_index + 1
-
-        while i < len(siblings) and siblings[i].type != close_type:
-            if siblings[i].type == "text":
-                text += siblings[i].content
-            i += 1
+                append("\n")
+                cursor += 1
+            # Anything else: stray close tokens and unsupported types
 
-        # Return text and count of tokens to skip (including close token)
-        skip_count = i - start_index + 1
-        return text, skip_count
+        return "".join(parts), cursor - self.current_index
 
     def _resolve_phase_emoji(self, heading_text: str) -> str | None:
         """Resolve the emoji for a phase heading based on its description.
@@ -729,23 +1118,26 @@ class GoogleDocsConverter:
         Returns:
             New index past all consumed tokens
         """
+        n_tokens = len(tokens)
         insert_index = self.current_index
 
-        cell_content = ""
+        parts: list[str] = []
+        length = 0  # len("".join(parts))
         cell_formats: list[FormatRange] = []
 
         i = index
         first_pair = True
 
-        while i < len(tokens) and self._is_metadata_heading(tokens, i):
+        while i < n_tokens and self._is_metadata_heading(tokens, i):
             if not first_pair:
-                cell_content += "\n\n"  # empty paragraph as visual separator between pairs
+                parts.append("\n\n")  # empty paragraph as visual separator between pairs
+                length += 2
             first_pair = False
 
             # Extract h4 heading text
             heading_text = ""
             i += 1  # skip heading_open
-            while i < len(tokens) and tokens[i].type != "heading_close":
+            while i < n_tokens and tokens[i].type != "heading_close":
                 if tokens[i].type == "inline":
                     heading_text = tokens[i].content
                 i += 1
@@ -759,12 +1151,13 @@ class GoogleDocsConverter:
                 heading_text = f"{self.style_map.effort_emoji} {heading_text}"
 
             # Record heading with info_heading style (larger, green)
-            heading_start = len(cell_content)
-            cell_content += heading_text
-            heading_end = len(cell_content)
+            heading_start = length
+            if heading_text:
+                parts.append(heading_text)
+                length += len(heading_text)
             cell_formats.append(FormatRange(
                 start_index=heading_start,
-                end_index=heading_end,
+                end_index=length,
                 format_type="info_heading",
                 text=heading_text,
             ))
@@ -772,20 +1165,20 @@ class GoogleDocsConverter:
             # Collect content for this metadata heading: at most one paragraph,
             # optionally followed by one bullet list. Then stop and check for
             # the next metadata h4 in the outer loop.
-            if i < len(tokens) and tokens[i].type == "paragraph_open":
+            if i < n_tokens and tokens[i].type == "paragraph_open":
                 i += 1  # skip paragraph_open
                 para_text = ""
                 para_formats: list[FormatRange] = []
 
-                while i < len(tokens) and tokens[i].type != "paragraph_close":
+                while i < n_tokens and tokens[i].type != "paragraph_close":
                     if tokens[i].type == "inline":
                         para_text, para_formats = self._extract_cell_content(tokens[i])
                     i += 1
                 i += 1  # skip paragraph_close
 
                 if para_text:
-                    cell_content += "\n"
-                    offset = len(cell_content)
+                    parts.append("\n")
+                    offset = length + 1
                     for fmt in para_formats:
                         cell_formats.append(FormatRange(
                             start_index=fmt.start_index + offset,
@@ -794,16 +1187,20 @@ class GoogleDocsConverter:
                             url=fmt.url,
                             text=fmt.text,
                         ))
-                    cell_content += para_text
+                    parts.append(para_text)
+                    length = offset + len(para_text)
 
             # If a bullet list follows the paragraph, consume it too
             # (e.g., "Where the work happens" paragraph + tab list)
-            if i < len(tokens) and tokens[i].type == "bullet_list_open":
-                if cell_content and not cell_content.endswith("\n"):
-                    cell_content += "\n"
+            if i < n_tokens and tokens[i].type == "bullet_list_open":
+                if parts and not parts[-1].endswith("\n"):
+                    parts.append("\n")
+                    length += 1
                 list_text, list_fmts, i = self._flatten_list_into_cell(tokens, i)
-                offset = len(cell_content)
-                cell_content += list_text
+                offset = length
+                if list_text:
+                    parts.append(list_text)
+                    length += len(list_text)
                 for fmt in list_fmts:
                     cell_formats.append(FormatRange(
                         start_index=fmt.start_index + offset,
@@ -814,9 +1211,9 @@ class GoogleDocsConverter:
                     ))
 
         # Build info box table if we collected content
-        if cell_content:
+        if length:
             cell = TableCell(
-                content=cell_content,
+                content="".join(parts),
                 is_header=False,
                 format_ranges=cell_formats,
             )
@@ -830,7 +1227,7 @@ class GoogleDocsConverter:
             # Add newline placeholder for the table location
             # Mark it as a spacer to collapse its height
             spacer_start = self.current_index
-            result.plain_text += "\n"
+            result._chunks.append("\n")
             self.current_index += 1
             result.format_ranges.append(
                 FormatRange(
@@ -853,19 +1250,20 @@ class GoogleDocsConverter:
         and measures section density. The resulting DocumentModel provides
         O(1) lookups used during the rendering pass.
         """
+        n_tokens = len(tokens)
         model = DocumentModel()
         last_heading_level = 0
         last_heading_index = -1
 
         i = 0
-        while i < len(tokens):
+        while i < n_tokens:
             token = tokens[i]
 
             if token.type == "heading_open":
                 level = int(token.tag[1])
                 # Find inline content
                 heading_text = ""
-                for j in range(i + 1, min(i + 3, len(tokens))):
+                for j in range(i + 1, min(i + 3, n_tokens)):
                     if tokens[j].type == "inline":
                         heading_text = tokens[j].content
                         break
@@ -890,7 +1288,7 @@ class GoogleDocsConverter:
 
                 # Measure content density of the PREVIOUS section
                 if model.sections:
-                    self._count_section_content(tokens, model.sections[-1], last_heading_index, i)
+                    self._count_section_content(model.sections[-1], last_heading_index, i)
 
                 model.sections.append(section)
                 last_heading_index = i
@@ -900,27 +1298,25 @@ class GoogleDocsConverter:
 
         # Measure content density of the last section
         if model.sections:
-            self._count_section_content(tokens, model.sections[-1], last_heading_index, len(tokens))
+            self._count_section_content(model.sections[-1], last_heading_index, n_tokens)
 
         # Detect footnotes: italic paragraphs after the last heading
         if model.sections:
             last_section_start = model.sections[-1].heading_token_index
-            for idx in range(last_section_start, len(tokens)):
-                if tokens[idx].type == "paragraph_open":
-                    if self._is_footnote_paragraph(tokens, idx):
-                        model.footnote_indices.add(idx)
+            for idx in self._type_indices("paragraph_open", last_section_start, n_tokens):
+                if self._is_footnote_paragraph(tokens, idx):
+                    model.footnote_indices.add(idx)
 
         # Also detect document metadata: italic paragraphs between
         # title/subtitle and the first content heading (author line, etc.)
         for s in model.sections:
             if s.section_type not in (SectionType.TITLE, SectionType.SUBTITLE):
-                for idx in range(s.heading_token_index):
-                    if tokens[idx].type == "paragraph_open":
-                        if self._is_footnote_paragraph(tokens, idx):
-                            model.footnote_indices.add(idx)
+                for idx in self._type_indices("paragraph_open", 0, s.heading_token_index):
+                    if self._is_footnote_paragraph(tokens, idx):
+                        model.footnote_indices.add(idx)
                 break
 
-        model.build_lookup(len(tokens))
+        model.build_lookup(n_tokens)
         return model
 
     @staticmethod
@@ -976,8 +1372,9 @@ class GoogleDocsConverter:
         A legend section is detected by heading text containing "legend" AND
         having h4 sub-headings as direct children (no h3 sub-structure).
         """
+        n_tokens = len(tokens)
         # Quick text check first
-        for j in range(heading_index + 1, min(heading_index + 3, len(tokens))):
+        for j in range(heading_index + 1, min(heading_index + 3, n_tokens)):
             if tokens[j].type == "inline":
                 if "legend" not in tokens[j].content.lower():
                     return False
@@ -985,12 +1382,12 @@ class GoogleDocsConverter:
 
         # Lookahead: scan until next h2 or end, check for h4s and no h3s
         i = heading_index
-        while i < len(tokens) and tokens[i].type != "heading_close":
+        while i < n_tokens and tokens[i].type != "heading_close":
             i += 1
         i += 1  # past heading_close
 
         has_h4 = False
-        while i < len(tokens):
+        while i < n_tokens:
             token = tokens[i]
             if token.type == "heading_open":
                 next_level = int(token.tag[1])
@@ -1006,19 +1403,16 @@ class GoogleDocsConverter:
 
     def _count_section_content(
         self,
-        tokens: list[Token],
         section: SectionInfo,
         start: int,
         end: int,
     ) -> None:
         """Count paragraphs, list items, and tables in a section range."""
-        for idx in range(start, end):
-            if tokens[idx].type == "paragraph_open":
-                section.paragraph_count += 1
-            elif tokens[idx].type == "list_item_open":
-                section.list_item_count += 1
-            elif tokens[idx].type == "table_open":
-                section.has_table = True
+        types = self._token_types[start:end]
+        section.paragraph_count += types.count("paragraph_open")
+        section.list_item_count += types.count("list_item_open")
+        if "table_open" in types:
+            section.has_table = True
         if section.paragraph_count + section.list_item_count > 8:
             section.is_dense = True
 
@@ -1096,14 +1490,16 @@ class GoogleDocsConverter:
         Returns:
             New index past all consumed tokens
         """
+        n_tokens = len(tokens)
         insert_index = self.current_index
-        cell_content = ""
+        parts: list[str] = []
+        length = 0  # len("".join(parts))
         cell_formats: list[FormatRange] = []
 
         i = index
         first_item = True
 
-        while i < len(tokens):
+        while i < n_tokens:
             token = tokens[i]
 
             # Stop at next heading of same or higher level
@@ -1114,33 +1510,39 @@ class GoogleDocsConverter:
 
                 # Process sub-heading (h4) as bold text in the cell
                 if not first_item:
-                    cell_content += "\n"
+                    parts.append("\n")
+                    length += 1
                 first_item = False
 
                 heading_text = ""
                 i += 1
-                while i < len(tokens) and tokens[i].type != "heading_close":
+                while i < n_tokens and tokens[i].type != "heading_close":
                     if tokens[i].type == "inline":
                         heading_text = tokens[i].content
                     i += 1
                 i += 1  # skip heading_close
 
-                heading_start = len(cell_content)
-                cell_content += heading_text
+                heading_start = length
+                if heading_text:
+                    parts.append(heading_text)
+                    length += len(heading_text)
                 cell_formats.append(FormatRange(
                     start_index=heading_start,
-                    end_index=len(cell_content),
+                    end_index=length,
                     format_type="bold",
                     text=heading_text,
                 ))
                 continue
 
             elif token.type == "bullet_list_open":
-                if cell_content and not cell_content.endswith("\n"):
-                    cell_content += "\n"
+                if parts and not parts[-1].endswith("\n"):
+                    parts.append("\n")
+                    length += 1
                 list_text, list_fmts, i = self._flatten_list_into_cell(tokens, i)
-                caller_offset = len(cell_content)
-                cell_content += list_text
+                caller_offset = length
+                if list_text:
+                    parts.append(list_text)
+                    length += len(list_text)
                 for fmt in list_fmts:
                     cell_formats.append(FormatRange(
                         start_index=fmt.start_index + caller_offset,
@@ -1154,13 +1556,14 @@ class GoogleDocsConverter:
 
             elif token.type == "paragraph_open":
                 i += 1
-                while i < len(tokens) and tokens[i].type != "paragraph_close":
+                while i < n_tokens and tokens[i].type != "paragraph_close":
                     if tokens[i].type == "inline":
                         para_text, para_fmts = self._extract_cell_content(tokens[i])
                         if para_text:
-                            if cell_content and not cell_content.endswith("\n"):
-                                cell_content += "\n"
-                            caller_offset = len(cell_content)
+                            if parts and not parts[-1].endswith("\n"):
+                                parts.append("\n")
+                                length += 1
+                            caller_offset = length
                             for fmt in para_fmts:
                                 cell_formats.append(FormatRange(
                                     start_index=fmt.start_index + caller_offset,
@@ -1169,7 +1572,8 @@ class GoogleDocsConverter:
                                     url=fmt.url,
                                     text=fmt.text,
                                 ))
-                            cell_content += para_text
+                            parts.append(para_text)
+                            length += len(para_text)
                     i += 1
                 i += 1  # skip paragraph_close
                 first_item = False
@@ -1178,8 +1582,8 @@ class GoogleDocsConverter:
             i += 1
 
         # Build info box table
-        if cell_content:
-            cell = TableCell(content=cell_content, format_ranges=cell_formats)
+        if length:
+            cell = TableCell(content="".join(parts), format_ranges=cell_formats)
             table_data = TableData(
                 insert_index=insert_index,
                 rows=[[cell]],
@@ -1188,7 +1592,7 @@ class GoogleDocsConverter:
             )
             result.tables.append(table_data)
 
-            result.plain_text += "\n"
+            result._chunks.append("\n")
             self.current_index += 1
 
         return i
@@ -1203,24 +1607,28 @@ class GoogleDocsConverter:
         Returns:
             Tuple of (text, format_ranges with 0-based positions, new_token_index)
         """
-        text = ""
+        n_tokens = len(tokens)
+        parts: list[str] = []
+        length = 0  # len("".join(parts))
         formats: list[FormatRange] = []
 
         i = index + 1  # skip bullet_list_open
-        while i < len(tokens) and tokens[i].type != "bullet_list_close":
+        while i < n_tokens and tokens[i].type != "bullet_list_close":
             if tokens[i].type == "list_item_open":
                 i += 1
-                while i < len(tokens) and tokens[i].type != "list_item_close":
+                while i < n_tokens and tokens[i].type != "list_item_close":
                     if tokens[i].type == "paragraph_open":
                         i += 1
-                        while i < len(tokens) and tokens[i].type != "paragraph_close":
+                        while i < n_tokens and tokens[i].type != "paragraph_close":
                             if tokens[i].type == "inline":
                                 item_text, item_fmts = self._extract_cell_content(tokens[i])
-                                if text:
-                                    text += "\n"
+                                if length:
+                                    parts.append("\n")
+                                    length += 1
                                 prefix = "\u2022 "
-                                offset = len(text) + len(prefix)
-                                text += prefix + item_text
+                                offset = length + len(prefix)
+                                parts.append(prefix + item_text)
+                                length = offset + len(item_text)
                                 for fmt in item_fmts:
                                     formats.append(FormatRange(
                                         start_index=fmt.start_index + offset,
@@ -1236,7 +1644,7 @@ class GoogleDocsConverter:
             else:
                 i += 1
 
-        return text, formats, i + 1  # skip bullet_list_close
+        return "".join(parts), formats, i + 1  # skip bullet_list_close
 
     def _process_list(
         self,
@@ -1258,76 +1666,132 @@ class GoogleDocsConverter:
         Returns:
             New index after processing
         """
-        i = index + 1
-        while i < len(tokens) and tokens[i].type not in ["bullet_list_close", "ordered_list_close"]:
-            if tokens[i].type == "list_item_open":
-                # Set start index BEFORE adding tabs so tabs are included in the paragraph range
-                item_start = self.current_index
+        n_tokens = len(tokens)
+        append_chunk = result._chunks.append
+        # Nested lists push the enclosing list's state instead of recursing:
+        # (ordered, nesting_level, item_start, has_content)
+        stack: list[tuple[bool, int, int | None, bool]] = []
+        item_start: int | None = None  # None between list items
+        has_content = False
+        # Leading tabs for items at this nesting level (Google Docs uses tabs to
+        # determine nesting level); rebuilt only when the level changes
+        tabs = "\t" * nesting_level
 
-                # Add leading tabs for nesting (Google Docs uses tabs to determine nesting level)
-                tabs = "\t" * nesting_level
-                result.plain_text += tabs
-                self.current_index += len(tabs)
+        i = index + 1
+        while i < n_tokens:
+            token_type = tokens[i].type
+
+            if item_start is None:
+                if token_type in ("bullet_list_close", "ordered_list_close"):
+                    if not stack:
+                        return i + 1
+                    ordered, nesting_level, item_start, has_content = stack.pop()
+                    tabs = "\t" * nesting_level
+                elif token_type == "list_item_open":
+                    # Set start index BEFORE adding tabs so tabs are included in the paragraph range
+                    item_start = self.current_index
+
+                    # Add leading tabs for nesting
+                    if nesting_level:
+                        append_chunk(tabs)
+                        self.current_index += nesting_level
+                    has_content = False
+                i += 1
 
-                # Process list item content
+            elif token_type == "paragraph_open":
+                # Get paragraph content
                 i += 1
-                has_content = False
-                while i < len(tokens) and tokens[i].type != "list_item_close":
-                    if tokens[i].type == "paragraph_open":
-                        # Get paragraph content
-                        i += 1
-                        while i < len(tokens) and tokens[i].type != "paragraph_close":
-                            if tokens[i].type == "inline":
-                                text_content = self._process_inline(tokens[i], result)
-                                # Strip checkbox markers like [ ] or [x]
-                                text_content = re.sub(r'^\s*\[\s*[x ]?\s*\]\s*', '', text_content)
-                                if text_content.strip():  # Only add if there's actual content
-                                    result.plain_text += text_content
-                                    self.current_index += len(text_content)
-                                    has_content = True
-                            i += 1
-                        i += 1  # Skip paragraph_close
-                        continue
-                    elif tokens[i].type in ["bullet_list_open", "ordered_list_open"]:
-                        # Add newline before nested list if we had content
-                        if has_content:
-                            result.plain_text += "\n"
-                            self.current_index += 1
-
-                            # Save parent item
-                            result.list_ranges.append({
-                                "start_index": item_start,
-                                "end_index": self.current_index,
-                                "ordered": ordered,
-                                "nesting_level": nesting_level,
-                            })
-                            has_content = False
-
-                        # Process nested list
-                        is_ordered = tokens[i].type == "ordered_list_open"
-                        i = self._process_list(tokens, i, result, ordered=is_ordered, nesting_level=nesting_level + 1)
-                        continue
+                while i < n_tokens and tokens[i].type != "paragraph_close":
+                    if tokens[i].type == "inline":
+                        text_content, _ = self._process_inline(tokens[i], result)
+                        # Strip checkbox markers like [ ] or [x]; most items have none
+                        if text_content.lstrip().startswith("["):
+                            text_content = _CHECKBOX_RE.sub('', text_content, count=1)
+                        if text_content.strip():  # Only add if there's actual content
+                            append_chunk(text_content)
+                            self.current_index += len(text_content)
+                            has_content = True
                     i += 1
+                i += 1  # Skip paragraph_close
 
-                # Add newline after list item content
+            elif token_type in ("bullet_list_open", "ordered_list_open"):
+                # Add newline before nested list if we had content
                 if has_content:
-                    result.plain_text += "\n"
+                    append_chunk("\n")
                     self.current_index += 1
 
-                    item_end = self.current_index
+                    # Save parent item
+                    self._add_list_range(result, item_start, self.current_index, ordered, nesting_level)
+                    has_content = False
+
+                # Process nested list
+                stack.append((ordered, nesting_level, item_start, has_content))
+                ordered = token_type == "ordered_list_open"
+                nesting_level += 1
+                tabs = "\t" * nesting_level
+                item_start = None
+                i += 1
+
+            elif token_type == "list_item_close":
+                # Add newline after list item content
+                if has_content:
+                    append_chunk("\n")
+                    self.current_index += 1
 
                     # Track list item range with nesting level
-                    result.list_ranges.append({
-                        "start_index": item_start,
-                        "end_index": item_end,
-                        "ordered": ordered,
-                        "nesting_level": nesting_level,
-                    })
+                    self._add_list_range(result, item_start, self.current_index, ordered, nesting_level)
+                item_start = None
+                i += 1
+
             else:
                 i += 1
 
         return i + 1
 
+    def _add_list_range(
+        self,
+        result: ConversionResult,
+        start_index: int,
+        end_index: int,
+        ordered: bool,
+        nesting_level: int,
+    ) -> None:
+        """Record a list item range and merge it into the current list group.
+
+        Groups are what generate_batch_requests turns into createParagraphBullets
+        requests, so items are merged as they are produced instead of in a
+        second pass over list_ranges.
+
+        Args:
+            result: Result to update
+            start_index: Item start (including leading tabs)
+            end_index: Item end (after the trailing newline)
+            ordered: True for numbered lists
+            nesting_level: Item nesting depth
+        """
+        result.list_ranges.append({
+            "start_index": start_index,
+            "end_index": end_index,
+            "ordered": ordered,
+            "nesting_level": nesting_level,
+        })
+
+        groups = result.list_groups
+        if groups:
+            group = groups[-1]
+            # Adjacent means the item starts at or before the group's end.
+            if start_index <= group.end_index:
+                # Nested child (nesting > 0): always merge into parent group,
+                # even if ordered type differs (numbered parent + bullet children).
+                # Root-level item with same list type: merge (sibling items).
+                # Adjacent but different type at root level = new list.
+                if nesting_level > 0 or ordered == group.ordered:
+                    if end_index > group.end_index:
+                        group.end_index = end_index
+                    return
+        # First item, or a gap between items means separate lists
+        groups.append(ListGroup(ordered, start_index, end_index))
+
     def _process_blockquote(
         self,
         tokens: list[Token],
@@ -1348,6 +1812,7 @@ class GoogleDocsConverter:
         Returns:
             New index after processing
         """
+        n_tokens = len(tokens)
         # Check for admonition syntax: first inline child starts with [!TYPE]
         admonition_type = self._detect_admonition(tokens, index)
         if admonition_type:
@@ -1356,7 +1821,7 @@ class GoogleDocsConverter:
         start_index = self.current_index
 
         i = index + 1
-        while i < len(tokens) and tokens[i].type != "blockquote_close":
+        while i < n_tokens and tokens[i].type != "blockquote_close":
             if tokens[i].type == "paragraph_open":
                 i = self._process_paragraph(tokens, i, result)
             else:
@@ -1392,12 +1857,13 @@ class GoogleDocsConverter:
         Returns:
             Admonition type string (e.g. "WARNING") or None
         """
+        n_tokens = len(tokens)
         i = blockquote_index + 1
-        while i < len(tokens) and tokens[i].type != "blockquote_close":
+        while i < n_tokens and tokens[i].type != "blockquote_close":
             if tokens[i].type == "paragraph_open":
                 # Find the inline token inside this paragraph
                 j = i + 1
-                while j < len(tokens) and tokens[j].type != "paragraph_close":
+                while j < n_tokens and tokens[j].type != "paragraph_close":
                     if tokens[j].type == "inline":
                         content = tokens[j].content
                         m = re.match(r'^\[!(WARNING|NOTE|INFO|SUCCESS)\]\s*', content)
@@ -1430,18 +1896,20 @@ class GoogleDocsConverter:
         Returns:
             New index past blockquote_close
         """
+        n_tokens = len(tokens)
         insert_index = self.current_index
 
         # Collect all text content from the blockquote paragraphs
-        body_text = ""
+        parts: list[str] = []
+        length = 0  # len("".join(parts))
         body_formats: list[FormatRange] = []
 
         i = index + 1
         first_para = True
-        while i < len(tokens) and tokens[i].type != "blockquote_close":
+        while i < n_tokens and tokens[i].type != "blockquote_close":
             if tokens[i].type == "paragraph_open":
                 i += 1  # skip paragraph_open
-                while i < len(tokens) and tokens[i].type != "paragraph_close":
+                while i < n_tokens and tokens[i].type != "paragraph_close":
                     if tokens[i].type == "inline":
                         para_text, para_fmts = self._extract_cell_content(tokens[i])
 
@@ -1468,9 +1936,10 @@ class GoogleDocsConverter:
                             first_para = False
 
                         if para_text:
-                            if body_text:
-                                body_text += "\n"
-                            offset = len(body_text)
+                            if length:
+                                parts.append("\n")
+                                length += 1
+                            offset = length
                             for fmt in para_fmts:
                                 body_formats.append(FormatRange(
                                     start_index=fmt.start_index + offset,
@@ -1479,7 +1948,8 @@ class GoogleDocsConverter:
                                     url=fmt.url,
                                     text=fmt.text,
                                 ))
-                            body_text += para_text
+                            parts.append(para_text)
+                            length += len(para_text)
                     i += 1
                 i += 1  # skip paragraph_close
                 continue
@@ -1488,7 +1958,7 @@ class GoogleDocsConverter:
         # Skip blockquote_close
         i += 1
 
-        if body_text:
+        if length:
             # Get icon from style presets
             preset = self.style_map.admonition_presets.get(admonition_type, {})
             icon = preset.get("icon", "\u2757")
@@ -1496,7 +1966,7 @@ class GoogleDocsConverter:
             # Build the two cells
             icon_cell = TableCell(content=icon, is_header=False)
             text_cell = TableCell(
-                content=body_text,
+                content="".join(parts),
                 is_header=False,
                 format_ranges=body_formats,
             )
@@ -1512,7 +1982,7 @@ class GoogleDocsConverter:
 
             # Add newline placeholder for the table location
             spacer_start = self.current_index
-            result.plain_text += "\n"
+            result._chunks.append("\n")
             self.current_index += 1
             result.format_ranges.append(
                 FormatRange(
@@ -1543,14 +2013,15 @@ class GoogleDocsConverter:
         start_index = self.current_index
         code_text = token.content
 
-        result.plain_text += code_text + "\n"
-        self.current_index += len(code_text) + 1
+        result._chunks.append(code_text + "\n")
+        end_index = start_index + len(code_text)
+        self.current_index = end_index + 1
 
         # Track code block range
         result.format_ranges.append(
             FormatRange(
                 start_index=start_index,
-                end_index=self.current_index - 1,
+                end_index=end_index,
                 format_type="code_block",
                 text=code_text,
             )
@@ -1595,52 +2066,57 @@ class GoogleDocsConverter:
         Returns:
             New index after processing
         """
+        n_tokens = len(tokens)
         # Record where the table should be inserted
         table_insert_index = self.current_index
 
         rows: list[list[TableCell]] = []
         current_row: list[TableCell] = []
+        add_cell = current_row.append
         in_header = False
 
         i = index + 1
-        while i < len(tokens) and tokens[i].type != "table_close":
-            token = tokens[i]
-
-            if token.type == "thead_open":
-                in_header = True
-                i += 1
-            elif token.type == "thead_close":
-                in_header = False
-                i += 1
-            elif token.type == "tbody_open":
-                i += 1
-            elif token.type == "tbody_close":
-                i += 1
-            elif token.type == "tr_open":
-                current_row = []
-                i += 1
-            elif token.type == "tr_close":
-                if current_row:
-                    rows.append(current_row)
-                i += 1
-            elif token.type in ["th_open", "td_open"]:
-                # Start of a cell - find the inline content
-                i += 1
-                cell_content = ""
-                cell_formats: list[FormatRange] = []
-
-                while i < len(tokens) and tokens[i].type not in ["th_close", "td_close"]:
-                    if tokens[i].type == "inline":
-                        cell_content, cell_formats = self._extract_cell_content(tokens[i])
+        while i < n_tokens:
+            token_type = tokens[i].type
+
+            # Cells dominate the token stream, so they are checked first
+            if token_type in _TABLE_CELL_OPEN:
+                close_type = _TABLE_CELL_OPEN[token_type]
+                if self._is_inline_triple(i, close_type):
+                    cell_content, cell_formats = self._extract_cell_content(tokens[i + 1])
+                    i += 3
+                else:
+                    # Empty or unusual cell - scan for the close token
+                    cell_content = ""
+                    cell_formats = []
                     i += 1
+                    while i < n_tokens and tokens[i].type != close_type:
+                        if tokens[i].type == "inline":
+                            cell_content, cell_formats = self._extract_cell_content(tokens[i])
+                        i += 1
+                    i += 1  # Skip the close token
 
-                current_row.append(TableCell(
+                add_cell(TableCell(
                     content=cell_content,
                     is_header=in_header,
                     format_ranges=cell_formats
                 ))
-                i += 1  # Skip the close token
+            elif token_type == "tr_close":
+                if current_row:
+                    rows.append(current_row)
+                i += 1
+            elif token_type == "tr_open":
+                current_row = []
+                add_cell = current_row.append
+                i += 1
+            elif token_type == "table_close":
+                break
             else:
+                # thead_open/thead_close toggle the header flag; tbody is ignored
+                if token_type == "thead_open":
+                    in_header = True
+                elif token_type == "thead_close":
+                    in_header = False
                 i += 1
 
         # Create TableData and add to result
@@ -1653,7 +2129,7 @@ class GoogleDocsConverter:
 
             # Add a newline placeholder for the table location
             # (the actual table will be inserted via batch requests)
-            result.plain_text += "\n"
+            result._chunks.append("\n")
             self.current_index += 1
 
         return i + 1  # Skip table_close
@@ -1673,63 +2149,35 @@ class GoogleDocsConverter:
         if not token.children:
             return "", []
 
-        text = ""
+        children = iter(token.children)
+        parts: list[str] = []
+        length = 0  # len("".join(parts))
         formats: list[FormatRange] = []
-        i = 0
 
-        while i < len(token.children):
-            child = token.children[i]
+        for child in children:
+            child_type = child.type
 
-            if child.type == "text":
-                text += child.content
-                i += 1
-            elif child.type == "strong_open":
-                start = len(text)
-                bold_text, skip_count = self._get_text_and_skip_count(token.children, i, "strong_close")
-                formats.append(FormatRange(
-                    start_index=start,
-                    end_index=start + len(bold_text),
-                    format_type="bold",
-                    text=bold_text,
-                ))
-                text += bold_text
-                i += skip_count
-            elif child.type == "em_open":
-                start = len(text)
-                italic_text, skip_count = self._get_text_and_skip_count(token.children, i, "em_close")
-                formats.append(FormatRange(
-                    start_index=start,
-                    end_index=start + len(italic_text),
-                    format_type="italic",
-                    text=italic_text,
-                ))
-                text += italic_text
-                i += skip_count
-            elif child.type == "link_open":
-                start = len(text)
-                link_url = child.attrs.get("href", "") if child.attrs else ""
-                link_text, skip_count = self._get_text_and_skip_count(token.children, i, "link_close")
+            if child_type in ("text", "code_inline"):
+                parts.append(child.content)
+                length += len(child.content)
+            elif child_type in _INLINE_SPANS:
+                format_type = _INLINE_SPANS[child_type]
+                link_url = _link_href(child) if format_type == "link" else None
+                span_text = _consume_span_text(children)
                 formats.append(FormatRange(
-                    start_index=start,
-                    end_index=start + len(link_text),
-                    format_type="link",
+                    start_index=length,
+                    end_index=length + len(span_text),
+                    format_type=format_type,
                     url=link_url,
-                    text=link_text,
+                    text=span_text,
                 ))
-                text += link_text
-                i += skip_count
-            elif child.type == "code_inline":
-                text += child.content
-                i += 1
-            elif child.type in ("softbreak", "hardbreak"):
-                text += " "
-                i += 1
-            elif child.type in ["strong_close", "em_close", "link_close"]:
-                i += 1
-            else:
-                i += 1
+                parts.append(span_text)
+                length += len(span_text)
+            elif child_type in ("softbreak", "hardbreak"):
+                parts.append(" ")
+                length += 1
 
-        return text, formats
+        return "".join(parts), formats
 
     def generate_batch_requests(self, conversion: ConversionResult) -> list[dict[str, Any]]:
         """Generate Google Docs API batch update requests.
@@ -1740,81 +2188,164 @@ class GoogleDocsConverter:
         Returns:
             List of batch update request dictionaries
         """
-        requests = []
+        return list(self.iter_batch_requests(conversion))
+
+    def iter_batch_requests(self, conversion: ConversionResult) -> Iterator[dict[str, Any]]:
+        """Yield Google Docs API batch update requests one at a time.
+
+        Same requests, in the same order, as generate_batch_requests, for
+        callers that send them to the API in batches as they are produced.
+        Style payloads are built per call but shared between the requests
+        of that call, so mutating one request's style can change others
+        from the same call (namedStyleType paragraph styles excepted).
+
+        Args:
+            conversion: Conversion result with formatting info
+
+        Yields:
+            Batch update request dictionaries
+        """
+        # Safety: drop style requests with an empty range (startIndex >= endIndex).
+        # Google Docs rejects these with "The range should not be empty" and aborts
+        # the whole batch. They style nothing, so removing them is a no-op for output.
+        # Zero-length formatted runs can arise from empty bold/italic spans in table
+        # cells (see _generate_table_requests).
+        for request in self._iter_unfiltered_requests(conversion):
+            if not _has_empty_range(request):
+                yield request
+
+    def _format_templates(self) -> dict[str, tuple[_RequestTemplate, ...]]:
+        """Build the request templates for every fixed-payload FormatRange type.
+
+        Called once per iter_batch_requests call, so the payloads are owned by
+        that call's requests and never shared with other conversions.
+
+        Returns:
+            Dict of format type -> request templates, in emission order
+        """
+        sm = self.style_map
+
+        def rgb(color: tuple[float, ...]) -> dict[str, Any]:
+            return {"color": {"rgbColor": {"red": color[0], "green": color[1], "blue": color[2]}}}
+
+        return {
+            "bold": (("updateTextStyle", "textStyle", {"bold": True}, "bold"),),
+            "italic": (("updateTextStyle", "textStyle", {"italic": True}, "italic"),),
+            "paragraph": (
+                # Regular paragraphs: add space above for breathing room
+                ("updateParagraphStyle", "paragraphStyle", {
+                    "spaceAbove": {"magnitude": 6, "unit": "PT"},
+                }, "spaceAbove"),
+            ),
+            "table_spacer": (
+                # Collapse the empty paragraph between a heading and its info box
+                ("updateParagraphStyle", "paragraphStyle", {
+                    "spaceAbove": {"magnitude": 0, "unit": "PT"},
+                    "spaceBelow": {"magnitude": 0, "unit": "PT"},
+                }, "spaceAbove,spaceBelow"),
+            ),
+            "code_block": (
+                # Code blocks: monospace font + gray background, slight indentation
+                ("updateTextStyle", "textStyle", {
+                    "weightedFontFamily": {"fontFamily": "Courier New"},
+                    "fontSize": {"magnitude": 10, "unit": "PT"},
+                    "backgroundColor": rgb(sm.code_block_bg),
+                }, "weightedFontFamily,fontSize,backgroundColor"),
+                ("updateParagraphStyle", "paragraphStyle", {
+                    "indentStart": {"magnitude": 36, "unit": "PT"},
+                    "indentEnd": {"magnitude": 36, "unit": "PT"},
+                }, "indentStart,indentEnd"),
+            ),
+            "blockquote": (
+                # Blockquotes: left indentation + left border + light gray background
+                ("updateParagraphStyle", "paragraphStyle", {
+                    "indentStart": {"magnitude": 36, "unit": "PT"},
+                    "indentFirstLine": {"magnitude": 36, "unit": "PT"},
+                    "borderLeft": {
+                        "color": rgb(sm.blockquote_border_color),
+                        "width": {"magnitude": 3.0, "unit": "PT"},
+                        "padding": {"magnitude": 10.0, "unit": "PT"},
+                        "dashStyle": "SOLID",
+                    },
+                }, "indentStart,indentFirstLine,borderLeft"),
+                ("updateTextStyle", "textStyle", {
+                    "backgroundColor": rgb(sm.blockquote_bg),
+                }, "backgroundColor"),
+            ),
+            "footnote": (
+                # Footnote paragraphs: italic + small font + gray
+                ("updateParagraphStyle", "paragraphStyle", {
+                    "spaceAbove": {"magnitude": 2, "unit": "PT"},
+                }, "spaceAbove"),
+                ("updateTextStyle", "textStyle", {
+                    "italic": True,
+                    "fontSize": {"magnitude": sm.footnote_font_size, "unit": "PT"},
+                    "foregroundColor": rgb(sm.footnote_color),
+                }, "italic,fontSize,foregroundColor"),
+            ),
+            "step_metadata": (
+                # Step metadata: 9pt gray with extra space below
+                ("updateParagraphStyle", "paragraphStyle", {
+                    "spaceBelow": {"magnitude": sm.step_metadata_space_below, "unit": "PT"},
+                }, "spaceBelow"),
+                ("updateTextStyle", "textStyle", {
+                    "fontSize": {"magnitude": sm.step_metadata_font_size, "unit": "PT"},
+                    "foregroundColor": rgb(sm.step_metadata_color),
+                }, "fontSize,foregroundColor"),
+            ),
+            "heading_parenthetical": (
+                # Heading attribution de-emphasis: "(Name)" in lighter gray, smaller font
+                ("updateTextStyle", "textStyle", {
+                    "fontSize": {"magnitude": sm.heading_parenthetical_font_size, "unit": "PT"},
+                    "foregroundColor": rgb(sm.heading_parenthetical_color),
+                }, "fontSize,foregroundColor"),
+            ),
+        }
+
+    def _iter_unfiltered_requests(self, conversion: ConversionResult) -> Iterator[dict[str, Any]]:
+        """Yield batch update requests, including empty-range style requests."""
+        # Request templates, built once per call; payloads are shared by this call's requests
+        templates = self._format_templates()
+        # Results made elsewhere (cache, convert_batch) carry their own model
+        model = conversion._document_model
+        if model is None:
+            model = self._document_model
 
         # Build UTF-16 supplementary character offset table.
         # Google Docs API indices are in UTF-16 code units, not Python chars.
         supp = _build_utf16_offsets(conversion.plain_text)
 
+        # Sorted tab positions: tabs before index i == bisect_left(tabs, i)
+        tabs = conversion._tab_positions
+        if tabs is None:
+            tabs = _build_tab_positions(conversion.plain_text)
+
         # IMPORTANT: Apply list formatting FIRST before other formatting
         # because createParagraphBullets removes tabs, which shifts indices
         # Group consecutive list items by type (ordered vs unordered) and apply
         # createParagraphBullets to entire list ranges at once so Google Docs
         # can detect nesting levels from tabs correctly
-        if conversion.list_ranges:
-            list_groups = []
-            current_group = {
-                "ordered": conversion.list_ranges[0]["ordered"],
-                "start_index": conversion.list_ranges[0]["start_index"],
-                "end_index": conversion.list_ranges[0]["end_index"],
-            }
-
-            for i in range(1, len(conversion.list_ranges)):
-                curr = conversion.list_ranges[i]
-
-                # Adjacent means the current item starts at or before the group's end.
-                is_adjacent = curr["start_index"] <= current_group["end_index"]
-
-                if is_adjacent:
-                    # Nested child (nesting > 0): always merge into parent group,
-                    # even if ordered type differs (numbered parent + bullet children).
-                    is_nested_child = curr.get("nesting_level", 0) > 0
-                    # Root-level item with same list type: merge (sibling items).
-                    is_same_root = (curr.get("nesting_level", 0) == 0
-                                    and curr["ordered"] == current_group["ordered"])
-
-                    if is_nested_child or is_same_root:
-                        current_group["end_index"] = max(
-                            current_group["end_index"], curr["end_index"])
-                    else:
-                        # Adjacent but different type at root level = new list
-                        list_groups.append(current_group)
-                        current_group = {
-                            "ordered": curr["ordered"],
-                            "start_index": curr["start_index"],
-                            "end_index": curr["end_index"],
-                        }
-                else:
-                    # Gap between items means separate lists
-                    list_groups.append(current_group)
-                    current_group = {
-                        "ordered": curr["ordered"],
-                        "start_index": curr["start_index"],
-                        "end_index": curr["end_index"],
-                    }
-
-            # Add final group
-            list_groups.append(current_group)
-
+        if conversion.list_groups:
             # Apply createParagraphBullets to each group
             # IMPORTANT: Track tab removal offset because each createParagraphBullets
             # removes leading tabs, shifting all subsequent indices
             tab_offset = 0
 
-            for group in list_groups:
-                bullet_preset = "NUMBERED_DECIMAL_ALPHA_ROMAN" if group["ordered"] else "BULLET_DISC_CIRCLE_SQUARE"
+            for group in conversion.list_groups:
+                group_start = group.start_index
+                group_end = group.end_index
+                bullet_preset = "NUMBERED_DECIMAL_ALPHA_ROMAN" if group.ordered else "BULLET_DISC_CIRCLE_SQUARE"
 
                 # Count tabs in this group's text
-                group_text = conversion.plain_text[group["start_index"]:group["end_index"]]
-                tabs_in_group = group_text.count('\t')
+                tabs_in_group = bisect_left(tabs, group_end) - bisect_left(tabs, group_start)
 
                 # Adjust indices based on tabs removed by previous groups
                 # + UTF-16 supplementary char offset (emojis = 2 code units)
                 # Use supp[i-1] to count supplementary chars BEFORE position i
-                adjusted_start = group["start_index"] - tab_offset + supp[group["start_index"] - 1]
-                adjusted_end = group["end_index"] - 1 - tab_offset + supp[group["end_index"] - 1]
+                adjusted_start = group_start - tab_offset + supp[group_start - 1]
+                adjusted_end = group_end - 1 - tab_offset + supp[group_end - 1]
 
-                requests.append({
+                yield {
                     "createParagraphBullets": {
                         "range": {
                             "startIndex": adjusted_start,
@@ -1822,7 +2353,7 @@ class GoogleDocsConverter:
                         },
                         "bulletPreset": bullet_preset,
                     }
-                })
+                }
 
                 # Update offset for next group
                 tab_offset += tabs_in_group
@@ -1830,44 +2361,53 @@ class GoogleDocsConverter:
         # Apply heading styles and text formatting
         # Adjust indices to account for tabs removed by list formatting
         # Only subtract tabs that appear BEFORE each formatting range
-        for fmt in conversion.format_ranges:
+        # Contiguous ranges of the same kind share one set of requests
+        for fmt in _coalesce_format_ranges(conversion.format_ranges):
             # Count tabs before this format range
-            tabs_before = conversion.plain_text[:fmt.start_index].count('\t')
+            tabs_before = bisect_left(tabs, fmt.start_index)
             # Compute API indices: adjust for tab removal + UTF-16 supplementary chars.
             # Use supp[i-1] because supp[i] counts supplementary chars in text[0:i]
             # which INCLUDES the char at i-1.  We need chars BEFORE the position.
             adj_s = fmt.start_index - tabs_before + supp[fmt.start_index - 1]
             adj_e = fmt.end_index - tabs_before + supp[fmt.end_index - 1]
 
-            if fmt.format_type == "subtitle":
-                # Subtitle style: h2 immediately after h1 gets SUBTITLE
-                requests.append({
-                    "updateParagraphStyle": {
+            format_type = fmt.format_type
+            request_templates = templates.get(format_type)
+            if request_templates is not None:
+                for kind, style_key, payload, fields in request_templates:
+                    yield {
+                        kind: {
+                            "range": {
+                                "startIndex": adj_s,
+                                "endIndex": adj_e,
+                            },
+                            style_key: payload,
+                            "fields": fields,
+                        }
+                    }
+
+            elif format_type == "link":
+                yield {
+                    "updateTextStyle": {
                         "range": {
                             "startIndex": adj_s,
                             "endIndex": adj_e,
                         },
-                        "paragraphStyle": {
-                            "namedStyleType": "SUBTITLE"
+                        "textStyle": {
+                            "link": {"url": fmt.url}
                         },
-                        "fields": "namedStyleType",
+                        "fields": "link",
                     }
-                })
-
-            elif fmt.format_type == "heading":
-                # Map markdown headings to Google Docs styles:
-                # H1 -> Title, H2 -> Heading 1, H3 -> Heading 2, H4 -> Heading 3, etc.
-                # This allows H1 to use the document Title style
-                if fmt.level == 1:
-                    style_type = "TITLE"
-                else:
-                    style_type = f"HEADING_{fmt.level - 1}"
+                }
+
+            elif format_type == "heading":
+                style_type = _HEADING_STYLE_TYPES[(fmt.level or 1) - 1]
 
                 # Legend/Guidance H2 headings: use HEADING_2 (neutral, no green bg)
                 # instead of the standard HEADING_1 which has a green background
                 section = None
-                if self._document_model and fmt.token_index is not None:
-                    section = self._document_model.section_for_token(fmt.token_index)
+                if model and fmt.token_index is not None:
+                    section = model.section_for_token(fmt.token_index)
                     if section and section.section_type in (SectionType.LEGEND, SectionType.GUIDANCE):
                         style_type = "HEADING_2"
 
@@ -1875,11 +2415,11 @@ class GoogleDocsConverter:
                 space_above = self.style_map.heading_space_above.get(fmt.level)
 
                 # Smart spacing: extra space after dense sections
-                if section is None and self._document_model and fmt.token_index is not None:
-                    section = self._document_model.section_for_token(fmt.token_index)
-                if section:
-                    idx = self._document_model.sections.index(section)
-                    if idx > 0 and self._document_model.sections[idx - 1].is_dense:
+                if section is None and model and fmt.token_index is not None:
+                    section = model.section_for_token(fmt.token_index)
+                if section and model:
+                    idx = model.section_position(section)
+                    if idx > 0 and model.sections[idx - 1].is_dense:
                         dense_space = self.style_map.dense_section_extra_space
                         space_above = max(space_above or 0, dense_space)
 
@@ -1895,7 +2435,7 @@ class GoogleDocsConverter:
                     paragraph_style["spaceBelow"] = {"magnitude": 0, "unit": "PT"}
                     fields += ",spaceBelow"
 
-                requests.append({
+                yield {
                     "updateParagraphStyle": {
                         "range": {
                             "startIndex": adj_s,
@@ -1904,299 +2444,36 @@ class GoogleDocsConverter:
                         "paragraphStyle": paragraph_style,
                         "fields": fields,
                     }
-                })
+                }
                 # Note: We intentionally do NOT clear background colors here
                 # to allow custom heading styles (with highlights) to be preserved
 
-            elif fmt.format_type == "bold":
-                requests.append({
-                    "updateTextStyle": {
-                        "range": {
-                            "startIndex": adj_s,
-                            "endIndex": adj_e,
-                        },
-                        "textStyle": {"bold": True},
-                        "fields": "bold",
-                    }
-                })
-
-            elif fmt.format_type == "italic":
-                requests.append({
-                    "updateTextStyle": {
-                        "range": {
-                            "startIndex": adj_s,
-                            "endIndex": adj_e,
-                        },
-                        "textStyle": {"italic": True},
-                        "fields": "italic",
-                    }
-                })
-
-            elif fmt.format_type == "link":
-                requests.append({
-                    "updateTextStyle": {
-                        "range": {
-                            "startIndex": adj_s,
-                            "endIndex": adj_e,
-                        },
-                        "textStyle": {
-                            "link": {"url": fmt.url}
-                        },
-                        "fields": "link",
-                    }
-                })
-
-            elif fmt.format_type == "code_block":
-                # Code blocks: monospace font + gray background
-                cb_bg = self.style_map.code_block_bg
-                requests.append({
-                    "updateTextStyle": {
-                        "range": {
-                            "startIndex": adj_s,
-                            "endIndex": adj_e,
-                        },
-                        "textStyle": {
-                            "weightedFontFamily": {
-                                "fontFamily": "Courier New"
-                            },
-                            "fontSize": {"magnitude": 10, "unit": "PT"},
-                            "backgroundColor": {
-                                "color": {
-                                    "rgbColor": {
-                                        "red": cb_bg[0],
-                                        "green": cb_bg[1],
-                                        "blue": cb_bg[2],
-                                    }
-                                }
-                            }
-                        },
-                        "fields": "weightedFontFamily,fontSize,backgroundColor",
-                    }
-                })
-
-                # Paragraph style: slight indentation
-                requests.append({
-                    "updateParagraphStyle": {
-                        "range": {
-                            "startIndex": adj_s,
-                            "endIndex": adj_e,
-                        },
-                        "paragraphStyle": {
-                            "indentStart": {"magnitude": 36, "unit": "PT"},
-                            "indentEnd": {"magnitude": 36, "unit": "PT"},
-                        },
-                        "fields": "indentStart,indentEnd",
-                    }
-                })
-
-            elif fmt.format_type == "paragraph":
-                # Regular paragraphs: add space above for breathing room
-                requests.append({
-                    "updateParagraphStyle": {
-                        "range": {
-                            "startIndex": adj_s,
-                            "endIndex": adj_e,
-                        },
-                        "paragraphStyle": {
-                            "spaceAbove": {"magnitude": 6, "unit": "PT"},
-                        },
-                        "fields": "spaceAbove",
-                    }
-                })
-
-            elif fmt.format_type == "blockquote":
-                # Blockquotes: left indentation + left border + light gray background
-                bq_bc = self.style_map.blockquote_border_color
-                bq_bg = self.style_map.blockquote_bg
-                requests.append({
-                    "updateParagraphStyle": {
-                        "range": {
-                            "startIndex": adj_s,
-                            "endIndex": adj_e,
-                        },
-                        "paragraphStyle": {
-                            "indentStart": {"magnitude": 36, "unit": "PT"},
-                            "indentFirstLine": {"magnitude": 36, "unit": "PT"},
-                            "borderLeft": {
-                                "color": {
-                                    "color": {
-                                        "rgbColor": {
-                                            "red": bq_bc[0],
-                                            "green": bq_bc[1],
-                                            "blue": bq_bc[2],
-                                        }
-                                    }
-                                },
-                                "width": {"magnitude": 3.0, "unit": "PT"},
-                                "padding": {"magnitude": 10.0, "unit": "PT"},
-                                "dashStyle": "SOLID",
-                            },
-                        },
-                        "fields": "indentStart,indentFirstLine,borderLeft",
-                    }
-                })
-
-                # Add subtle background color
-                requests.append({
-                    "updateTextStyle": {
-                        "range": {
-                            "startIndex": adj_s,
-                            "endIndex": adj_e,
-                        },
-                        "textStyle": {
-                            "backgroundColor": {
-                                "color": {
-                                    "rgbColor": {
-                                        "red": bq_bg[0],
-                                        "green": bq_bg[1],
-                                        "blue": bq_bg[2],
-                                    }
-                                }
-                            }
-                        },
-                        "fields": "backgroundColor",
-                    }
-                })
-
-            elif fmt.format_type == "footnote":
-                # Footnote paragraphs: italic + small font + gray
-                fc = self.style_map.footnote_color
-                requests.append({
-                    "updateParagraphStyle": {
-                        "range": {
-                            "startIndex": adj_s,
-                            "endIndex": adj_e,
-                        },
-                        "paragraphStyle": {
-                            "spaceAbove": {"magnitude": 2, "unit": "PT"},
-                        },
-                        "fields": "spaceAbove",
-                    }
-                })
-                requests.append({
-                    "updateTextStyle": {
-                        "range": {
-                            "startIndex": adj_s,
-                            "endIndex": adj_e,
-                        },
-                        "textStyle": {
-                            "italic": True,
-                            "fontSize": {"magnitude": self.style_map.footnote_font_size, "unit": "PT"},
-                            "foregroundColor": {
-                                "color": {
-                                    "rgbColor": {
-                                        "red": fc[0],
-                                        "green": fc[1],
-                                        "blue": fc[2],
-                                    }
-                                }
-                            },
-                        },
-                        "fields": "italic,fontSize,foregroundColor",
-                    }
-                })
-
-            elif fmt.format_type == "step_metadata":
-                # Step metadata: 9pt gray with extra space below
-                smc = self.style_map.step_metadata_color
-                requests.append({
-                    "updateParagraphStyle": {
-                        "range": {
-                            "startIndex": adj_s,
-                            "endIndex": adj_e,
-                        },
-                        "paragraphStyle": {
-                            "spaceBelow": {"magnitude": self.style_map.step_metadata_space_below, "unit": "PT"},
-                        },
-                        "fields": "spaceBelow",
-                    }
-                })
-                requests.append({
-                    "updateTextStyle": {
-                        "range": {
-                            "startIndex": adj_s,
-                            "endIndex": adj_e,
-                        },
-                        "textStyle": {
-                            "fontSize": {"magnitude": self.style_map.step_metadata_font_size, "unit": "PT"},
-                            "foregroundColor": {
-                                "color": {
-                                    "rgbColor": {
-                                        "red": smc[0],
-                                        "green": smc[1],
-                                        "blue": smc[2],
-                                    }
-                                }
-                            },
-                        },
-                        "fields": "fontSize,foregroundColor",
-                    }
-                })
-
-            elif fmt.format_type == "table_spacer":
-                # Collapse the empty paragraph between a heading and its info box
-                requests.append({
+            elif format_type == "subtitle":
+                # Subtitle style: h2 immediately after h1 gets SUBTITLE
+                yield {
                     "updateParagraphStyle": {
                         "range": {
                             "startIndex": adj_s,
                             "endIndex": adj_e,
                         },
                         "paragraphStyle": {
-                            "spaceAbove": {"magnitude": 0, "unit": "PT"},
-                            "spaceBelow": {"magnitude": 0, "unit": "PT"},
-                        },
-                        "fields": "spaceAbove,spaceBelow",
-                    }
-                })
-
-            elif fmt.format_type == "heading_parenthetical":
-                # Heading attribution de-emphasis: "(Name)" in lighter gray, smaller font
-                hpc = self.style_map.heading_parenthetical_color
-                requests.append({
-                    "updateTextStyle": {
-                        "range": {
-                            "startIndex": adj_s,
-                            "endIndex": adj_e,
-                        },
-                        "textStyle": {
-                            "fontSize": {"magnitude": self.style_map.heading_parenthetical_font_size, "unit": "PT"},
-                            "foregroundColor": {
-                                "color": {
-                                    "rgbColor": {
-                                        "red": hpc[0],
-                                        "green": hpc[1],
-                                        "blue": hpc[2],
-                                    }
-                                }
-                            },
+                            "namedStyleType": "SUBTITLE"
                         },
-                        "fields": "fontSize,foregroundColor",
+                        "fields": "namedStyleType",
                     }
-                })
+                }
 
         # Handle tables - these need special processing
         # Tables are inserted as structures and require separate handling
         if conversion.tables:
-            table_requests = self._generate_table_requests(conversion, supp)
-            requests.extend(table_requests)
-
-        # Safety: drop style requests with an empty range (startIndex >= endIndex).
-        # Google Docs rejects these with "The range should not be empty" and aborts
-        # the whole batch. They style nothing, so removing them is a no-op for output.
-        # Zero-length formatted runs can arise from empty bold/italic spans in table
-        # cells (see _generate_table_requests).
-        def _has_empty_range(req: dict[str, Any]) -> bool:
-            for key in ("updateTextStyle", "updateParagraphStyle"):
-                rng = req.get(key, {}).get("range")
-                if rng and rng.get("startIndex", 0) >= rng.get("endIndex", 0):
-                    return True
-            return False
+            yield from self._generate_table_requests(conversion, supp, tabs)
 
-        requests = [r for r in requests if not _has_empty_range(r)]
-
-        return requests
-
-    def _generate_table_requests(self, conversion: ConversionResult, supp: list[int] | None = None) -> list[dict[str, Any]]:
+    def _generate_table_requests(
+        self,
+        conversion: ConversionResult,
+        supp: list[int] | None = None,
+        tabs: array[int] | None = None,
+    ) -> Iterator[dict[str, Any]]:
         """Generate batch requests for inserting tables.
 
         Tables in Google Docs require:
@@ -2207,30 +2484,71 @@ class GoogleDocsConverter:
         Args:
             conversion: Conversion result with table data
             supp: UTF-16 supplementary char offset table (built if not provided)
+            tabs: Sorted tab positions in plain_text (built if not provided)
 
-        Returns:
-            List of batch update requests for tables
+        Yields:
+            Batch update requests for tables
         """
-        requests = []
         if supp is None:
             supp = _build_utf16_offsets(conversion.plain_text)
+        if tabs is None:
+            tabs = conversion._tab_positions
+        if tabs is None:
+            tabs = _build_tab_positions(conversion.plain_text)
+
+        # Cell and text styles, built once per call and shared by every table
+        # of this call that uses them (never across calls)
+        sm = self.style_map
+        tbc = sm.table_border_color
+        th_bg = sm.table_header_bg
+        data_border = {
+            "color": {"color": {"rgbColor": {"red": tbc[0], "green": tbc[1], "blue": tbc[2]}}},
+            "width": {"magnitude": 0.5, "unit": "PT"},
+            "dashStyle": "DOT",
+        }
+        data_cell_style = {
+            "borderTop": data_border,
+            "borderBottom": data_border,
+            "borderLeft": data_border,
+            "borderRight": data_border,
+        }
+        header_bg_style = {
+            "backgroundColor": {
+                "color": {"rgbColor": {"red": th_bg[0], "green": th_bg[1], "blue": th_bg[2]}}
+            },
+        }
+        header_text_style = {
+            "foregroundColor": {
+                "color": {"rgbColor": {"red": tbc[0], "green": tbc[1], "blue": tbc[2]}}
+            },
+            "bold": True,
+        }
+        info_box_styles: dict[str | None, dict[str, Any]] = {}  # by box_type
+        bold_style = {"bold": True}
+        italic_style = {"italic": True}
+        # Single-spaced cell paragraphs with no space around them (admonition cells)
+        tight_paragraph_style = {
+            "lineSpacing": 100,
+            "spaceAbove": {"magnitude": 0, "unit": "PT"},
+            "spaceBelow": {"magnitude": 0, "unit": "PT"},
+        }
 
         # Process tables in reverse order to avoid index shifting issues
         # (inserting later tables first means earlier table indices stay valid)
         for table in reversed(conversion.tables):
             # Adjust index for tabs that were removed by list formatting
             # + UTF-16 supplementary char offset
-            tabs_before_table = conversion.plain_text[:table.insert_index].count('\t')
+            tabs_before_table = bisect_left(tabs, table.insert_index)
             adjusted_index = table.insert_index - tabs_before_table + supp[table.insert_index]
 
             # 1. Insert the table structure
-            requests.append({
+            yield {
                 "insertTable": {
                     "rows": table.num_rows,
                     "columns": table.num_cols,
                     "location": {"index": adjusted_index}
                 }
-            })
+            }
 
             # 2. Insert cell content and apply header formatting
             # After insertTable, we need to populate cells.
@@ -2240,116 +2558,52 @@ class GoogleDocsConverter:
             # - Each cell adds: 2 (for empty cell) + len(content)
             # - Each new row adds: 1 (for row boundary)
             #
-            # We insert content in REVERSE order (last cell first) so indices don't shift
-
-            cell_requests = []
-
-            # Calculate initial cell position
+            # We insert content in REVERSE order (last cell first) so indices don't shift.
+            #
+            # Each cell needs its own insertText: a single insertion cannot
+            # span cell boundaries (a "\n" only starts a new paragraph in the
+            # same cell).
+            #
             # After insertTable at index I:
             # - Table element at I
             # - Table start at I+1
             # - First row at I+2
             # - First cell at I+3
             # - First cell paragraph at I+4
+            #
+            # In the EMPTY table each cell is 2 chars (cell start + newline) and
+            # each row boundary adds 1, so cell (r, c) starts at
+            # base + r * row_stride + 2 * c. The FILLED table also counts the
+            # content of every earlier cell, which one forward pass tracks.
+            # Text is inserted at the empty-table positions, last cell first;
+            # formatting runs after all insertions, so it uses the filled-table
+            # positions.
             base_index = adjusted_index + 4
-
-            # Track cumulative offset as we calculate cell positions
-            # Each empty cell has 1 character (newline), each row end has 1 char
-            current_index = base_index
-
-            # Build a map of cell positions (before any content is added)
-            cell_positions = []
+            row_stride = 2 * table.num_cols + 1
+            # Only the first row's filled positions are read again (header
+            # styling and admonition cells), so only those are kept.
+            first_row_positions: list[int] = []
+            filled_cells: list[tuple[int, int, TableCell]] = []
+            fp_current = base_index
             for row_idx, row in enumerate(table.rows):
-                row_positions = []
+                row_start = base_index + row_idx * row_stride
                 for col_idx, cell in enumerate(row):
-                    row_positions.append(current_index)
-                    # Each cell has 2 chars: cell start + newline
-                    current_index += 2
-                # Row boundary
-                current_index += 1
-                cell_positions.append(row_positions)
-
-            # Build filled-table cell positions for formatting.
-            # After all text insertions, each cell occupies:
-            #   content_length + 2 (cell marker + paragraph \n)
-            # and each row boundary adds 1.
-            # These positions reflect where content ACTUALLY IS after
-            # batch processing, unlike cell_positions which are for the
-            # empty table (used only for reverse-order text insertion).
-            filled_positions: list[list[int]] = []
-            fp_current = adjusted_index + 4  # same base as cell_positions
-            for row in table.rows:
-                row_fp = []
-                for cell in row:
-                    row_fp.append(fp_current)
-                    fp_current += _utf16_len(cell.content) + 2
-                fp_current += 1  # row boundary
-                filled_positions.append(row_fp)
-
-            # Now generate requests in reverse order
-            # We go from last row to first, last column to first
-            # Also collect cell format requests to apply after text insertion
-            cell_format_requests = []
-
-            for row_idx in range(len(table.rows) - 1, -1, -1):
-                row = table.rows[row_idx]
-                for col_idx in range(len(row) - 1, -1, -1):
-                    cell = row[col_idx]
+                    if not row_idx:
+                        first_row_positions.append(fp_current)
                     if cell.content:
-                        # Use empty-table positions for text insertion (reverse order)
-                        cell_pos = cell_positions[row_idx][col_idx]
-                        cell_requests.append({
-                            "insertText": {
-                                "location": {"index": cell_pos},
-                                "text": cell.content
-                            }
-                        })
-
-                        # Emit formatting requests for bold/italic/link in cell content.
-                        # Use FILLED-table positions since these run after all insertions.
-                        filled_pos = filled_positions[row_idx][col_idx]
-                        for fmt in cell.format_ranges:
-                            abs_start = filled_pos + _utf16_pos(cell.content, fmt.start_index)
-                            abs_end = filled_pos + _utf16_pos(cell.content, fmt.end_index)
-                            if fmt.format_type == "bold":
-                                cell_format_requests.append({
-                                    "updateTextStyle": {
-                                        "range": {"startIndex": abs_start, "endIndex": abs_end},
-                                        "textStyle": {"bold": True},
-                                        "fields": "bold",
-                                    }
-                                })
-                            elif fmt.format_type == "italic":
-                                cell_format_requests.append({
-                                    "updateTextStyle": {
-                                        "range": {"startIndex": abs_start, "endIndex": abs_end},
-                                        "textStyle": {"italic": True},
-                                        "fields": "italic",
-                                    }
-                                })
-                            elif fmt.format_type == "link" and fmt.url:
-                                cell_format_requests.append({
-                                    "updateTextStyle": {
-                                        "range": {"startIndex": abs_start, "endIndex": abs_end},
-                                        "textStyle": {"link": {"url": fmt.url}},
-                                        "fields": "link",
-                                    }
-                                })
-                            elif fmt.format_type == "info_heading":
-                                # Info box section heading: Heading 3 with no spaceAbove
-                                # (blank line between sections provides separation instead)
-                                cell_format_requests.append({
-                                    "updateParagraphStyle": {
-                                        "range": {"startIndex": abs_start, "endIndex": abs_end},
-                                        "paragraphStyle": {
-                                            "namedStyleType": "HEADING_3",
-                                            "spaceAbove": {"magnitude": 0, "unit": "PT"},
-                                        },
-                                        "fields": "namedStyleType,spaceAbove",
-                                    }
-                                })
-
-            requests.extend(cell_requests)
+                        filled_cells.append((row_start + 2 * col_idx, fp_current, cell))
+                        fp_current += _utf16_len(cell.content)
+                    fp_current += 2
+                fp_current += 1  # Row boundary
+
+            # Insert text from the last cell to the first
+            for cell_pos, _, cell in reversed(filled_cells):
+                yield {
+                    "insertText": {
+                        "location": {"index": cell_pos},
+                        "text": cell.content
+                    }
+                }
 
             # 3. Apply border and background styling
             # Info boxes get colored SOLID borders + bg + padding;
@@ -2373,7 +2627,7 @@ class GoogleDocsConverter:
 
                 # Set fixed column widths
                 table_start = adjusted_index + 1
-                requests.append({
+                yield {
                     "updateTableColumnProperties": {
                         "tableStartLocation": {"index": table_start},
                         "columnIndices": [0],
@@ -2383,8 +2637,8 @@ class GoogleDocsConverter:
                         },
                         "fields": "widthType,width",
                     }
-                })
-                requests.append({
+                }
+                yield {
                     "updateTableColumnProperties": {
                         "tableStartLocation": {"index": table_start},
                         "columnIndices": [1],
@@ -2394,10 +2648,10 @@ class GoogleDocsConverter:
                         },
                         "fields": "widthType,width",
                     }
-                })
+                }
 
                 # Apply cell style to both cells (bg, borders, padding, alignment)
-                requests.append({
+                yield {
                     "updateTableCellStyle": {
                         "tableRange": {
                             "tableCellLocation": {
@@ -2424,14 +2678,14 @@ class GoogleDocsConverter:
                         },
                         "fields": "backgroundColor,borderTop,borderBottom,borderLeft,borderRight,paddingTop,paddingBottom,paddingLeft,paddingRight,contentAlignment",
                     }
-                })
+                }
 
                 # Style the icon cell: 18pt font size
                 icon_cell = table.rows[0][0]
                 if icon_cell.content:
-                    icon_pos = filled_positions[0][0]
+                    icon_pos = first_row_positions[0]
                     icon_end = icon_pos + _utf16_len(icon_cell.content)
-                    requests.append({
+                    yield {
                         "updateTextStyle": {
                             "range": {"startIndex": icon_pos, "endIndex": icon_end},
                             "textStyle": {
@@ -2439,58 +2693,34 @@ class GoogleDocsConverter:
                             },
                             "fields": "fontSize",
                         }
-                    })
+                    }
                     # Tight paragraph spacing for icon cell
-                    requests.append({
+                    yield {
                         "updateParagraphStyle": {
                             "range": {"startIndex": icon_pos, "endIndex": icon_end},
-                            "paragraphStyle": {
-                                "lineSpacing": 100,
-                                "spaceAbove": {"magnitude": 0, "unit": "PT"},
-                                "spaceBelow": {"magnitude": 0, "unit": "PT"},
-                            },
+                            "paragraphStyle": tight_paragraph_style,
                             "fields": "lineSpacing,spaceAbove,spaceBelow",
                         }
-                    })
+                    }
 
                 # Tight paragraph spacing for text cell
                 text_cell = table.rows[0][1] if len(table.rows[0]) > 1 else None
                 if text_cell and text_cell.content:
-                    text_pos = filled_positions[0][1]
+                    text_pos = first_row_positions[1]
                     text_end = text_pos + _utf16_len(text_cell.content)
-                    requests.append({
+                    yield {
                         "updateParagraphStyle": {
                             "range": {"startIndex": text_pos, "endIndex": text_end},
-                            "paragraphStyle": {
-                                "lineSpacing": 100,
-                                "spaceAbove": {"magnitude": 0, "unit": "PT"},
-                                "spaceBelow": {"magnitude": 0, "unit": "PT"},
-                            },
+                            "paragraphStyle": tight_paragraph_style,
                             "fields": "lineSpacing,spaceAbove,spaceBelow",
                         }
-                    })
+                    }
 
             elif table.is_info_box:
-                # Route colors based on box_type
-                if table.box_type == "legend":
-                    ib_bg = self.style_map.legend_box_bg
-                    ib_bd = self.style_map.legend_box_border
-                    ib_w = self.style_map.legend_box_border_width
-                elif table.box_type == "guidance":
-                    ib_bg = self.style_map.guidance_box_bg
-                    ib_bd = self.style_map.guidance_box_border
-                    ib_w = self.style_map.guidance_box_border_width
-                else:
-                    # Default: phase metadata (green)
-                    ib_bg = self.style_map.info_box_bg
-                    ib_bd = self.style_map.info_box_border
-                    ib_w = self.style_map.info_box_border_width
-                border_def = {
-                    "color": {"color": {"rgbColor": {"red": ib_bd[0], "green": ib_bd[1], "blue": ib_bd[2]}}},
-                    "width": {"magnitude": ib_w, "unit": "PT"},
-                    "dashStyle": "SOLID",
-                }
-                requests.append({
+                info_box_style = info_box_styles.get(table.box_type)
+                if info_box_style is None:
+                    info_box_style = info_box_styles[table.box_type] = self._info_box_cell_style(table.box_type)
+                yield {
                     "updateTableCellStyle": {
                         "tableRange": {
                             "tableCellLocation": {
@@ -2501,31 +2731,13 @@ class GoogleDocsConverter:
                             "rowSpan": table.num_rows,
                             "columnSpan": table.num_cols,
                         },
-                        "tableCellStyle": {
-                            "backgroundColor": {
-                                "color": {"rgbColor": {"red": ib_bg[0], "green": ib_bg[1], "blue": ib_bg[2]}}
-                            },
-                            "borderTop": border_def,
-                            "borderBottom": border_def,
-                            "borderLeft": border_def,
-                            "borderRight": border_def,
-                            "paddingTop": {"magnitude": 4, "unit": "PT"},
-                            "paddingBottom": {"magnitude": 4, "unit": "PT"},
-                            "paddingLeft": {"magnitude": 6, "unit": "PT"},
-                            "paddingRight": {"magnitude": 6, "unit": "PT"},
-                        },
+                        "tableCellStyle": info_box_style,
                         "fields": "backgroundColor,borderTop,borderBottom,borderLeft,borderRight,paddingTop,paddingBottom,paddingLeft,paddingRight",
                     }
-                })
+                }
             else:
                 # Regular data table: dotted dark charcoal borders
-                tbc = self.style_map.table_border_color
-                border_def = {
-                    "color": {"color": {"rgbColor": {"red": tbc[0], "green": tbc[1], "blue": tbc[2]}}},
-                    "width": {"magnitude": 0.5, "unit": "PT"},
-                    "dashStyle": "DOT",
-                }
-                requests.append({
+                yield {
                     "updateTableCellStyle": {
                         "tableRange": {
                             "tableCellLocation": {
@@ -2536,22 +2748,15 @@ class GoogleDocsConverter:
                             "rowSpan": table.num_rows,
                             "columnSpan": table.num_cols,
                         },
-                        "tableCellStyle": {
-                            "borderTop": border_def,
-                            "borderBottom": border_def,
-                            "borderLeft": border_def,
-                            "borderRight": border_def,
-                        },
+                        "tableCellStyle": data_cell_style,
                         "fields": "borderTop,borderBottom,borderLeft,borderRight",
                     }
-                })
+                }
 
             # 4. Style header row (data tables only, not info boxes)
             if not table.is_info_box and table.num_rows > 0 and table.rows[0][0].is_header:
-                th_bg = self.style_map.table_header_bg
-                tbc = self.style_map.table_border_color
                 # Apply header background
-                requests.append({
+                yield {
                     "updateTableCellStyle": {
                         "tableRange": {
                             "tableCellLocation": {
@@ -2562,39 +2767,171 @@ class GoogleDocsConverter:
                             "rowSpan": 1,
                             "columnSpan": table.num_cols,
                         },
-                        "tableCellStyle": {
-                            "backgroundColor": {
-                                "color": {"rgbColor": {"red": th_bg[0], "green": th_bg[1], "blue": th_bg[2]}}
-                            },
-                        },
+                        "tableCellStyle": header_bg_style,
                         "fields": "backgroundColor",
                     }
-                })
+                }
 
-                # Apply bold and dark charcoal text to header cells individually.
-                # Use filled_positions which account for all cell content.
-                for col_idx, cell in enumerate(table.rows[0]):
+                # Apply bold and dark charcoal text to header cells individually
+                # (one range per cell: a range across cells would cover the cell
+                # boundaries). Use the filled positions, which account for all cell content.
+                for hdr_start, cell in zip(first_row_positions, table.rows[0], strict=True):
                     if cell.content:
-                        hdr_start = filled_positions[0][col_idx]
-                        requests.append({
+                        yield {
                             "updateTextStyle": {
                                 "range": {
                                     "startIndex": hdr_start,
                                     "endIndex": hdr_start + _utf16_len(cell.content),
                                 },
-                                "textStyle": {
-                                    "foregroundColor": {
-                                        "color": {"rgbColor": {"red": tbc[0], "green": tbc[1], "blue": tbc[2]}}
-                                    },
-                                    "bold": True,
-                                },
+                                "textStyle": header_text_style,
                                 "fields": "foregroundColor,bold",
                             }
-                        })
+                        }
 
             # 5. Apply inline formatting (bold, italic, links) within cells
-            # These run after text insertion so the positions are valid
-            if cell_format_requests:
-                requests.extend(cell_format_requests)
+            # These run after text insertion, so they use FILLED-table positions
+            for _, filled_pos, cell in reversed(filled_cells):
+                for fmt in cell.format_ranges:
+                    abs_start = filled_pos + _utf16_pos(cell.content, fmt.start_index)
+                    abs_end = filled_pos + _utf16_pos(cell.content, fmt.end_index)
+                    if fmt.format_type == "bold":
+                        yield {
+                            "updateTextStyle": {
+                                "range": {"startIndex": abs_start, "endIndex": abs_end},
+                                "textStyle": bold_style,
+                                "fields": "bold",
+                            }
+                        }
+                    elif fmt.format_type == "italic":
+                        yield {
+                            "updateTextStyle": {
+                                "range": {"startIndex": abs_start, "endIndex": abs_end},
+                                "textStyle": italic_style,
+                                "fields": "italic",
+                            }
+                        }
+                    elif fmt.format_type == "link" and fmt.url:
+                        yield {
+                            "updateTextStyle": {
+                                "range": {"startIndex": abs_start, "endIndex": abs_end},
+                                "textStyle": {"link": {"url": fmt.url}},
+                                "fields": "link",
+                            }
+                        }
+                    elif fmt.format_type == "info_heading":
+                        # Info box section heading: Heading 3 with no spaceAbove
+                        # (blank line between sections provides separation instead)
+                        yield {
+                            "updateParagraphStyle": {
+                                "range": {"startIndex": abs_start, "endIndex": abs_end},
+                                "paragraphStyle": {
+                                    "namedStyleType": "HEADING_3",
+                                    "spaceAbove": {"magnitude": 0, "unit": "PT"},
+                                },
+                                "fields": "namedStyleType,spaceAbove",
+                            }
+                        }
+
+    def _info_box_cell_style(self, box_type: str | None) -> dict[str, Any]:
+        """Build the tableCellStyle for an info box, routing colors by box_type.
+
+        Args:
+            box_type: "legend", "guidance", or None/other for phase metadata
+
+        Returns:
+            Cell style with background, SOLID borders and padding
+        """
+        sm = self.style_map
+        if box_type == "legend":
+            ib_bg, ib_bd, ib_w = sm.legend_box_bg, sm.legend_box_border, sm.legend_box_border_width
+        elif box_type == "guidance":
+            ib_bg, ib_bd, ib_w = sm.guidance_box_bg, sm.guidance_box_border, sm.guidance_box_border_width
+        else:
+            # Default: phase metadata (green)
+            ib_bg, ib_bd, ib_w = sm.info_box_bg, sm.info_box_border, sm.info_box_border_width
+        border_def = {
+            "color": {"color": {"rgbColor": {"red": ib_bd[0], "green": ib_bd[1], "blue": ib_bd[2]}}},
+            "width": {"magnitude": ib_w, "unit": "PT"},
+            "dashStyle": "SOLID",
+        }
+        return {
+            "backgroundColor": {
+                "color": {"rgbColor": {"red": ib_bg[0], "green": ib_bg[1], "blue": ib_bg[2]}}
+            },
+            "borderTop": border_def,
+            "borderBottom": border_def,
+            "borderLeft": border_def,
+            "borderRight": border_def,
+            "paddingTop": {"magnitude": 4, "unit": "PT"},
+            "paddingBottom": {"magnitude": 4, "unit": "PT"},
+            "paddingLeft": {"magnitude": 6, "unit": "PT"},
+            "paddingRight": {"magnitude": 6, "unit": "PT"},
+        }
+
+    # Block token type -> handler(self, tokens, index, result) returning the next
+    # index. Built once for the class (most frequent types first) rather than
+    # per instance, where bound methods would tie each converter into a cycle.
+    _BLOCK_HANDLERS: ClassVar[dict[str, _BlockHandler]] = {
+        "paragraph_open": _process_top_level_paragraph,
+        "heading_open": _process_heading_section,
+        "bullet_list_open": lambda self, tokens, i, result: self._process_list(
+            tokens, i, result, ordered=False
+        ),
+        "ordered_list_open": lambda self, tokens, i, result: self._process_list(
+            tokens, i, result, ordered=True
+        ),
+        "fence": lambda self, tokens, i, result: self._process_code_block(tokens[i], i, result),
+        "code_block": lambda self, tokens, i, result: self._process_code_block(
+            tokens[i], i, result
+        ),
+        "table_open": _process_table,
+        "blockquote_open": _process_blockquote,
+        "hr": lambda self, tokens, i, result: self._process_hr(tokens[i], i, result),
+    }
+
+
+class IncrementalConverter:
+    """Convert a document that is re-submitted as it grows.
+
+    Streaming callers (live editors, LLM output) pass the full text after
+    every change. The source is split at stable block boundaries and the
+    tokens of leading blocks that are unchanged since the previous update
+    are reused, so only the changed tail is re-parsed by markdown-it. The
+    rendering walk still covers the whole token list because section
+    classification, footnote detection and list grouping are document-wide.
+    """
+
+    def __init__(self, converter: GoogleDocsConverter | None = None):
+        """Initialize incremental converter.
+
+        Args:
+            converter: Converter used for parsing and rendering. Its
+                generate_batch_requests() applies to the returned results.
+        """
+        self.converter = converter or GoogleDocsConverter()
+        self._blocks: list[tuple[str, list[Token]]] = []  # (source, parsed tokens)
+
+    def update(self, markdown: str) -> ConversionResult:
+        """Convert the current full text of the document.
+
+        Args:
+            markdown: Complete markdown text as of this update
+
+        Returns:
+            ConversionResult for the whole document
+        """
+        sources = _split_stable_blocks(_strip_frontmatter(markdown))
+
+        reused = 0
+        for (previous, _), source in zip(self._blocks, sources, strict=False):
+            if previous != source:
+                break
+            reused += 1
+
+        blocks = self._blocks[:reused]
+        for source in sources[reused:]:
+            blocks.append((source, self.converter.md.parse(source)))
+        self._blocks = blocks
 
-        return requests
+        tokens = [token for _, block_tokens in blocks for token in block_tokens]
+        return self.converter._convert_tokens(tokens)
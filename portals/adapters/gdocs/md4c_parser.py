@@ -0,0 +1,297 @@
+"""md4c-backed markdown parser producing markdown-it compatible tokens.
+
+md4c is a C parser driven by SAX-style callbacks (via the optional pymd4c
+package). Md4cParser.parse() turns those callbacks into the same flat
+markdown-it Token stream GoogleDocsConverter walks, so it can stand in for
+MarkdownIt().enable('table') on the parse stage, which dominates conversion
+time for large documents.
+
+Known differences from markdown-it:
+- md4c reports no source offsets, so ``inline`` token content is rebuilt
+  from the parsed spans (``__x__`` comes back as ``**x**``, escapes and
+  entities are resolved).
+- Image alt text is not collected.
+- md4c expands tabs in the leading indentation of code block lines.
+"""
+
+from __future__ import annotations
+
+import html
+from typing import Any
+
+from markdown_it.token import Token
+
+try:
+    import md4c
+except ImportError:  # pragma: no cover - exercised only without pymd4c
+    md4c = None
+
+
+def md4c_available() -> bool:
+    """Return True if the optional pymd4c package is installed."""
+    return md4c is not None
+
+
+def _attr_text(parts: list[tuple[Any, str]] | None) -> str:
+    """Join an md4c attribute (list of (TextType, text) pairs) into a string."""
+    if not parts:
+        return ""
+    return "".join(
+        html.unescape(text) if text_type == md4c.TextType.ENTITY else text
+        for text_type, text in parts
+    )
+
+
+class Md4cParser:
+    """Parse markdown with md4c into a markdown-it style token list."""
+
+    def __init__(self) -> None:
+        """Initialize parser.
+
+        Raises:
+            ImportError: If pymd4c is not installed
+        """
+        if md4c is None:
+            raise ImportError("md4c parser requires the pymd4c package (pip install pymd4c)")
+        self._parser = md4c.GenericParser(md4c.MD_FLAG_TABLES)
+
+    def parse(self, src: str) -> list[Token]:
+        """Parse markdown source.
+
+        Args:
+            src: Markdown text
+
+        Returns:
+            Flat list of block tokens; inline content is in ``inline`` tokens'
+            children, as produced by markdown-it
+        """
+        builder = _TokenBuilder()
+        self._parser.parse(
+            src,
+            builder.enter_block,
+            builder.leave_block,
+            builder.enter_span,
+            builder.leave_span,
+            builder.text,
+        )
+        return builder.tokens
+
+
+# md4c block type -> (markdown-it open type, close type, tag)
+_CONTAINER_BLOCKS: dict[Any, tuple[str, str, str]] = {}
+if md4c is not None:
+    _CONTAINER_BLOCKS = {
+        md4c.BlockType.QUOTE: ("blockquote_open", "blockquote_close", "blockquote"),
+        md4c.BlockType.UL: ("bullet_list_open", "bullet_list_close", "ul"),
+        md4c.BlockType.OL: ("ordered_list_open", "ordered_list_close", "ol"),
+        md4c.BlockType.LI: ("list_item_open", "list_item_close", "li"),
+        md4c.BlockType.TABLE: ("table_open", "table_close", "table"),
+        md4c.BlockType.THEAD: ("thead_open", "thead_close", "thead"),
+        md4c.BlockType.TBODY: ("tbody_open", "tbody_close", "tbody"),
+        md4c.BlockType.TR: ("tr_open", "tr_close", "tr"),
+    }
+
+
+# Inline child type -> approximate markdown source, used to rebuild the raw
+# ``content`` markdown-it gives inline tokens (md4c reports no source offsets)
+_INLINE_MARKUP = {
+    "text": "{c.content}",
+    "strong_open": "**",
+    "strong_close": "**",
+    "em_open": "*",
+    "em_close": "*",
+    "code_inline": "`{c.content}`",
+    "link_open": "[",
+    "link_close": "]({c.meta[href]})",
+    "softbreak": "\n",
+    "hardbreak": "\n",
+    "html_inline": "{c.content}",
+    "image": "![{c.content}]({c.attrs[src]})",
+}
+
+
+class _TokenBuilder:
+    """Accumulate md4c callbacks into markdown-it tokens."""
+
+    def __init__(self) -> None:
+        self.tokens: list[Token] = []
+        # Inline run of the current leaf block (None outside leaf blocks)
+        self._children: list[Token] | None = None
+        self._text: list[str] = []  # Pending text, merged into one text token
+        self._leaf_close: Token | None = None  # Close token of the open leaf block
+        self._in_tight_item = False  # Directly inside a tight list item
+        self._tight_lists: list[bool] = []
+        self._code: list[str] | None = None  # Code block or code span text
+        self._code_block: Token | None = None
+        self._image_depth = 0  # Inside an image: alt text is not emitted
+
+    # -- inline helpers -------------------------------------------------
+
+    def _flush_text(self) -> None:
+        if self._text and self._children is not None:
+            self._children.append(Token("text", "", 0, content="".join(self._text)))
+        self._text = []
+
+    def _open_leaf(self, open_type: str, close_type: str, tag: str, hidden: bool = False) -> None:
+        self.tokens.append(Token(open_type, tag, 1, block=True, hidden=hidden))
+        self._children = []
+        self._leaf_close = Token(close_type, tag, -1, block=True, hidden=hidden)
+
+    def _close_leaf(self) -> None:
+        if self._children is None or self._leaf_close is None:
+            return
+        self._flush_text()
+        children = self._children
+        content = "".join(_INLINE_MARKUP.get(c.type, "").format(c=c) for c in children)
+        self.tokens.append(Token("inline", "", 0, children=children, content=content, block=True))
+        self.tokens.append(self._leaf_close)
+        self._children = None
+        self._leaf_close = None
+
+    def _ensure_tight_paragraph(self) -> None:
+        # Tight list items carry their text directly; markdown-it wraps it in
+        # a hidden paragraph, which the converter relies on
+        if self._children is None and self._in_tight_item:
+            self._open_leaf("paragraph_open", "paragraph_close", "p", hidden=True)
+
+    # -- md4c callbacks -------------------------------------------------
+
+    def enter_block(self, block_type: Any, details: dict[str, Any]) -> None:
+        bt = md4c.BlockType
+        if self._in_tight_item:
+            self._close_leaf()
+        self._in_tight_item = False
+
+        if block_type == bt.DOC:
+            return
+        if block_type in (bt.UL, bt.OL):
+            self._tight_lists.append(bool(details.get("is_tight")))
+        if block_type in _CONTAINER_BLOCKS:
+            open_type, _, tag = _CONTAINER_BLOCKS[block_type]
+            self.tokens.append(Token(open_type, tag, 1, block=True))
+            if block_type == bt.LI:
+                self._in_tight_item = bool(self._tight_lists and self._tight_lists[-1])
+        elif block_type == bt.H:
+            tag = f"h{details['level']}"
+            self._open_leaf("heading_open", "heading_close", tag)
+        elif block_type == bt.P:
+            self._open_leaf("paragraph_open", "paragraph_close", "p")
+        elif block_type in (bt.TH, bt.TD):
+            tag = "th" if block_type == bt.TH else "td"
+            self._open_leaf(f"{tag}_open", f"{tag}_close", tag)
+        elif block_type == bt.CODE:
+            fenced = details.get("fence_char") is not None
+            self._code = []
+            self._code_block = Token(
+                "fence" if fenced else "code_block",
+                "code",
+                0,
+                info=_attr_text(details.get("info")) if fenced else "",
+                block=True,
+            )
+        elif block_type == bt.HTML:
+            self._code = []
+            self._code_block = Token("html_block", "", 0, block=True)
+        elif block_type == bt.HR:
+            self.tokens.append(Token("hr", "hr", 0, block=True))
+
+    def leave_block(self, block_type: Any, details: dict[str, Any]) -> None:
+        bt = md4c.BlockType
+        if block_type in (bt.H, bt.P, bt.TH, bt.TD) or self._in_tight_item:
+            self._close_leaf()
+        self._in_tight_item = False
+
+        if block_type in _CONTAINER_BLOCKS:
+            _, close_type, tag = _CONTAINER_BLOCKS[block_type]
+            self.tokens.append(Token(close_type, tag, -1, block=True))
+            if block_type in (bt.UL, bt.OL):
+                self._tight_lists.pop()
+        elif block_type in (bt.CODE, bt.HTML) and self._code_block is not None:
+            self._code_block.content = "".join(self._code or [])
+            self.tokens.append(self._code_block)
+            self._code_block = None
+            self._code = None
+
+        # Text after a nested list inside a tight item belongs to that item
+        if block_type in (bt.UL, bt.OL) and self.tokens:
+            parent_tight = bool(self._tight_lists and self._tight_lists[-1])
+            self._in_tight_item = parent_tight
+
+    def enter_span(self, span_type: Any, details: dict[str, Any]) -> None:
+        st = md4c.SpanType
+        if self._image_depth:
+            if span_type == st.IMG:
+                self._image_depth += 1
+            return
+        self._ensure_tight_paragraph()
+        if self._children is None:
+            return
+        self._flush_text()
+        if span_type == st.STRONG:
+            # markdown-it leaves an empty text token where a ** delimiter run
+            # was consumed unless it merged into neighbouring text
+            if not self._children or self._children[-1].type != "text":
+                self._children.append(Token("text", "", 0))
+            self._children.append(Token("strong_open", "strong", 1, markup="**"))
+        elif span_type == st.EM:
+            self._children.append(Token("em_open", "em", 1, markup="*"))
+        elif span_type == st.A:
+            self._children.append(
+                Token("link_open", "a", 1, attrs={"href": _attr_text(details.get("href"))})
+            )
+        elif span_type == st.CODE:
+            self._code = []
+        elif span_type == st.IMG:
+            self._image_depth = 1
+            self._children.append(
+                Token("image", "img", 0, attrs={"src": _attr_text(details.get("src"))})
+            )
+
+    def leave_span(self, span_type: Any, details: dict[str, Any]) -> None:
+        st = md4c.SpanType
+        if self._image_depth:
+            self._image_depth -= 1
+            return
+        if self._children is None:
+            return
+        self._flush_text()
+        if span_type == st.STRONG:
+            self._children.append(Token("strong_close", "strong", -1, markup="**"))
+            self._text = [""]
+        elif span_type == st.EM:
+            self._children.append(Token("em_close", "em", -1, markup="*"))
+        elif span_type == st.A:
+            self._children.append(
+                Token("link_close", "a", -1, meta={"href": _attr_text(details.get("href"))})
+            )
+        elif span_type == st.CODE:
+            self._children.append(Token("code_inline", "code", 0, content="".join(self._code or [])))
+            self._code = None
+
+    def text(self, text_type: Any, text: str) -> None:
+        tt = md4c.TextType
+        if self._code_block is not None:
+            self._code.append(text)  # type: ignore[union-attr]
+            return
+        if self._image_depth:
+            return
+        self._ensure_tight_paragraph()
+        if self._children is None:
+            return
+        if self._code is not None:
+            self._code.append(text)
+        elif text_type == tt.NORMAL:
+            self._text.append(text)
+        elif text_type == tt.ENTITY:
+            self._text.append(html.unescape(text))
+        elif text_type == tt.NULLCHAR:
+            self._text.append("�")
+        elif text_type == tt.SOFTBR:
+            self._flush_text()
+            self._children.append(Token("softbreak", "br", 0))
+        elif text_type == tt.BR:
+            self._flush_text()
+            self._children.append(Token("hardbreak", "br", 0))
+        elif text_type == tt.HTML:
+            self._flush_text()
+            self._children.append(Token("html_inline", "", 0, content=text))
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 from datetime import datetime
 from typing import Any
 
@@ -135,8 +136,6 @@ class NotionAdapter(DocumentAdapter):
             markdown = self.converter.blocks_to_markdown(blocks)
 
             # Calculate hash
-            import hashlib
-
             content_hash = hashlib.sha256(markdown.encode("utf-8")).hexdigest()
 
             return RemoteMetadata(
@@ -3,15 +3,24 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 
-from portals.adapters.gdocs.adapter import GoogleDocsAdapter
 from portals.adapters.local import LocalFileAdapter
-from portals.core.pairing import PairingManager
+from portals.core.pairing import Pairing, PairingManager
 from portals.utils.logging import get_logger
 
+if TYPE_CHECKING:
+    # The Google API client is slow to import; commands import it when they run
+    from portals.adapters.gdocs.adapter import GoogleDocsAdapter
+
 logger = get_logger(__name__)
 
 
@@ -54,6 +63,8 @@ def pair(ctx: click.Context, file_path: str, account: str, create: bool) -> None
             doc = await local_adapter.read(f"file://{file_path_abs}")
 
             # Create or select Google Doc
+            from portals.adapters.gdocs.adapter import GoogleDocsAdapter
+
             gdocs_adapter = GoogleDocsAdapter(account=account)
 
             if create:
@@ -156,115 +167,200 @@ def unpair(ctx: click.Context, file_path: str) -> None:
         raise click.Abort() from e
 
 
-@click.command()
-@click.argument("file_path", type=click.Path(exists=True, file_okay=True, dir_okay=False))
-@click.pass_context
-def push(ctx: click.Context, file_path: str) -> None:
-    """Push local changes to Google Docs.
+def _content_hash(content: str) -> str:
+    """Return the SHA-256 hex digest of markdown content, as LocalFileAdapter computes it."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
 
-    Reads the local markdown file and updates the paired Google Doc.
 
-    \b
-    Example:
-      portals push memo.md
+# Syncs one paired file and returns its new content hash, appending the lines
+# to report for it (a file's lines are echoed together once it is done)
+_FileSync = Callable[
+    [LocalFileAdapter, "GoogleDocsAdapter", Path, Pairing, list[str]], Awaitable[str]
+]
+
+
+def _sync_paired_files(file_paths: tuple[str, ...], sync_file: _FileSync, action: str) -> int:
+    """Sync paired files, running each account's files in its own thread.
+
+    Files paired with the same account are synced in order by one
+    GoogleDocsAdapter, so credentials are loaded and the API service is built
+    once per account. The Google API client is blocking and its HTTP connection
+    must not be shared between threads, so when several accounts are involved
+    each account's files run on a separate thread.
+
+    Args:
+        file_paths: Local markdown files to sync
+        sync_file: Coroutine that syncs one file
+        action: "push" or "pull", for failure messages and log events
+
+    Returns:
+        Number of files that failed
     """
-    async def run_push() -> None:
+    from portals.adapters.gdocs.adapter import GoogleDocsAdapter
+
+    pairing_mgr = PairingManager()
+    state_lock = threading.Lock()  # update_sync_state rewrites the whole store
+    groups: dict[str | None, list[tuple[Path, Pairing]]] = {}
+    failed = 0
+
+    for file_path in file_paths:
         file_path_abs = Path(file_path).resolve()
+        pairing = pairing_mgr.get_pairing(str(file_path_abs))
+        if not pairing or pairing.platform != "gdocs":
+            click.echo(f"❌ No Google Docs pairing found for {file_path_abs.name}")
+            click.echo("   Use 'portals pair' first\n")
+            failed += 1
+            continue
+        groups.setdefault(pairing.account, []).append((file_path_abs, pairing))
+
+    def sync_group(account: str | None, files: list[tuple[Path, Pairing]]) -> int:
+        async def run_group() -> int:
+            local_adapter = LocalFileAdapter()
+            gdocs_adapter = GoogleDocsAdapter(account=account)
+            group_failed = 0
+
+            for file_path_abs, pairing in files:
+                lines: list[str] = []
+                try:
+                    local_hash = await sync_file(
+                        local_adapter, gdocs_adapter, file_path_abs, pairing, lines
+                    )
+                    with state_lock:
+                        pairing_mgr.update_sync_state(
+                            str(file_path_abs),
+                            local_hash=local_hash,
+                            remote_hash=local_hash
+                        )
+                except Exception as e:
+                    lines.append(f"\n❌ {action.capitalize()} failed for {file_path_abs.name}: {e}")
+                    logger.error(f"{action}_failed", file=str(file_path_abs), error=str(e))
+                    group_failed += 1
+                click.echo("\n".join(lines) + "\n")
+
+            return group_failed
+
+        return asyncio.run(run_group())
+
+    if len(groups) == 1:
+        failed += sync_group(*next(iter(groups.items())))
+    elif groups:
+        with ThreadPoolExecutor(max_workers=len(groups)) as pool:
+            failed += sum(pool.map(sync_group, groups.keys(), groups.values()))
+
+    if failed and len(file_paths) > 1:
+        click.echo(f"❌ {failed} of {len(file_paths)} files failed to {action}")
+    return failed
+
+
+async def _push_file(
+    local_adapter: LocalFileAdapter,
+    gdocs_adapter: GoogleDocsAdapter,
+    file_path_abs: Path,
+    pairing: Pairing,
+    lines: list[str],
+    *,
+    force: bool = False,
+) -> str:
+    """Push one local file to its paired Google Doc.
+
+    Unless force is set, the write is skipped when the content matches what was
+    last synced.
+    """
+    lines.append(f"⬆️  Pushing {file_path_abs.name} to Google Docs")
+    lines.append(f"   Account: {pairing.account}")
 
-        try:
-            # Get pairing
-            pairing_mgr = PairingManager()
-            pairing = pairing_mgr.get_pairing(str(file_path_abs))
+    # Read local file (LocalFileAdapter.read already hashed the content)
+    doc = await local_adapter.read(f"file://{file_path_abs}")
+    local_hash = doc.content_hash or _content_hash(doc.content)
 
-            if not pairing or pairing.platform != "gdocs":
-                click.echo(f"❌ No Google Docs pairing found for {file_path_abs.name}")
-                click.echo("   Use 'portals pair' first")
-                raise click.Abort()
+    if not force and pairing.local_hash == local_hash == pairing.remote_hash:
+        lines.append("\n✅ Already up to date (use --force to push anyway)")
+        return local_hash
 
-            click.echo(f"⬆️  Pushing {file_path_abs.name} to Google Docs")
-            click.echo(f"   Account: {pairing.account}")
+    # Update Google Doc
+    uri = f"gdocs://{pairing.remote_id}"
+    await gdocs_adapter.write(uri, doc)
 
-            # Read local file
-            local_adapter = LocalFileAdapter()
-            doc = await local_adapter.read(f"file://{file_path_abs}")
+    lines.append("\n✅ Pushed to Google Docs!")
+    lines.append(f"   🔗 https://docs.google.com/document/d/{pairing.remote_id}/edit")
 
-            # Update Google Doc
-            gdocs_adapter = GoogleDocsAdapter(account=pairing.account)
-            uri = f"gdocs://{pairing.remote_id}"
-            await gdocs_adapter.write(uri, doc)
-
-            # Update sync state
-            import hashlib
-            local_hash = hashlib.sha256(doc.content.encode()).hexdigest()
-            pairing_mgr.update_sync_state(
-                str(file_path_abs),
-                local_hash=local_hash,
-                remote_hash=local_hash
-            )
+    return local_hash
 
-            click.echo(f"\n✅ Pushed to Google Docs!")
-            click.echo(f"   🔗 https://docs.google.com/document/d/{pairing.remote_id}/edit")
 
-        except Exception as e:
-            click.echo(f"\n❌ Push failed: {e}")
-            logger.error("push_failed", error=str(e))
-            raise click.Abort() from e
+async def _pull_file(
+    local_adapter: LocalFileAdapter,
+    gdocs_adapter: GoogleDocsAdapter,
+    file_path_abs: Path,
+    pairing: Pairing,
+    lines: list[str],
+) -> str:
+    """Pull one paired Google Doc into its local file."""
+    lines.append(f"⬇️  Pulling {file_path_abs.name} from Google Docs")
+    lines.append(f"   Account: {pairing.account}")
+
+    # Read Google Doc
+    uri = f"gdocs://{pairing.remote_id}"
+    doc = await gdocs_adapter.read(uri)
 
-    asyncio.run(run_push())
+    # Write to local file
+    await local_adapter.write(f"file://{file_path_abs}", doc)
+
+    lines.append("\n✅ Pulled from Google Docs!")
+    lines.append(f"   📄 Updated: {file_path_abs}")
+
+    return _content_hash(doc.content)
 
 
 @click.command()
-@click.argument("file_path", type=click.Path(exists=False, file_okay=True, dir_okay=False))
+@click.argument(
+    "file_paths",
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Push even if the file is unchanged since the last sync",
+)
 @click.pass_context
-def pull(ctx: click.Context, file_path: str) -> None:
-    """Pull changes from Google Docs to local file.
+def push(ctx: click.Context, file_paths: tuple[str, ...], force: bool) -> None:
+    """Push local changes to Google Docs.
 
-    Reads the paired Google Doc and updates the local markdown file.
+    Reads each local markdown file and updates its paired Google Doc. Files
+    unchanged since the last sync are skipped. Files paired with the same
+    account share one authenticated session; different accounts are pushed
+    concurrently.
 
     \b
-    Example:
-      portals pull memo.md
+    Examples:
+      portals push memo.md
+      portals push docs/*.md
+      portals push memo.md --force
     """
-    async def run_pull() -> None:
-        file_path_abs = Path(file_path).resolve()
-
-        try:
-            # Get pairing
-            pairing_mgr = PairingManager()
-            pairing = pairing_mgr.get_pairing(str(file_path_abs))
-
-            if not pairing or pairing.platform != "gdocs":
-                click.echo(f"❌ No Google Docs pairing found for {file_path_abs.name}")
-                click.echo("   Use 'portals pair' first")
-                raise click.Abort()
-
-            click.echo(f"⬇️  Pulling {file_path_abs.name} from Google Docs")
-            click.echo(f"   Account: {pairing.account}")
-
-            # Read Google Doc
-            gdocs_adapter = GoogleDocsAdapter(account=pairing.account)
-            uri = f"gdocs://{pairing.remote_id}"
-            doc = await gdocs_adapter.read(uri)
+    if _sync_paired_files(file_paths, partial(_push_file, force=force), "push"):
+        raise click.Abort()
 
-            # Write to local file
-            local_adapter = LocalFileAdapter()
-            await local_adapter.write(f"file://{file_path_abs}", doc)
-
-            # Update sync state
-            import hashlib
-            local_hash = hashlib.sha256(doc.content.encode()).hexdigest()
-            pairing_mgr.update_sync_state(
-                str(file_path_abs),
-                local_hash=local_hash,
-                remote_hash=local_hash
-            )
 
-            click.echo(f"\n✅ Pulled from Google Docs!")
-            click.echo(f"   📄 Updated: {file_path_abs}")
+@click.command()
+@click.argument(
+    "file_paths",
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=False, file_okay=True, dir_okay=False),
+)
+@click.pass_context
+def pull(ctx: click.Context, file_paths: tuple[str, ...]) -> None:
+    """Pull changes from Google Docs to local files.
 
-        except Exception as e:
-            click.echo(f"\n❌ Pull failed: {e}")
-            logger.error("pull_failed", error=str(e))
-            raise click.Abort() from e
+    Reads each paired Google Doc and updates its local markdown file. Files
+    paired with the same account share one authenticated session; different
+    accounts are pulled concurrently.
 
-    asyncio.run(run_pull())
+    \b
+    Examples:
+      portals pull memo.md
+      portals pull memo.md report.md
+    """
+    if _sync_paired_files(file_paths, _pull_file, "pull"):
+        raise click.Abort()
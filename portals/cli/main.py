@@ -3,23 +3,22 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import os
 from pathlib import Path
 
 import click
 
 from portals import __version__
-from portals.adapters.local import LocalFileAdapter
-from portals.adapters.notion.adapter import NotionAdapter
-from portals.core.conflict_resolver import ConflictResolver, ResolutionStrategy
-from portals.core.diff_generator import DiffGenerator
 from portals.core.metadata_store import MetadataStore
 from portals.core.models import SyncPair
-from portals.core.sync_engine import SyncEngine
-from portals.services.init_service import InitService
-from portals.services.sync_service import SyncService
 from portals.utils.logging import configure_logging, get_logger
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - exercised only without uvloop (e.g. on Windows)
+    uvloop = None
+
 logger = get_logger(__name__)
 
 
@@ -73,6 +72,10 @@ def cli(ctx: click.Context, log_level: str, log_format: str) -> None:
     # Configure logging
     configure_logging(level=log_level, format=log_format)
 
+    # Run every command's asyncio.run() on uvloop when it is installed
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     logger.debug("cli_started", version=__version__, log_level=log_level)
 
 
@@ -139,7 +142,9 @@ def init(
         if dry_run:
             click.echo("   (DRY RUN - no pages will be created)")
 
-        # Create init service
+        # Create init service (imported here: the Notion SDK is slow to import)
+        from portals.services.init_service import InitService
+
         init_service = InitService(
             base_path=base_path,
             notion_token=notion_token,
@@ -161,8 +166,8 @@ def init(
                     click.echo("   Run 'docsync watch' to auto-sync changes")
             else:
                 click.echo("\n⚠️  Initialization completed with errors:")
-                for error in result.errors:
-                    click.echo(f"   - {error}")
+                if result.errors:
+                    click.echo("\n".join(f"   - {error}" for error in result.errors))
 
         except Exception as e:
             click.echo(f"\n❌ Initialization failed: {e}")
@@ -188,6 +193,8 @@ def status(ctx: click.Context, path: str) -> None:
         base_path = Path(path).resolve()
         notion_token = os.getenv("NOTION_API_TOKEN")
 
+        from portals.services.sync_service import SyncService
+
         sync_service = SyncService(
             base_path=base_path,
             notion_token=notion_token,
@@ -215,8 +222,7 @@ def status(ctx: click.Context, path: str) -> None:
             conflicts = [p for p in status_info["pairs"] if p["has_conflict"]]
             if conflicts:
                 click.echo(f"\n⚠️  {len(conflicts)} pairs with conflicts:")
-                for pair in conflicts:
-                    click.echo(f"   - {pair['local_path']}")
+                click.echo("\n".join(f"   - {pair['local_path']}" for pair in conflicts))
 
             # Show recent syncs
             click.echo(f"\n✅ {pairs_count - len(conflicts)} pairs synced")
@@ -296,6 +302,8 @@ def sync(
             click.echo("   Set NOTION_API_TOKEN environment variable")
             raise click.Abort()
 
+        from portals.services.sync_service import SyncService
+
         sync_service = SyncService(
             base_path=base_path,
             notion_token=notion_token,
@@ -320,6 +328,19 @@ def sync(
                 click.echo("🔄 Syncing all documents...")
                 summary = await sync_service.sync_all(force_direction)
 
+                if ctx.obj["LOG_FORMAT"] == "json":
+                    # One JSON line instead of the human-readable summary. It is
+                    # written directly, not logged, so --log-level cannot drop it
+                    click.echo(json.dumps({
+                        "event": "sync_summary",
+                        "success": summary.success,
+                        "no_changes": summary.no_changes,
+                        "conflicts": summary.conflicts,
+                        "conflict_paths": [pair.local_path for pair in summary.conflict_pairs],
+                        "errors": summary.errors,
+                    }))
+                    return
+
                 click.echo("\n✅ Sync complete:")
                 click.echo(f"   Success: {summary.success}")
                 click.echo(f"   No changes: {summary.no_changes}")
@@ -327,8 +348,12 @@ def sync(
                 if summary.conflicts > 0:
                     click.echo(f"   ⚠️  Conflicts: {summary.conflicts}")
                     click.echo("   Files with conflicts:")
-                    for pair in summary.conflict_pairs:
-                        click.echo(f"      - {pair.local_path}")
+                    if summary.conflict_pairs:
+                        click.echo(
+                            "\n".join(
+                                f"      - {pair.local_path}" for pair in summary.conflict_pairs
+                            )
+                        )
                     click.echo("   Use --force-push or --force-pull to resolve")
 
                 if summary.errors > 0:
@@ -398,6 +423,12 @@ def resolve(ctx: click.Context, path: str, base_dir: str) -> None:
         pair = SyncPair.from_dict(pair_data)
 
         # Initialize adapters and resolver
+        from portals.adapters.local import LocalFileAdapter
+        from portals.adapters.notion.adapter import NotionAdapter
+        from portals.core.conflict_resolver import ConflictResolver, ResolutionStrategy
+        from portals.core.diff_generator import DiffGenerator
+        from portals.core.sync_engine import SyncEngine
+
         local_adapter = LocalFileAdapter(base_path=str(base_path))
         notion_adapter = NotionAdapter(api_token=notion_token)
         sync_engine = SyncEngine(
@@ -4,13 +4,45 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from typing import Literal
 
 from portals.core.models import SyncStatus
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+SyncAction = Literal["push", "pull", "none"]
+
+# 3-way merge outcomes. The decision depends only on which hashes match, so
+# it is looked up rather than recomputed (or cached per hash triple).
+# Keyed by (local == base, remote == base) when at most one side changed.
+_Outcome = tuple[SyncStatus, str, SyncAction]
+_OUTCOMES: dict[tuple[bool, bool], _Outcome] = {
+    # Case 1: Nothing changed
+    (True, True): (SyncStatus.NO_CHANGES, "No changes on either side", "none"),
+    # Case 2: Only local changed (push to remote)
+    (False, True): (
+        SyncStatus.SUCCESS, "Local changed, remote unchanged - push required", "push"
+    ),
+    # Case 3: Only remote changed (pull from remote)
+    (True, False): (
+        SyncStatus.SUCCESS, "Remote changed, local unchanged - pull required", "pull"
+    ),
+}
+# Case 4: Both changed to the same content (no conflict, just update base)
+_IDENTICAL_CHANGES: _Outcome = (
+    SyncStatus.SUCCESS,
+    "Identical changes on both sides - update base hash only",
+    "none",
+)
+# Case 5: Both changed differently (conflict)
+_CONFLICT: _Outcome = (
+    SyncStatus.CONFLICT,
+    "Both local and remote changed differently - manual resolution required",
+    "none",
+)
+
+
+@dataclass(slots=True, frozen=True)
 class SyncDecision:
     """Decision about how to sync a document."""
 
@@ -19,16 +51,17 @@ class SyncDecision:
     local_hash: str
     remote_hash: str
     base_hash: str
+    direction: SyncAction = "none"  # Content to transfer; reason is for logging only
 
     @property
     def should_push(self) -> bool:
         """Check if local changes should be pushed to remote."""
-        return self.status == SyncStatus.SUCCESS and "push" in self.reason.lower()
+        return self.direction == "push"
 
     @property
     def should_pull(self) -> bool:
         """Check if remote changes should be pulled to local."""
-        return self.status == SyncStatus.SUCCESS and "pull" in self.reason.lower()
+        return self.direction == "pull"
 
     @property
     def has_conflict(self) -> bool:
@@ -61,57 +94,25 @@ class ConflictDetector:
             SyncDecision indicating what action to take
         """
         logger.debug(
-            f"Detecting conflict: local={local_hash[:8]}, "
-            f"remote={remote_hash[:8]}, base={base_hash[:8]}"
+            "Detecting conflict: local=%.8s, remote=%.8s, base=%.8s",
+            local_hash,
+            remote_hash,
+            base_hash,
         )
 
-        # Case 1: Nothing changed
-        if local_hash == base_hash and remote_hash == base_hash:
-            return SyncDecision(
-                status=SyncStatus.NO_CHANGES,
-                reason="No changes on either side",
-                local_hash=local_hash,
-                remote_hash=remote_hash,
-                base_hash=base_hash,
-            )
-
-        # Case 2: Only local changed (push to remote)
-        if local_hash != base_hash and remote_hash == base_hash:
-            return SyncDecision(
-                status=SyncStatus.SUCCESS,
-                reason="Local changed, remote unchanged - push required",
-                local_hash=local_hash,
-                remote_hash=remote_hash,
-                base_hash=base_hash,
-            )
-
-        # Case 3: Only remote changed (pull from remote)
-        if local_hash == base_hash and remote_hash != base_hash:
-            return SyncDecision(
-                status=SyncStatus.SUCCESS,
-                reason="Remote changed, local unchanged - pull required",
-                local_hash=local_hash,
-                remote_hash=remote_hash,
-                base_hash=base_hash,
-            )
-
-        # Case 4: Both changed to the same content (no conflict, just update base)
-        if local_hash == remote_hash:
-            return SyncDecision(
-                status=SyncStatus.SUCCESS,
-                reason="Identical changes on both sides - update base hash only",
-                local_hash=local_hash,
-                remote_hash=remote_hash,
-                base_hash=base_hash,
-            )
-
-        # Case 5: Both changed differently (conflict)
+        outcome = _OUTCOMES.get((local_hash == base_hash, remote_hash == base_hash))
+        if outcome is None:
+            # Both sides changed: identical content (Case 4) or a conflict (Case 5)
+            outcome = _IDENTICAL_CHANGES if local_hash == remote_hash else _CONFLICT
+        status, reason, direction = outcome
+
         return SyncDecision(
-            status=SyncStatus.CONFLICT,
-            reason="Both local and remote changed differently - manual resolution required",
+            status=status,
+            reason=reason,
             local_hash=local_hash,
             remote_hash=remote_hash,
             base_hash=base_hash,
+            direction=direction,
         )
 
     def detect_from_pair_state(
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import logging
+import os
+import shutil
 import subprocess
 import tempfile
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 from portals.adapters.local import LocalFileAdapter
 from portals.core.diff_generator import DiffGenerator
@@ -34,6 +36,9 @@ class ConflictResolver:
     Provides tools for users to resolve conflicts between local and remote versions.
     """
 
+    # First installed editor found on PATH, looked up once per process
+    _detected_editor: ClassVar[str | None] = None
+
     def __init__(
         self,
         sync_engine: SyncEngine,
@@ -146,24 +151,25 @@ class ConflictResolver:
             remote_label="REMOTE",
         )
 
-        # Write to temporary file
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            suffix=Path(file_path).suffix or ".md",
-            delete=False,
-            encoding="utf-8",
-        ) as tmp_file:
-            tmp_file.write(conflict_content)
-            tmp_path = tmp_file.name
+        # Write to temporary file (the file object retries short writes)
+        encoded = conflict_content.encode("utf-8")
+        fd, tmp_path = tempfile.mkstemp(suffix=Path(file_path).suffix or ".md")
+        with os.fdopen(fd, "wb") as f:
+            f.write(encoded)
+        before = os.stat(tmp_path).st_mtime_ns
 
         try:
             # Open editor (respect EDITOR environment variable)
             editor = self._get_editor()
             subprocess.run([editor, tmp_path], check=True)
 
+            # Editor quit without saving: treat as cancelled, skip reading back
+            after = os.stat(tmp_path)
+            if after.st_mtime_ns == before and after.st_size == len(encoded):
+                return None
+
             # Read merged content
-            with open(tmp_path, encoding="utf-8") as f:
-                merged_content = f.read()
+            merged_content = Path(tmp_path).read_text(encoding="utf-8")
 
             # Check if user actually resolved conflicts
             if "<<<<<<< LOCAL" in merged_content:
@@ -184,28 +190,19 @@ class ConflictResolver:
         Returns:
             Editor command
         """
-        import os
-
         # Try environment variables
         editor = os.environ.get("EDITOR") or os.environ.get("VISUAL")
 
         if editor:
             return editor
 
-        # Try common editors
-        for cmd in ["vim", "vi", "nano", "emacs"]:
-            try:
-                subprocess.run(
-                    ["which", cmd],
-                    check=True,
-                    capture_output=True,
-                )
-                return cmd
-            except subprocess.CalledProcessError:
-                continue
-
-        # Fallback
-        return "vi"
+        # Try common editors (fallback: vi)
+        if ConflictResolver._detected_editor is None:
+            ConflictResolver._detected_editor = next(
+                (cmd for cmd in ("vim", "vi", "nano", "emacs") if shutil.which(cmd)),
+                "vi",
+            )
+        return ConflictResolver._detected_editor
 
     def get_conflict_info(
         self,
@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import os
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
 
-@dataclass
+def _file_size(entry: os.DirEntry[str]) -> int:
+    """Return the size of the file an entry points to (following symlinks)."""
+    return entry.stat().st_size
+
+
+@dataclass(slots=True, frozen=True)
 class FileInfo:
     """Information about a scanned file."""
 
@@ -23,7 +31,7 @@ class DirectoryScanner:
     markdown files, while filtering out ignored paths.
     """
 
-    DEFAULT_IGNORE_DIRS = {
+    DEFAULT_IGNORE_DIRS = frozenset({
         ".portals",
         ".git",
         ".hg",
@@ -35,23 +43,26 @@ class DirectoryScanner:
         ".mypy_cache",
         ".pytest_cache",
         ".ruff_cache",
-    }
+    })
 
-    DEFAULT_IGNORE_FILES = {
+    DEFAULT_IGNORE_FILES = frozenset({
         ".DS_Store",
         "Thumbs.db",
         ".gitignore",
         ".gitattributes",
-    }
+    })
 
     MARKDOWN_EXTENSIONS = {".md", ".markdown", ".mdown", ".mkd", ".mdwn"}
 
+    STAT_WORKERS = 32  # Thread pool size when parallel_stat is enabled
+
     def __init__(
         self,
         base_path: str | Path,
         ignore_dirs: set[str] | None = None,
         ignore_files: set[str] | None = None,
         markdown_only: bool = True,
+        parallel_stat: bool = False,
     ) -> None:
         """Initialize directory scanner.
 
@@ -60,18 +71,24 @@ class DirectoryScanner:
             ignore_dirs: Set of directory names to ignore (adds to defaults)
             ignore_files: Set of file names to ignore (adds to defaults)
             markdown_only: If True, only return markdown files
+            parallel_stat: If True, read file sizes from a thread pool (faster
+                on network filesystems, where each stat is a round trip)
         """
         self.base_path = Path(base_path).resolve()
         self.markdown_only = markdown_only
+        self.parallel_stat = parallel_stat
 
-        # Combine default and custom ignore lists
-        self.ignore_dirs = self.DEFAULT_IGNORE_DIRS.copy()
+        # Combine default and custom ignore lists (defaults are shared, not copied)
+        self.ignore_dirs = self.DEFAULT_IGNORE_DIRS
         if ignore_dirs:
-            self.ignore_dirs.update(ignore_dirs)
+            self.ignore_dirs = self.ignore_dirs | frozenset(ignore_dirs)
 
-        self.ignore_files = self.DEFAULT_IGNORE_FILES.copy()
+        self.ignore_files = self.DEFAULT_IGNORE_FILES
         if ignore_files:
-            self.ignore_files.update(ignore_files)
+            self.ignore_files = self.ignore_files | frozenset(ignore_files)
+
+        # Lowercased once so scan() only lowercases each file's suffix
+        self._markdown_extensions = frozenset(ext.lower() for ext in self.MARKDOWN_EXTENSIONS)
 
     def scan(self, recursive: bool = True) -> list[FileInfo]:
         """Scan directory for files.
@@ -82,60 +99,88 @@ class DirectoryScanner:
         Returns:
             List of FileInfo objects for found files
         """
-        files: list[FileInfo] = []
+        found = list(self._iter_kept(recursive))
 
-        if not self.base_path.exists():
-            return files
+        if self.parallel_stat and len(found) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.STAT_WORKERS, len(found))) as pool:
+                sizes = list(pool.map(_file_size, (entry for entry, _, _ in found)))
+        else:
+            sizes = [_file_size(entry) for entry, _, _ in found]
+
+        files = [
+            FileInfo(
+                path=Path(entry.path),
+                relative_path=Path(prefix + entry.name),
+                is_markdown=is_markdown,
+                size=size,
+            )
+            for (entry, prefix, is_markdown), size in zip(found, sizes, strict=True)
+        ]
 
-        if not self.base_path.is_dir():
-            return files
+        return sorted(files, key=lambda f: f.relative_path)
 
-        # Use rglob for recursive, iterdir for non-recursive
-        if recursive:
-            iterator = self.base_path.rglob("*")
-        else:
-            iterator = self.base_path.iterdir()
+    def _iter_kept(self, recursive: bool) -> Iterator[tuple[os.DirEntry[str], str, bool]]:
+        """Yield the files scan() keeps, without reading their sizes.
 
-        for path in iterator:
-            # Skip if not a file
-            if not path.is_file():
-                continue
+        Args:
+            recursive: If True, descend into subdirectories
 
-            # Skip if in ignored directory
-            if self._is_in_ignored_dir(path):
-                continue
+        Yields:
+            (entry, relative directory prefix as from _walk, is_markdown) for
+            each file that is not ignored and passes the markdown filter
+        """
+        if not self.base_path.is_dir():
+            return
+
+        ignore_files = self.ignore_files
+        markdown_extensions = self._markdown_extensions
+        markdown_only = self.markdown_only
+
+        for entry, prefix in self._walk(recursive):
+            name = entry.name
 
             # Skip if ignored file
-            if path.name in self.ignore_files:
+            if name in ignore_files:
                 continue
 
-            # Check if markdown
-            is_markdown = path.suffix.lower() in self.MARKDOWN_EXTENSIONS
+            # Check if markdown (suffix as Path.suffix defines it)
+            dot = name.rfind(".")
+            is_markdown = dot > 0 and name[dot:].lower() in markdown_extensions
 
             # Skip if not markdown and markdown_only is True
-            if self.markdown_only and not is_markdown:
+            if markdown_only and not is_markdown:
                 continue
 
-            # Get relative path
-            try:
-                relative_path = path.relative_to(self.base_path)
-            except ValueError:
-                # Path is not relative to base_path (shouldn't happen)
-                continue
+            yield entry, prefix, is_markdown
 
-            # Get file size
-            size = path.stat().st_size
+    def _walk(self, recursive: bool) -> Iterator[tuple[os.DirEntry[str], str]]:
+        """Yield the files under base_path, skipping ignored directories.
 
-            files.append(
-                FileInfo(
-                    path=path,
-                    relative_path=relative_path,
-                    is_markdown=is_markdown,
-                    size=size,
-                )
-            )
+        Ignored directories are pruned without being entered. Symlinks to files
+        are included; symlinked directories are not followed.
 
-        return sorted(files, key=lambda f: f.relative_path)
+        Args:
+            recursive: If True, descend into subdirectories
+
+        Yields:
+            (entry, relative path of its directory with a trailing separator,
+            "" at base_path) for each file; callers join the two only for the
+            files they keep
+        """
+        ignore_dirs = self.ignore_dirs
+        pending = [(str(self.base_path), "")]
+        while pending:
+            directory, prefix = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive and entry.name not in ignore_dirs:
+                                pending.append((entry.path, f"{prefix}{entry.name}{os.sep}"))
+                        elif entry.is_file():
+                            yield entry, prefix
+            except PermissionError:
+                continue
 
     def scan_markdown(self) -> list[FileInfo]:
         """Scan directory for markdown files only.
@@ -157,7 +202,8 @@ class DirectoryScanner:
         Returns:
             Number of files found
         """
-        return len(self.scan(recursive=recursive))
+        # Same filtering as scan(), but no stat() calls or FileInfo objects
+        return sum(1 for _ in self._iter_kept(recursive))
 
     def get_file_tree(self) -> dict[str, list[FileInfo]]:
         """Get files organized by directory.
@@ -168,34 +214,6 @@ class DirectoryScanner:
         tree: dict[str, list[FileInfo]] = {}
 
         for file_info in self.scan():
-            dir_path = str(file_info.relative_path.parent)
-
-            if dir_path not in tree:
-                tree[dir_path] = []
-
-            tree[dir_path].append(file_info)
+            tree.setdefault(str(file_info.relative_path.parent), []).append(file_info)
 
         return tree
-
-    def _is_in_ignored_dir(self, path: Path) -> bool:
-        """Check if path is in an ignored directory.
-
-        Args:
-            path: Path to check
-
-        Returns:
-            True if path is in ignored directory
-        """
-        try:
-            relative = path.relative_to(self.base_path)
-
-            # Check each parent directory
-            for parent in relative.parents:
-                if parent.name in self.ignore_dirs:
-                    return True
-
-            return False
-
-        except ValueError:
-            # Path is not relative to base_path
-            return False
@@ -8,16 +8,24 @@ from __future__ import annotations
 
 import json
 import os
-from dataclasses import dataclass, asdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
 
 PlatformType = Literal["gdocs", "notion"]
 
 
-@dataclass
+@dataclass(slots=True)
 class Pairing:
     """Represents a pairing between a local file and remote document."""
 
@@ -31,7 +39,16 @@ class Pairing:
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        # Flat fields only, so a literal avoids asdict's recursive copy
+        return {
+            "local_path": self.local_path,
+            "platform": self.platform,
+            "remote_id": self.remote_id,
+            "account": self.account,
+            "last_sync": self.last_sync,
+            "local_hash": self.local_hash,
+            "remote_hash": self.remote_hash,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> Pairing:
@@ -39,6 +56,21 @@ class Pairing:
         return cls(**data)
 
 
+@lru_cache(maxsize=4096)
+def _resolve_absolute(path: str) -> str:
+    """Resolve symlinks in an absolute path (cached: each resolve stats every component)."""
+    return str(Path(path).resolve())
+
+
+def _resolve_path(local_path: str) -> str:
+    """Return the absolute, resolved path pairings are keyed by.
+
+    Relative paths are joined to the current directory before the cache lookup,
+    so a later chdir cannot return another directory's entry.
+    """
+    return _resolve_absolute(os.path.join(os.getcwd(), local_path))
+
+
 class PairingManager:
     """Manages pairings between local files and remote documents."""
 
@@ -50,6 +82,16 @@ class PairingManager:
         """
         self.config_dir = Path(config_dir or ".portals")
         self.pairings_file = self.config_dir / "pairings.json"
+        # Pairings from pairings.json, keyed by the file's (inode, mtime, size)
+        # so repeated operations skip the JSON parse until the file changes
+        self._cache: tuple[tuple[int, int, int], dict[str, Pairing]] | None = None
+        # Pairings being changed inside batch(), saved once when it exits
+        self._batch: dict[str, Pairing] | None = None
+        self._batch_dirty = False
+        self._batch_time: str | None = None  # last_sync stamp shared by the batch
+        # Local paths per platform for the store _load_pairings last returned,
+        # kept in step by add_pairing/remove_pairing (values are unused)
+        self._by_platform: dict[str, dict[str, None]] = {}
         self._ensure_config_dir()
 
     def _ensure_config_dir(self):
@@ -57,35 +99,117 @@ class PairingManager:
         self.config_dir.mkdir(parents=True, exist_ok=True)
 
     def _load_pairings(self) -> dict[str, Pairing]:
-        """Load all pairings from disk.
+        """Load all pairings, re-reading disk only when pairings.json has changed.
 
         Returns:
-            Dictionary mapping local paths to Pairing objects
+            Dictionary mapping local paths to Pairing objects. This is the
+            cached store itself: public methods hand out copies of its pairings.
         """
-        if not self.pairings_file.exists():
+        if self._batch is not None:
+            return self._batch
+
+        try:
+            stat = self.pairings_file.stat()
+        except FileNotFoundError:
+            self._cache = None
+            self._by_platform = {}
             return {}
 
-        with open(self.pairings_file, 'r') as f:
-            data = json.load(f)
-
-        return {
-            path: Pairing.from_dict(pairing_data)
-            for path, pairing_data in data.items()
-        }
-
-    def _save_pairings(self, pairings: dict[str, Pairing]):
+        key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if self._cache is None or self._cache[0] != key:
+            # One read of the whole file; both parsers accept UTF-8 bytes
+            raw = self.pairings_file.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            pairings: dict[str, Pairing] = {}
+            by_platform: dict[str, dict[str, None]] = {}
+            for path, fields in data.items():
+                # Fill the slots directly, skipping __init__'s keyword parsing
+                pairing = Pairing.__new__(Pairing)
+                pairing.local_path = fields["local_path"]
+                pairing.platform = fields["platform"]
+                pairing.remote_id = fields["remote_id"]
+                pairing.account = fields.get("account")
+                pairing.last_sync = fields.get("last_sync")
+                pairing.local_hash = fields.get("local_hash")
+                pairing.remote_hash = fields.get("remote_hash")
+                pairings[path] = pairing
+                by_platform.setdefault(pairing.platform, {})[path] = None
+            self._cache = (key, pairings)
+            self._by_platform = by_platform
+
+        return self._cache[1]
+
+    def _save_pairings(self, pairings: dict[str, Pairing], durable: bool = False):
         """Save pairings to disk.
 
         Args:
             pairings: Dictionary mapping local paths to Pairing objects
+            durable: If True, fsync the new file before it replaces the old one
         """
-        data = {
-            path: pairing.to_dict()
-            for path, pairing in pairings.items()
-        }
-
-        with open(self.pairings_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        if self._batch is not None:
+            # Inside batch(): written once when the batch exits
+            self._batch_dirty = True
+            return
+
+        # Serialize in memory, write once, then swap the file in atomically.
+        # The file is minified unless PORTALS_PRETTY_PAIRINGS=1 asks for indentation
+        pretty = os.environ.get("PORTALS_PRETTY_PAIRINGS") == "1"
+        if orjson is not None:
+            # orjson serializes the Pairing dataclasses directly
+            payload = orjson.dumps(pairings, option=orjson.OPT_INDENT_2 if pretty else None)
+        else:
+            data = {
+                path: pairing.to_dict()
+                for path, pairing in pairings.items()
+            }
+            if pretty:
+                payload = json.dumps(data, indent=2).encode()
+            else:
+                payload = json.dumps(data, separators=(",", ":")).encode()
+        temp_file = self.pairings_file.with_name(f"{self.pairings_file.name}.tmp")
+
+        try:
+            with open(temp_file, "wb") as f:
+                f.write(payload)
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            temp_file.replace(self.pairings_file)
+        except BaseException:
+            # Callers changed the cached store in place; reload it next time
+            self._cache = None
+            temp_file.unlink(missing_ok=True)
+            raise
+
+        stat = self.pairings_file.stat()
+        self._cache = ((stat.st_ino, stat.st_mtime_ns, stat.st_size), pairings)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer saving pairings until the block exits, then write them once.
+
+        Mutations made inside the block are saved even if it raises, as they
+        would have been one by one. Nested batches save with the outermost.
+        Sync states updated in the batch share one last_sync timestamp. The
+        batch's single save is fsynced; per-call saves rely on the atomic rename.
+
+        Yields:
+            None
+        """
+        if self._batch is not None:
+            yield
+            return
+
+        self._batch = self._load_pairings()
+        self._batch_dirty = False
+        self._batch_time = datetime.now().isoformat()
+        try:
+            yield
+        finally:
+            pairings, self._batch = self._batch, None
+            self._batch_time = None
+            if self._batch_dirty:
+                self._save_pairings(pairings, durable=True)
 
     def add_pairing(
         self,
@@ -106,7 +230,7 @@ class PairingManager:
             Created Pairing object
         """
         # Normalize local path to absolute
-        local_path = str(Path(local_path).resolve())
+        local_path = _resolve_path(local_path)
 
         # Create pairing
         pairing = Pairing(
@@ -121,10 +245,20 @@ class PairingManager:
 
         # Load, update, and save
         pairings = self._load_pairings()
+        previous = pairings.get(local_path)
         pairings[local_path] = pairing
+        if previous is None:
+            self._by_platform.setdefault(platform, {})[local_path] = None
+        else:
+            # A re-paired file keeps its place in pairings; rebuild the affected
+            # buckets so filtered listings keep the same relative order
+            for bucket in {previous.platform, platform}:
+                self._by_platform[bucket] = {
+                    path: None for path, p in pairings.items() if p.platform == bucket
+                }
         self._save_pairings(pairings)
 
-        return pairing
+        return replace(pairing)
 
     def get_pairing(self, local_path: str) -> Pairing | None:
         """Get pairing for a local file.
@@ -135,9 +269,9 @@ class PairingManager:
         Returns:
             Pairing object if exists, None otherwise
         """
-        local_path = str(Path(local_path).resolve())
-        pairings = self._load_pairings()
-        return pairings.get(local_path)
+        local_path = _resolve_path(local_path)
+        pairing = self._load_pairings().get(local_path)
+        return replace(pairing) if pairing else None
 
     def remove_pairing(self, local_path: str) -> bool:
         """Remove a pairing.
@@ -148,10 +282,11 @@ class PairingManager:
         Returns:
             True if pairing was removed, False if it didn't exist
         """
-        local_path = str(Path(local_path).resolve())
+        local_path = _resolve_path(local_path)
         pairings = self._load_pairings()
 
         if local_path in pairings:
+            self._by_platform[pairings[local_path].platform].pop(local_path, None)
             del pairings[local_path]
             self._save_pairings(pairings)
             return True
@@ -167,12 +302,27 @@ class PairingManager:
         Returns:
             List of Pairing objects
         """
-        pairings = self._load_pairings()
+        return list(self.iter_pairings(platform))
+
+    def iter_pairings(self, platform: PlatformType | None = None) -> Iterator[Pairing]:
+        """Iterate over pairings, copying each one only as it is reached.
 
-        if platform:
-            return [p for p in pairings.values() if p.platform == platform]
+        The manager may be changed while iterating; pairings added meanwhile
+        are not yielded.
+
+        Args:
+            platform: Optional platform filter
+
+        Yields:
+            Pairing objects
+        """
+        pairings = self._load_pairings()
+        paths = tuple(self._by_platform.get(platform, ()) if platform else pairings)
 
-        return list(pairings.values())
+        for path in paths:
+            pairing = pairings.get(path)
+            if pairing is not None:
+                yield replace(pairing)
 
     def update_sync_state(
         self,
@@ -187,14 +337,14 @@ class PairingManager:
             local_hash: Optional hash of local content
             remote_hash: Optional hash of remote content
         """
-        local_path = str(Path(local_path).resolve())
+        local_path = _resolve_path(local_path)
         pairings = self._load_pairings()
 
         if local_path not in pairings:
             raise ValueError(f"No pairing found for {local_path}")
 
         pairing = pairings[local_path]
-        pairing.last_sync = datetime.now().isoformat()
+        pairing.last_sync = self._batch_time or datetime.now().isoformat()
 
         if local_hash is not None:
             pairing.local_hash = local_hash
@@ -2,11 +2,60 @@
 
 from __future__ import annotations
 
+import json
 import logging
+import os
 import sys
+from functools import cache
 from typing import Any
 
-import structlog
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+
+def _orjson_dumps(obj: Any, default: Any = None, **_: Any) -> str:
+    """Serialize a log event with orjson, returning str as json.dumps does."""
+    return orjson.dumps(obj, default=default).decode()
+
+
+@cache
+def _processors(format: str, debug: bool) -> tuple[Any, ...]:
+    """Build a processor chain once; configure_logging picks one by format and level.
+
+    Portals logs str values without stack_info, so outside DEBUG the JSON chain
+    skips the stack renderer and the bytes-decoding walk over every event.
+    """
+    import structlog
+
+    if format == "json":
+        return (
+            structlog.stdlib.filter_by_level,
+            structlog.stdlib.add_log_level,
+            structlog.stdlib.add_logger_name,
+            structlog.processors.TimeStamper(fmt="iso"),
+            *((structlog.processors.StackInfoRenderer(),) if debug else ()),
+            structlog.processors.format_exc_info,
+            *((structlog.processors.UnicodeDecoder(),) if debug else ()),
+            structlog.processors.JSONRenderer(
+                serializer=_orjson_dumps if orjson is not None else json.dumps,
+            ),
+        )
+
+    # human-readable format
+    return (
+        structlog.stdlib.filter_by_level,
+        structlog.stdlib.add_log_level,
+        structlog.stdlib.add_logger_name,
+        structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M:%S"),
+        structlog.processors.StackInfoRenderer(),
+        structlog.processors.format_exc_info,
+        structlog.dev.ConsoleRenderer(
+            colors=True,
+            exception_formatter=structlog.dev.plain_traceback,
+        ),
+    )
 
 
 def configure_logging(level: str = "INFO", format: str = "human") -> None:
@@ -24,46 +73,100 @@ def configure_logging(level: str = "INFO", format: str = "human") -> None:
         level=log_level,
     )
 
-    # Configure processors based on format
-    if format == "json":
-        processors = [
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.add_logger_name,
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer(),
-        ]
-    else:  # human-readable format
-        processors = [
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.add_logger_name,
-            structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M:%S"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.dev.ConsoleRenderer(
-                colors=True,
-                exception_formatter=structlog.dev.plain_traceback,
-            ),
-        ]
+    import structlog
+
+    # Pick the processor chain for the format. Calls below log_level return
+    # before any processor runs (the filtering wrapper's methods are no-ops);
+    # filter_by_level also honors the level of the stdlib logger each event
+    # goes to
+    processors = list(_processors(
+        "json" if format == "json" else "human",
+        format == "json" and log_level <= logging.DEBUG,
+    ))
 
     structlog.configure(
         processors=processors,
-        wrapper_class=structlog.stdlib.BoundLogger,
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
 
+class _StdlibLogger:
+    """Logger with the structlog call interface that writes straight to stdlib logging.
+
+    Returned by get_logger when PORTALS_FAST_LOGS=1: events skip the structlog
+    processor chain and render as "event key=value ...", and nothing is
+    formatted for calls below the logger's level.
+    """
+
+    __slots__ = ("_logger",)
+
+    def __init__(self, name: str) -> None:
+        self._logger = logging.getLogger(name)
+
+    def _log(self, level: int, event: str, kw: dict[str, Any], exc_info: bool = False) -> None:
+        if not self._logger.isEnabledFor(level):
+            return
+        if kw:
+            fields = " ".join(f"{key}={value}" for key, value in kw.items())
+            self._logger.log(level, "%s %s", event, fields, exc_info=exc_info)
+        else:
+            self._logger.log(level, "%s", event, exc_info=exc_info)
+
+    def debug(self, event: str, **kw: Any) -> None:
+        self._log(logging.DEBUG, event, kw)
+
+    def info(self, event: str, **kw: Any) -> None:
+        self._log(logging.INFO, event, kw)
+
+    def warning(self, event: str, **kw: Any) -> None:
+        self._log(logging.WARNING, event, kw)
+
+    def error(self, event: str, **kw: Any) -> None:
+        self._log(logging.ERROR, event, kw)
+
+    def exception(self, event: str, **kw: Any) -> None:
+        self._log(logging.ERROR, event, kw, exc_info=True)
+
+    def critical(self, event: str, **kw: Any) -> None:
+        self._log(logging.CRITICAL, event, kw)
+
+
+class _LazyLogger:
+    """Stand-in for a structlog logger that imports structlog on first use.
+
+    Modules create their loggers at import time; this keeps structlog (and the
+    rich/colorama stack it loads) out of imports that never log.
+    """
+
+    __slots__ = ("_name", "_logger")
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._logger: Any = None
+
+    def __getattr__(self, attr: str) -> Any:
+        if self._logger is None:
+            import structlog
+
+            self._logger = structlog.get_logger(self._name)
+        return getattr(self._logger, attr)
+
+
 def get_logger(name: str) -> Any:
     """Get a structured logger.
 
+    Set PORTALS_FAST_LOGS=1 to get a plain stdlib-backed logger instead, for
+    bulk operations where structlog's per-event processing shows up.
+
     Args:
         name: Logger name (usually __name__)
 
     Returns:
         Structured logger instance
     """
-    return structlog.get_logger(name)
+    if os.environ.get("PORTALS_FAST_LOGS") == "1":
+        return _StdlibLogger(name)
+    return _LazyLogger(name)
@@ -99,10 +99,28 @@ import argparse
 import json
 import sys
 from pathlib import Path
+from typing import Any
 
 sys.path.insert(0, str(Path(__file__).parent))
 from google_client import get_docs_service, get_drive_service, get_impersonate_user, _resolve_project, PROJECT_CONFIG
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def _emit(result: dict[str, Any]) -> None:
+    """Print a JSON result to stdout, encoded with orjson when it is installed."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if orjson is None or buffer is None:
+        print(json.dumps(result, indent=2))
+        return
+    sys.stdout.flush()  # keep ordering with earlier print() output
+    option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    buffer.write(orjson.dumps(result, option=option) + b"\n")
+    buffer.flush()
+
 
 # =============================================================================
 # Element extraction helpers (for comprehensive document parsing)
@@ -439,14 +457,14 @@ def create_document(title: str, content: str = None, folder_id: str = None, proj
         # Get the document URL
         doc_url = f"https://docs.google.com/document/d/{doc_id}/edit"
 
-        print(json.dumps({
+        _emit({
             "success": True,
             "document_id": doc_id,
             "title": title,
             "url": doc_url,
             "project": resolved_project,
             "account": PROJECT_CONFIG[resolved_project]["impersonate_user"]
-        }, indent=2))
+        })
 
     except Exception as e:
         print(json.dumps({"error": str(e)}), file=sys.stderr)
@@ -529,7 +547,7 @@ def create_from_markdown(title: str, markdown_file: str, folder_id: str = None,
 
         doc_url = f"https://docs.google.com/document/d/{doc_id}/edit"
 
-        print(json.dumps({
+        _emit({
             "success": True,
             "document_id": doc_id,
             "title": title,
@@ -538,7 +556,7 @@ def create_from_markdown(title: str, markdown_file: str, folder_id: str = None,
             "project": resolved_project,
             "account": PROJECT_CONFIG[resolved_project]["impersonate_user"],
             "note": "Using portals converter" if formatted else "Plain text (converter not found)"
-        }, indent=2))
+        })
 
     except Exception as e:
         print(json.dumps({"error": str(e)}), file=sys.stderr)
@@ -577,13 +595,13 @@ def read_document(doc_id: str, project: str = None, tab_id: str = None):
         for element in body:
             content.append(extract_structural_element(element, inline_objects))
 
-        print(json.dumps({
+        _emit({
             "document_id": doc_id,
             "title": doc.get("title"),
             "content": "".join(content),
             "url": f"https://docs.google.com/document/d/{doc_id}/edit",
             "project": resolved_project
-        }, indent=2))
+        })
 
     except Exception as e:
         print(json.dumps({"error": str(e)}), file=sys.stderr)
@@ -656,14 +674,14 @@ def get_structure(doc_id: str, project: str = None):
             elif "tableOfContents" in element:
                 elements.append({"index": i, "type": "tableOfContents"})
 
-        print(json.dumps({
+        _emit({
             "document_id": doc_id,
             "title": doc.get("title"),
             "element_count": len(elements),
             "inline_object_count": len(inline_objects),
             "elements": elements,
             "project": resolved_project
-        }, indent=2))
+        })
 
     except Exception as e:
         print(json.dumps({"error": str(e)}), file=sys.stderr)
@@ -727,13 +745,13 @@ def append_text(doc_id: str, text: str, project: str = None, tab: str = None):
             body={"requests": requests}
         ).execute()
 
-        print(json.dumps({
+        _emit({
             "success": True,
             "document_id": doc_id,
             "appended_length": len(text),
             "tab": tab,
             "project": resolved_project
-        }, indent=2))
+        })
 
     except Exception as e:
         print(json.dumps({"error": str(e)}), file=sys.stderr)
@@ -746,19 +764,19 @@ def batch_update(doc_id: str, requests_json: str, project: str = None):
     docs_service = get_docs_service(project=resolved_project)
 
     try:
-        requests = json.loads(requests_json)
+        requests = orjson.loads(requests_json) if orjson is not None else json.loads(requests_json)
 
         result = docs_service.documents().batchUpdate(
             documentId=doc_id,
             body={"requests": requests}
         ).execute()
 
-        print(json.dumps({
+        _emit({
             "success": True,
             "document_id": doc_id,
             "replies": result.get("replies", []),
             "project": resolved_project
-        }, indent=2))
+        })
 
     except json.JSONDecodeError as e:
         print(json.dumps({"error": f"Invalid JSON: {str(e)}"}), file=sys.stderr)
@@ -869,14 +887,14 @@ def inspect_document(doc_id: str, project: str = None, tab: str = None):
 
         heading_map = _build_heading_map(body, inline_objects)
 
-        print(json.dumps({
+        _emit({
             "document_id": doc_id,
             "title": doc.get("title"),
             "tab": tab,
             "elements": elements,
             "headingMap": heading_map,
             "project": resolved_project,
-        }, indent=2))
+        })
 
     except Exception as e:
         print(json.dumps({"error": str(e)}), file=sys.stderr)
@@ -942,14 +960,14 @@ def find_text(doc_id: str, search_text: str, project: str = None, tab: str = Non
             })
             pos += 1
 
-        print(json.dumps({
+        _emit({
             "document_id": doc_id,
             "search": search_text,
             "tab": tab,
             "matchCount": len(matches),
             "matches": matches,
             "project": resolved_project,
-        }, indent=2))
+        })
 
     except Exception as e:
         print(json.dumps({"error": str(e)}), file=sys.stderr)
@@ -985,14 +1003,14 @@ def find_heading(doc_id: str, search_text: str, project: str = None, tab: str =
                     "sectionEnd": info.get("sectionEnd"),
                 })
 
-        print(json.dumps({
+        _emit({
             "document_id": doc_id,
             "search": search_text,
             "tab": tab,
             "matchCount": len(matches),
             "matches": matches,
             "project": resolved_project,
-        }, indent=2))
+        })
 
     except Exception as e:
         print(json.dumps({"error": str(e)}), file=sys.stderr)
@@ -1071,14 +1089,14 @@ def check_comments(doc_id: str, project: str = None, active_only: bool = False):
         active = [c for c in results if not c.get("resolved")]
         resolved = [c for c in results if c.get("resolved")]
 
-        print(json.dumps({
+        _emit({
             "document_id": doc_id,
             "totalComments": len(results),
             "activeComments": len(active),
             "resolvedComments": len(resolved),
             "comments": results,
             "project": resolved_project,
-        }, indent=2))
+        })
 
     except Exception as e:
         print(json.dumps({"error": str(e)}), file=sys.stderr)
@@ -1101,7 +1119,7 @@ def reply_to_comment(doc_id: str, comment_id: str, message: str, project: str =
             body={"content": message},
         ).execute()
 
-        print(json.dumps({
+        _emit({
             "status": "replied",
             "document_id": doc_id,
             "comment_id": comment_id,
@@ -1110,7 +1128,7 @@ def reply_to_comment(doc_id: str, comment_id: str, message: str, project: str =
             "author": reply.get("author", {}).get("displayName", ""),
             "createdTime": reply.get("createdTime", ""),
             "project": resolved_project,
-        }, indent=2))
+        })
 
     except Exception as e:
         print(json.dumps({"error": str(e), "comment_id": comment_id}), file=sys.stderr)
@@ -1137,12 +1155,12 @@ def resolve_comment(doc_id: str, comment_ids: list, message: str, project: str =
                 if not c.get("resolved", False)
             ]
             if not comment_ids:
-                print(json.dumps({
+                _emit({
                     "status": "no_active_comments",
                     "document_id": doc_id,
                     "message": "No unresolved comments found.",
                     "project": resolved_project,
-                }, indent=2))
+                })
                 return
 
         successes = []
@@ -1166,7 +1184,7 @@ def resolve_comment(doc_id: str, comment_ids: list, message: str, project: str =
                     "error": str(e),
                 })
 
-        print(json.dumps({
+        _emit({
             "status": "resolved",
             "document_id": doc_id,
             "resolved_count": len(successes),
@@ -1175,7 +1193,7 @@ def resolve_comment(doc_id: str, comment_ids: list, message: str, project: str =
             "errors": errors,
             "message": message,
             "project": resolved_project,
-        }, indent=2))
+        })
 
         if errors:
             sys.exit(1)
@@ -1418,7 +1436,7 @@ def patch_document(doc_id: str, ops_file: str, project: str = None, tab: str = N
             ).execute()
             total_requests_sent += len(format_requests)
 
-        print(json.dumps({
+        _emit({
             "success": True,
             "document_id": doc_id,
             "operations_applied": len(ops),
@@ -1426,7 +1444,7 @@ def patch_document(doc_id: str, ops_file: str, project: str = None, tab: str = N
             "tab": tab,
             "heading_mapping": "title-promoted" if promote_title else "literal",
             "project": resolved_project,
-        }, indent=2))
+        })
 
     except Exception as e:
         print(json.dumps({"error": str(e)}), file=sys.stderr)
@@ -1748,7 +1766,7 @@ def insert_table(doc_id: str, after_heading: str, table_file: str, heading_text:
                                 pass  # buffer cleanup is best-effort
                     break
 
-        print(json.dumps({
+        _emit({
             "success": True,
             "document_id": doc_id,
             "table_inserted": True,
@@ -1756,7 +1774,7 @@ def insert_table(doc_id: str, after_heading: str, table_file: str, heading_text:
             "cols": num_cols,
             "url": f"https://docs.google.com/document/d/{doc_id}/edit",
             "project": resolved_project,
-        }, indent=2))
+        })
 
     except Exception as e:
         print(json.dumps({"error": str(e)}), file=sys.stderr)
@@ -1869,7 +1887,7 @@ def insert_section(doc_id: str, after_heading: str, md_file: str, project: str =
             body={"requests": all_reqs},
         ).execute()
 
-        print(json.dumps({
+        _emit({
             "success": True,
             "document_id": doc_id,
             "section_inserted": True,
@@ -1877,7 +1895,7 @@ def insert_section(doc_id: str, after_heading: str, md_file: str, project: str =
             "heading_mapping": "title-promoted" if promote_title else "literal",
             "url": f"https://docs.google.com/document/d/{doc_id}/edit",
             "project": resolved_project,
-        }, indent=2))
+        })
 
     except Exception as e:
         print(json.dumps({"error": str(e)}), file=sys.stderr)
@@ -1911,13 +1929,13 @@ def list_tabs(doc_id: str, project: str = None):
                 tab_info["iconEmoji"] = props["tabIconEmoji"]
             tabs.append(tab_info)
 
-        print(json.dumps({
+        _emit({
             "document_id": doc_id,
             "title": doc.get("title"),
             "tab_count": len(tabs),
             "tabs": tabs,
             "project": resolved_project
-        }, indent=2))
+        })
 
     except Exception as e:
         print(json.dumps({"error": str(e)}), file=sys.stderr)
@@ -1957,14 +1975,14 @@ def create_tab(doc_id: str, title: str, project: str = None):
         if new_tab_id:
             doc_url += f"#tab={new_tab_id}"
 
-        print(json.dumps({
+        _emit({
             "success": True,
             "document_id": doc_id,
             "tab_id": new_tab_id,
             "title": title,
             "url": doc_url,
             "project": resolved_project
-        }, indent=2))
+        })
 
     except Exception as e:
         print(json.dumps({"error": str(e)}), file=sys.stderr)
@@ -1982,12 +2000,12 @@ def delete_tab(doc_id: str, tab_id: str, project: str = None):
             body={"requests": [{"deleteTab": {"tabId": tab_id}}]}
         ).execute()
 
-        print(json.dumps({
+        _emit({
             "success": True,
             "document_id": doc_id,
             "deleted_tab_id": tab_id,
             "project": resolved_project
-        }, indent=2))
+        })
 
     except Exception as e:
         print(json.dumps({"error": str(e)}), file=sys.stderr)
@@ -2058,13 +2076,13 @@ def reorder_tabs(doc_id: str, tab_order: str, project: str = None):
         ]
         final_ids = [t["tabId"] for t in sorted(final, key=lambda x: x["index"] or 0)]
 
-        print(json.dumps({
+        _emit({
             "success": final_ids == desired,
             "document_id": doc_id,
             "requested_order": desired,
             "resulting_order": final,
             "project": resolved_project,
-        }, indent=2))
+        })
         if final_ids != desired:
             sys.exit(1)
 
@@ -2081,13 +2099,13 @@ def trash_document(file_id: str, project: str = None):
     try:
         meta = drive_service.files().get(fileId=file_id, fields="name").execute()
         drive_service.files().update(fileId=file_id, body={"trashed": True}).execute()
-        print(json.dumps({
+        _emit({
             "success": True,
             "file_id": file_id,
             "title": meta.get("name"),
             "trashed": True,
             "project": resolved_project,
-        }, indent=2))
+        })
     except Exception as e:
         print(json.dumps({"error": str(e), "file_id": file_id}), file=sys.stderr)
         sys.exit(1)
@@ -2224,7 +2242,7 @@ def append_markdown_to_tab(doc_id: str, markdown_file: str, project: str = None,
             body={"requests": all_reqs},
         ).execute()
 
-        print(json.dumps({
+        _emit({
             "success": True,
             "document_id": doc_id,
             "appended_markdown": True,
@@ -2232,7 +2250,7 @@ def append_markdown_to_tab(doc_id: str, markdown_file: str, project: str = None,
             "tab": tab,
             "url": f"https://docs.google.com/document/d/{doc_id}/edit",
             "project": resolved_project,
-        }, indent=2))
+        })
 
     except Exception as e:
         print(json.dumps({"error": str(e)}), file=sys.stderr)
@@ -2409,7 +2427,7 @@ def update_from_markdown(doc_id: str, markdown_file: str, project: str = None, t
         }
         if tab_id:
             result["tab_id"] = tab_id
-        print(json.dumps(result, indent=2))
+        _emit(result)
 
     except Exception as e:
         print(json.dumps({"error": str(e)}), file=sys.stderr)
@@ -2437,14 +2455,14 @@ def export_pdf_doc(doc_id: str, output_path: str = None, project: str = None):
 
         path.write_bytes(content)
 
-        print(json.dumps({
+        _emit({
             "success": True,
             "document_id": doc_id,
             "path": str(path),
             "size_bytes": len(content),
             "url": f"https://docs.google.com/document/d/{doc_id}/edit",
             "project": resolved_project,
-        }, indent=2))
+        })
 
     except Exception as e:
         print(json.dumps({"error": str(e)}), file=sys.stderr)
@@ -2473,7 +2491,7 @@ def share_file(file_id: str, email: str, role: str = "reader", project: str = No
             fields="id,emailAddress,role",
         ).execute()
 
-        print(json.dumps({
+        _emit({
             "success": True,
             "file_id": file_id,
             "shared_with": permission.get("emailAddress", email),
@@ -2481,7 +2499,7 @@ def share_file(file_id: str, email: str, role: str = "reader", project: str = No
             "permission_id": permission.get("id"),
             "shared_by": owner,
             "project": resolved_project,
-        }, indent=2))
+        })
 
     except Exception as e:
         print(json.dumps({"error": str(e), "file_id": file_id, "email": email}), file=sys.stderr)
@@ -2500,12 +2518,12 @@ def list_permissions(file_id: str, project: str = None):
         ).execute()
 
         perms = result.get("permissions", [])
-        print(json.dumps({
+        _emit({
             "file_id": file_id,
             "permission_count": len(perms),
             "permissions": perms,
             "project": resolved_project,
-        }, indent=2))
+        })
 
     except Exception as e:
         print(json.dumps({"error": str(e), "file_id": file_id}), file=sys.stderr)
@@ -2523,12 +2541,12 @@ def remove_permission(file_id: str, permission_id: str, project: str = None):
             permissionId=permission_id,
         ).execute()
 
-        print(json.dumps({
+        _emit({
             "success": True,
             "file_id": file_id,
             "removed_permission_id": permission_id,
             "project": resolved_project,
-        }, indent=2))
+        })
 
     except Exception as e:
         print(json.dumps({"error": str(e), "file_id": file_id}), file=sys.stderr)
@@ -2551,13 +2569,13 @@ def transfer_ownership(file_id: str, email: str, project: str = None):
             fields="id,emailAddress,role",
         ).execute()
 
-        print(json.dumps({
+        _emit({
             "success": True,
             "file_id": file_id,
             "new_owner": permission.get("emailAddress", email),
             "permission_id": permission.get("id"),
             "project": resolved_project,
-        }, indent=2))
+        })
 
     except Exception as e:
         print(json.dumps({"error": str(e), "file_id": file_id, "email": email}), file=sys.stderr)
@@ -0,0 +1,62 @@
+"""Tests for the Portals CLI."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from click.testing import CliRunner
+
+from portals.cli.main import cli
+from portals.services.sync_service import SyncSummary
+
+
+@pytest.fixture(autouse=True)
+def restore_event_loop_policy() -> Iterator[None]:
+    """Undo the uvloop policy the CLI installs, so other tests keep the default."""
+    yield
+    asyncio.set_event_loop_policy(None)
+
+
+class TestSyncCommand:
+    """Tests for the sync command."""
+
+    def test_json_summary_survives_warning_log_level(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that JSON mode prints the sync summary even when INFO logs are off."""
+        summary = SyncSummary()
+        summary.success = 2
+        summary.conflicts = 1
+        summary.conflict_pairs = [SimpleNamespace(local_path="docs/a.md")]  # type: ignore[list-item]
+
+        class FakeSyncService:
+            def __init__(self, **_: Any) -> None:
+                pass
+
+            async def sync_all(self, force_direction: str | None = None) -> SyncSummary:
+                return summary
+
+        monkeypatch.setenv("NOTION_API_TOKEN", "secret")
+        monkeypatch.setattr("portals.services.sync_service.SyncService", FakeSyncService)
+
+        result = CliRunner().invoke(
+            cli,
+            ["--log-level", "WARNING", "--log-format", "json", "sync", "--base-dir", str(tmp_path)],
+        )
+
+        assert result.exit_code == 0, result.output
+        lines = [line for line in result.output.splitlines() if line.startswith("{")]
+        assert json.loads(lines[-1]) == {
+            "event": "sync_summary",
+            "success": 2,
+            "no_changes": 0,
+            "conflicts": 1,
+            "conflict_paths": ["docs/a.md"],
+            "errors": 0,
+        }
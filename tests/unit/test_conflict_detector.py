@@ -0,0 +1,40 @@
+"""Tests for ConflictDetector."""
+
+from __future__ import annotations
+
+from portals.core.conflict_detector import ConflictDetector
+from portals.core.models import SyncStatus
+
+
+class TestConflictDetector:
+    """Tests for ConflictDetector."""
+
+    def test_unchanged_needs_no_sync(self) -> None:
+        """Test that matching hashes on both sides report no changes."""
+        decision = ConflictDetector().detect("aaa", "aaa", "aaa")
+
+        assert decision.status == SyncStatus.NO_CHANGES
+        assert not (decision.should_push or decision.should_pull or decision.has_conflict)
+
+    def test_one_sided_changes_pick_direction(self) -> None:
+        """Test that a change on one side only is pushed or pulled."""
+        detector = ConflictDetector()
+
+        local_changed = detector.detect("new", "old", "old")
+        remote_changed = detector.detect("old", "new", "old")
+
+        assert (local_changed.should_push, local_changed.should_pull) == (True, False)
+        assert (remote_changed.should_push, remote_changed.should_pull) == (False, True)
+        assert local_changed.status == remote_changed.status == SyncStatus.SUCCESS
+
+    def test_both_sides_changed(self) -> None:
+        """Test that identical edits only update the base and different edits conflict."""
+        detector = ConflictDetector()
+
+        identical = detector.detect("new", "new", "old")
+        conflict = detector.detect("mine", "theirs", "old")
+
+        assert identical.status == SyncStatus.SUCCESS
+        assert not (identical.should_push or identical.should_pull)
+        assert conflict.has_conflict
+        assert not (conflict.should_push or conflict.should_pull)
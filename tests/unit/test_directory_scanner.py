@@ -300,3 +300,11 @@ class TestDirectoryScanner:
         # File in nested .git should not be found
         paths = {f.relative_path for f in files}
         assert Path(".git/subdir/file.md") not in paths
+
+    def test_parallel_stat_matches_serial_scan(self, sample_dir: Path) -> None:
+        """Test that reading sizes from a thread pool gives the same results."""
+        serial = DirectoryScanner(sample_dir, markdown_only=False).scan()
+        parallel = DirectoryScanner(sample_dir, markdown_only=False, parallel_stat=True).scan()
+
+        assert parallel == serial
+        assert all(f.size == f.path.stat().st_size for f in parallel)
@@ -0,0 +1,322 @@
+"""Tests for GoogleDocsConverter."""
+
+from __future__ import annotations
+
+import copy
+from typing import Any
+
+import pytest
+
+from portals.adapters.gdocs.converter import GoogleDocsConverter, IncrementalConverter
+from portals.adapters.gdocs.md4c_parser import md4c_available
+
+
+def _requests_of(requests: list[dict[str, Any]], kind: str) -> list[dict[str, Any]]:
+    """Return the payloads of all requests of a given kind."""
+    return [r[kind] for r in requests if kind in r]
+
+
+class TestGoogleDocsConverter:
+    """Tests for GoogleDocsConverter."""
+
+    def test_nested_list_tabs_removed_from_later_indices(self) -> None:
+        """Test that ranges after a nested list are shifted by the removed tabs."""
+        converter = GoogleDocsConverter()
+        markdown = "- one\n  - two\n    - three\n\nAfter **bold**."
+
+        result = converter.markdown_to_gdocs(markdown)
+        requests = converter.generate_batch_requests(result)
+
+        assert result.plain_text.count("\t") == 3
+        bold = [r for r in _requests_of(requests, "updateTextStyle") if r["fields"] == "bold"]
+        assert len(bold) == 1
+        bold_start = result.plain_text.index("bold") + 1  # Docs indices start at 1
+        assert bold[0]["range"]["startIndex"] == bold_start - 3
+        assert bold[0]["range"]["endIndex"] == bold_start - 3 + len("bold")
+
+    def test_separate_lists_shift_by_previous_group_tabs(self) -> None:
+        """Test that each bullet group is offset by tabs in earlier groups only."""
+        converter = GoogleDocsConverter()
+        markdown = "- a\n  - b\n\nMiddle.\n\n1. c\n   1. d"
+
+        result = converter.markdown_to_gdocs(markdown)
+        bullets = _requests_of(converter.generate_batch_requests(result), "createParagraphBullets")
+
+        assert len(bullets) == 2
+        second_start = result.plain_text.index("c") + 1
+        assert bullets[1]["range"]["startIndex"] == second_start - 1
+        assert bullets[1]["bulletPreset"] == "NUMBERED_DECIMAL_ALPHA_ROMAN"
+
+    def test_table_index_excludes_preceding_list_tabs(self) -> None:
+        """Test that a table after a nested list is inserted before the removed tabs."""
+        converter = GoogleDocsConverter()
+        markdown = "- a\n  - b\n    - c\n\n| x |\n|---|\n| y |\n"
+
+        result = converter.markdown_to_gdocs(markdown)
+        inserts = _requests_of(converter.generate_batch_requests(result), "insertTable")
+
+        assert result.plain_text.count("\t") == 3
+        assert inserts[0]["location"]["index"] == result.tables[0].insert_index - 3
+
+    def test_supplementary_chars_shift_utf16_indices(self) -> None:
+        """Test that each emoji before a range adds one UTF-16 code unit."""
+        converter = GoogleDocsConverter()
+        markdown = "📊 intro 🚀🚀 then **bold**"
+
+        result = converter.markdown_to_gdocs(markdown)
+        requests = converter.generate_batch_requests(result)
+
+        bold = [r for r in _requests_of(requests, "updateTextStyle") if r["fields"] == "bold"]
+        bold_start = result.plain_text.index("bold") + 1
+        assert bold[0]["range"] == {"startIndex": bold_start + 3, "endIndex": bold_start + 3 + 4}
+
+    def test_nested_lists_restore_parent_list_state(self) -> None:
+        """Test that items after a nested list keep the parent's level and ordering."""
+        converter = GoogleDocsConverter()
+        markdown = "1. one\n   - two\n     1. three\n   - four\n2. five"
+
+        result = converter.markdown_to_gdocs(markdown)
+
+        assert result.plain_text == "one\n\ttwo\n\t\tthree\n\tfour\nfive\n"
+        assert [(r["nesting_level"], r["ordered"]) for r in result.list_ranges] == [
+            (0, True), (1, False), (2, True), (1, False), (0, True),
+        ]
+
+    def test_list_groups_built_during_conversion(self) -> None:
+        """Test that adjacent lists merge only when nested or of the same type."""
+        converter = GoogleDocsConverter()
+        markdown = "1. a\n   - b\n2. c\n\n- d\n\nBreak.\n\n- e"
+
+        result = converter.markdown_to_gdocs(markdown)
+
+        assert [(g.ordered, g.start_index, g.end_index) for g in result.list_groups] == [
+            (True, 1, 8), (False, 8, 10), (False, 17, 19),
+        ]
+
+    def test_nested_same_type_span_covers_outer_text(self) -> None:
+        """Test that a span ends at its own close token, not a nested span's."""
+        converter = GoogleDocsConverter()
+
+        result = converter.markdown_to_gdocs("x *a _b_ c* y")
+
+        italic = [f for f in result.format_ranges if f.format_type == "italic"]
+        assert result.plain_text == "x a b c y\n"
+        assert [(f.start_index, f.end_index, f.text) for f in italic] == [(3, 8, "a b c")]
+
+    def test_frontmatter_stripped(self) -> None:
+        """Test that leading YAML frontmatter (LF or CRLF) is not rendered."""
+        converter = GoogleDocsConverter()
+
+        for markdown in ("---\ntitle: x\n---\nBody.", "---\r\ntitle: x\r\n---\r\nBody."):
+            assert converter.markdown_to_gdocs(markdown).plain_text == "Body.\n"
+
+    def test_task_list_checkboxes_stripped(self) -> None:
+        """Test that GFM task-list markers are removed from list items."""
+        converter = GoogleDocsConverter()
+        markdown = "- [ ] open\n- [x] done\n- [X] also done\n- keep [brackets]"
+
+        result = converter.markdown_to_gdocs(markdown)
+
+        assert result.plain_text == "open\ndone\nalso done\nkeep [brackets]\n"
+
+    def test_repeated_conversion_reuses_cached_result(self) -> None:
+        """Test that converting the same markdown again returns an equal, independent result."""
+        converter = GoogleDocsConverter()
+        markdown = "# Title\n\n## Legend\n\n#### Key\nMeaning.\n\nSome **bold** text."
+
+        first = converter.markdown_to_gdocs(markdown)
+        first_requests = converter.generate_batch_requests(first)
+        converter.markdown_to_gdocs("# Another document")
+        first.format_ranges.clear()
+
+        second = converter.markdown_to_gdocs(markdown)
+
+        assert second.format_ranges
+        assert converter.generate_batch_requests(second) == first_requests
+
+    def test_cached_result_tables_are_independent(self) -> None:
+        """Test that mutating a returned table does not leak into later cache hits."""
+        converter = GoogleDocsConverter()
+        markdown = "| A | B |\n|---|---|\n| **x** | y |\n"
+
+        first = converter.markdown_to_gdocs(markdown)
+        first.tables[0].rows[1][0].format_ranges.clear()
+        first.tables[0].rows[0].pop()
+
+        second = converter.markdown_to_gdocs(markdown)
+
+        assert len(second.tables[0].rows[0]) == 2
+        assert [f.format_type for f in second.tables[0].rows[1][0].format_ranges] == ["bold"]
+
+    def test_contiguous_ranges_share_requests(self) -> None:
+        """Test that back-to-back ranges of one type are styled by a single request."""
+        converter = GoogleDocsConverter()
+        markdown = "# A\n\n# B\n\nOne.\n\nTwo.\n\n**Three.**"
+
+        result = converter.markdown_to_gdocs(markdown)
+        requests = converter.generate_batch_requests(result)
+
+        paragraph_styles = _requests_of(requests, "updateParagraphStyle")
+        spacing = [r for r in paragraph_styles if r["fields"] == "spaceAbove"]
+        headings = [r for r in paragraph_styles if r["fields"].startswith("namedStyleType")]
+        start = result.plain_text.index("One") + 1
+        assert [r["range"] for r in spacing] == [
+            {"startIndex": start, "endIndex": len(result.plain_text) + 1},
+        ]
+        assert len(headings) == 2
+        assert [f.format_type for f in result.format_ranges].count("paragraph") == 3
+
+    def test_iter_batch_requests_matches_generate(self) -> None:
+        """Test that streaming requests yields the same requests in the same order."""
+        converter = GoogleDocsConverter()
+        markdown = "# Title\n\n> quote\n\n```\ncode\n```\n\n| a | b |\n|---|---|\n| ** ** | x |\n"
+        result = converter.markdown_to_gdocs(markdown)
+
+        streamed = converter.iter_batch_requests(result)
+
+        assert not isinstance(streamed, list)
+        assert list(streamed) == converter.generate_batch_requests(result)
+
+    def test_convert_batch_matches_sequential_conversion(self) -> None:
+        """Test that batch conversion returns per-document results in input order."""
+        markdowns = [
+            "# One\n\n## Legend\n\n#### Key\nMeaning.",
+            "- a\n  - b\n\nText with *emphasis*.",
+            "# One\n\n## Legend\n\n#### Key\nMeaning.",
+        ]
+        converter = GoogleDocsConverter()
+
+        results = converter.convert_batch(markdowns, max_workers=2)
+
+        assert len(results) == 3
+        assert results[0] is not results[2]
+        for markdown, result in zip(markdowns, results, strict=True):
+            reference = GoogleDocsConverter()
+            expected = reference.markdown_to_gdocs(markdown)
+            assert result.plain_text == expected.plain_text
+            assert converter.generate_batch_requests(result) == (
+                reference.generate_batch_requests(expected)
+            )
+
+    def test_mutating_requests_does_not_affect_later_conversions(self) -> None:
+        """Test that style payloads aren't shared between generate_batch_requests calls."""
+        markdown = "Intro **bold** *it*.\n\n```\ncode\n```\n\n> quote\n\n*Footnote.*\n"
+        converter = GoogleDocsConverter()
+        expected = copy.deepcopy(
+            converter.generate_batch_requests(converter.markdown_to_gdocs(markdown))
+        )
+
+        for request in converter.generate_batch_requests(converter.markdown_to_gdocs(markdown)):
+            for payload in request.values():
+                for key in ("textStyle", "paragraphStyle"):
+                    if key in payload:
+                        payload[key].clear()
+
+        fresh = GoogleDocsConverter()
+        assert fresh.generate_batch_requests(fresh.markdown_to_gdocs(markdown)) == expected
+
+    def test_mutating_table_requests_does_not_affect_later_conversions(self) -> None:
+        """Test that table cell and text styles aren't shared between calls."""
+        markdown = (
+            "> [!NOTE]\n> Remember this.\n\n| A | B |\n|---|---|\n| **x** | *y* |\n\n"
+            "## Legend\n\n#### Key\nMeaning **b**.\n"
+        )
+        converter = GoogleDocsConverter()
+        expected = copy.deepcopy(
+            converter.generate_batch_requests(converter.markdown_to_gdocs(markdown))
+        )
+
+        for request in converter.generate_batch_requests(converter.markdown_to_gdocs(markdown)):
+            for payload in request.values():
+                for key in ("textStyle", "paragraphStyle", "tableCellStyle"):
+                    if key in payload:
+                        payload[key].clear()
+
+        fresh = GoogleDocsConverter()
+        assert fresh.generate_batch_requests(fresh.markdown_to_gdocs(markdown)) == expected
+
+    def test_unknown_parser_rejected(self) -> None:
+        """Test that an unknown parse backend raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown parser"):
+            GoogleDocsConverter(parser="commonmark")
+
+    @pytest.mark.skipif(not md4c_available(), reason="pymd4c not installed")
+    def test_md4c_parser_matches_markdown_it(self) -> None:
+        """Test that the md4c backend produces the same requests as markdown-it."""
+        markdown = (
+            "# Title\n\n## Subtitle\n\n### Phase A: Prep (`ops`)\n\n"
+            "**Lines**: 12 &amp; *more*\nsee [docs](https://example.com)\n\n"
+            "- one\n  - two `code`\n- [x] done\n\n1. first\n\n   loose\n\n"
+            "> [!NOTE]\n> Remember this.\n\n```python\nx = 1\n```\n\n"
+            "| A | B |\n|---|---|\n| **x** |  |\n\n---\n\n*Footnote.*\n"
+        )
+        reference = GoogleDocsConverter()
+        converter = GoogleDocsConverter(parser="md4c")
+
+        expected = reference.markdown_to_gdocs(markdown)
+        result = converter.markdown_to_gdocs(markdown)
+
+        assert result.plain_text == expected.plain_text
+        assert converter.generate_batch_requests(result) == (
+            reference.generate_batch_requests(expected)
+        )
+
+
+class TestIncrementalConverter:
+    """Tests for IncrementalConverter."""
+
+    def test_growing_document_matches_full_conversion(self) -> None:
+        """Test that each update renders exactly like a fresh full conversion."""
+        markdown = (
+            "# Title\n\n## Subtitle\n\nIntro with **bold**.\n\n"
+            "```\n\n# not a heading\n```\n\n"
+            "## Section\n\n- a\n  - b\n\n### Phase A: Data work\n\n*Closing note.*\n"
+        )
+        incremental = IncrementalConverter()
+
+        for end in range(1, len(markdown) + 1, 7):
+            text = markdown[:end]
+            converter = GoogleDocsConverter()
+            expected = converter.markdown_to_gdocs(text)
+
+            result = incremental.update(text)
+
+            assert result.plain_text == expected.plain_text
+            assert incremental.converter.generate_batch_requests(result) == (
+                converter.generate_batch_requests(expected)
+            )
+
+    @pytest.mark.parametrize(
+        "edited",
+        [
+            "see [x]\n\n# H\n\n> [x]: http://a\n",
+            "see [x]\n\n# H\n\n- [x]: http://a\n",
+            "a\n\n<![CDATA[\n\n# H\n\n]]>\n",
+            "a\n\n<?php\n\n# H\n\n?>\n",
+            "a\n\n<!DOCTYPE\n\n# H\n\n>\n",
+        ],
+    )
+    def test_non_local_constructs_match_full_conversion(self, edited: str) -> None:
+        """Test that edits adding cross-block constructs aren't split into blocks."""
+        incremental = IncrementalConverter()
+        incremental.update("see [x]\n\n# H\n\nbody\n")
+        converter = GoogleDocsConverter()
+        expected = converter.markdown_to_gdocs(edited)
+
+        result = incremental.update(edited)
+
+        assert result.plain_text == expected.plain_text
+        assert incremental.converter.generate_batch_requests(result) == (
+            converter.generate_batch_requests(expected)
+        )
+
+    def test_unchanged_blocks_are_not_reparsed(self) -> None:
+        """Test that only blocks after the first change are parsed again."""
+        incremental = IncrementalConverter()
+        incremental.update("# One\n\nFirst.\n\n# Two\n\nSecond.")
+        first_block_tokens = incremental._blocks[0][1]
+
+        incremental.update("# One\n\nFirst.\n\n# Two\n\nSecond, extended.")
+
+        assert len(incremental._blocks) == 2
+        assert incremental._blocks[0][1] is first_block_tokens
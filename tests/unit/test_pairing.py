@@ -0,0 +1,131 @@
+"""Tests for PairingManager."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from portals.core.pairing import PairingManager
+
+
+@pytest.fixture
+def manager(tmp_path: Path) -> PairingManager:
+    """Create PairingManager with temporary config directory."""
+    return PairingManager(config_dir=str(tmp_path / ".portals"))
+
+
+class TestPairingManager:
+    """Tests for PairingManager."""
+
+    def test_sync_state_round_trip(self, manager: PairingManager, tmp_path: Path) -> None:
+        """Test that saved pairings and sync state are read back."""
+        local = str(tmp_path / "memo.md")
+        manager.add_pairing(local, "gdocs", "doc-1", account="me@example.com")
+
+        manager.update_sync_state(local, local_hash="abc", remote_hash="abc")
+
+        pairing = PairingManager(config_dir=str(manager.config_dir)).get_pairing(local)
+        assert pairing is not None
+        assert (pairing.remote_id, pairing.local_hash) == ("doc-1", "abc")
+        assert pairing.last_sync is not None
+
+    def test_external_changes_are_reloaded(self, manager: PairingManager, tmp_path: Path) -> None:
+        """Test that the cached store is dropped when pairings.json changes on disk."""
+        local = str(tmp_path / "memo.md")
+        manager.add_pairing(local, "gdocs", "doc-1")
+        assert manager.get_pairing(local) is not None
+
+        data = json.loads(manager.pairings_file.read_text())
+        data[str(Path(local).resolve())]["remote_id"] = "doc-2-edited"
+        manager.pairings_file.write_text(json.dumps(data))
+
+        pairing = manager.get_pairing(local)
+        assert pairing is not None
+        assert pairing.remote_id == "doc-2-edited"
+
+    def test_returned_pairings_do_not_alter_cache(self, manager: PairingManager, tmp_path: Path) -> None:
+        """Test that mutating a returned pairing does not leak into later reads."""
+        local = str(tmp_path / "memo.md")
+        manager.add_pairing(local, "gdocs", "doc-1")
+
+        first = manager.get_pairing(local)
+        assert first is not None
+        first.remote_id = "mutated"
+
+        second = manager.get_pairing(local)
+        assert second is not None
+        assert second.remote_id == "doc-1"
+
+    def test_relative_paths_follow_current_directory(
+        self, manager: PairingManager, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that cached path resolution still follows a change of directory."""
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        manager.add_pairing(str(tmp_path / "a" / "memo.md"), "gdocs", "doc-a")
+
+        monkeypatch.chdir(tmp_path / "a")
+        assert manager.get_pairing("memo.md") is not None
+
+        monkeypatch.chdir(tmp_path / "b")
+        assert manager.get_pairing("memo.md") is None
+
+    def test_batch_saves_once_on_exit(self, manager: PairingManager, tmp_path: Path) -> None:
+        """Test that mutations inside batch() are visible at once but written on exit."""
+        first, second = str(tmp_path / "one.md"), str(tmp_path / "two.md")
+
+        with manager.batch():
+            manager.add_pairing(first, "gdocs", "doc-1")
+            manager.add_pairing(second, "notion", "page-2")
+            manager.update_sync_state(first, local_hash="abc")
+            assert manager.get_pairing(first) is not None
+            assert not manager.pairings_file.exists()
+
+        reloaded = PairingManager(config_dir=str(manager.config_dir))
+        assert len(reloaded.list_pairings()) == 2
+        pairing = reloaded.get_pairing(first)
+        assert pairing is not None
+        assert pairing.local_hash == "abc"
+
+    def test_list_by_platform_tracks_changes(self, manager: PairingManager, tmp_path: Path) -> None:
+        """Test that platform filtering follows adds, re-pairings, and removals."""
+        memo, notes = str(tmp_path / "memo.md"), str(tmp_path / "notes.md")
+        manager.add_pairing(memo, "gdocs", "doc-1")
+        manager.add_pairing(notes, "gdocs", "doc-2")
+
+        manager.add_pairing(memo, "notion", "page-1")
+        manager.remove_pairing(notes)
+
+        assert manager.list_pairings(platform="gdocs") == []
+        assert [p.remote_id for p in manager.list_pairings(platform="notion")] == ["page-1"]
+        reloaded = PairingManager(config_dir=str(manager.config_dir))
+        assert [p.remote_id for p in reloaded.list_pairings(platform="notion")] == ["page-1"]
+
+    def test_iter_pairings_allows_removal_while_iterating(
+        self, manager: PairingManager, tmp_path: Path
+    ) -> None:
+        """Test that pairings can be removed during iteration without skipping others."""
+        for name in ("a.md", "b.md", "c.md"):
+            manager.add_pairing(str(tmp_path / name), "gdocs", f"doc-{name}")
+
+        seen = []
+        for pairing in manager.iter_pairings(platform="gdocs"):
+            seen.append(pairing.remote_id)
+            manager.remove_pairing(pairing.local_path)
+
+        assert seen == ["doc-a.md", "doc-b.md", "doc-c.md"]
+        assert manager.list_pairings() == []
+
+    def test_repairing_keeps_listing_order(self, manager: PairingManager, tmp_path: Path) -> None:
+        """Test that re-pairing a file leaves filtered and unfiltered listings in one order."""
+        paths = [str(tmp_path / name) for name in ("a.md", "b.md", "c.md")]
+        for path in paths:
+            manager.add_pairing(path, "gdocs", f"doc-{Path(path).stem}")
+
+        manager.add_pairing(paths[0], "gdocs", "doc-a-new")
+
+        unfiltered = [p.remote_id for p in manager.list_pairings()]
+        assert unfiltered == ["doc-a-new", "doc-b", "doc-c"]
+        assert [p.remote_id for p in manager.list_pairings(platform="gdocs")] == unfiltered